@@ -0,0 +1,10 @@
+"""
+Performance benchmarks for GraphicDocs. These are not part of the unit test run.
+
+Run an individual benchmark from the project root, for example:
+
+python -m benchmarks.bench_docstring_passes
+
+`bench_docstring_parsers` times every docstring parser on the realistic and pathological docstrings in
+`docstring_corpus`, and writes its results as JSON (to `bench_results.json` by default) so runs can be compared.
+"""
@@ -0,0 +1,159 @@
+"""
+Times `parse_docstring` and every `get_*` tag function on each docstring in `benchmarks.docstring_corpus`, reporting
+operations per second and per call latency percentiles. The results are written as JSON so runs can be compared over
+time, either by hand or with `--compare`.
+
+python -m benchmarks.bench_docstring_parsers
+python -m benchmarks.bench_docstring_parsers --output after.json --compare before.json
+
+Without `--output`, the JSON results get printed instead of written to a file.
+"""
+import argparse
+import datetime
+import gc
+import json
+import math
+import platform
+import subprocess
+import time
+
+import src.parse_docstring_functions as parse_docstring_functions
+from src.parser import clear_docstring_cache, configure_docstring_cache, parse_docstring
+from benchmarks.bench_docstring_passes import per_tag_passes
+from benchmarks.docstring_corpus import build_corpus
+
+# parse_docstring only works out a tag when it is read, so read all of them to time the whole parse
+TARGETS = {
+    "parse_docstring": lambda docstring: dict(parse_docstring(docstring)),
+    "get_description": parse_docstring_functions.get_description,
+    "get_authors": parse_docstring_functions.get_authors,
+    "get_copyright": parse_docstring_functions.get_copyright,
+    "get_deprecated": parse_docstring_functions.get_deprecated,
+    "get_examples": parse_docstring_functions.get_examples,
+    "get_global": parse_docstring_functions.get_global,
+    "get_ignore": parse_docstring_functions.get_ignore,
+    "get_license": parse_docstring_functions.get_license,
+    "get_memberof": parse_docstring_functions.get_memberof,
+    "get_namespaces": parse_docstring_functions.get_namespaces,
+    "get_parameters": parse_docstring_functions.get_parameters,
+    "get_private": parse_docstring_functions.get_private,
+    "get_returns": parse_docstring_functions.get_returns,
+    "get_since": parse_docstring_functions.get_since,
+    "get_throws": parse_docstring_functions.get_throws,
+    "get_todo": parse_docstring_functions.get_todo,
+    "get_version": parse_docstring_functions.get_version,
+}
+
+def percentile(ordered: list[int], percent: float) -> int:
+    """The nearest rank percentile of an already sorted list."""
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+def measure(function, docstring: str, min_time: float, min_calls: int, max_calls: int) -> dict:
+    """
+        Calls `function(docstring)` one call at a time until it has run for at least `min_time` seconds and
+        `min_calls` calls (but no more than `max_calls` calls), timing every call on its own.
+
+        @returns The number of calls, operations per second, and latency statistics in microseconds
+    """
+    function(docstring)  # Warm up
+    gc.collect()
+
+    latencies = []
+    total = 0
+    deadline = min_time * 1e9
+    while len(latencies) < max_calls and (total < deadline or len(latencies) < min_calls):
+        start = time.perf_counter_ns()
+        function(docstring)
+        elapsed = time.perf_counter_ns() - start
+        latencies.append(elapsed)
+        total += elapsed
+
+    latencies.sort()
+    return {
+        "calls": len(latencies),
+        "ops_per_sec": len(latencies) / (total / 1e9) if total else math.inf,
+        "mean_us": total / len(latencies) / 1e3,
+        "min_us": latencies[0] / 1e3,
+        "p50_us": percentile(latencies, 50) / 1e3,
+        "p90_us": percentile(latencies, 90) / 1e3,
+        "p99_us": percentile(latencies, 99) / 1e3,
+        "max_us": latencies[-1] / 1e3,
+    }
+
+def git_commit() -> str | None:
+    """The commit being benchmarked, if this is running from a git checkout."""
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+def compare(results: list[dict], previous_path: str) -> None:
+    """Prints how the operations per second of this run changed against an earlier JSON results file."""
+    with open(previous_path) as file:
+        previous = {(result["target"], result["corpus"]): result for result in json.load(file)["results"]}
+
+    print(f"\nCompared against {previous_path} (above 1.00x is faster):")
+    for result in results:
+        before = previous.get((result["target"], result["corpus"]))
+        if before is not None:
+            change = result["ops_per_sec"] / before["ops_per_sec"]
+            print(f"    {result['target']:17}{result['corpus']:22}{change:8.2f}x")
+
+def main() -> None:
+    arguments = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arguments.add_argument("--output", help="Where to write the JSON results, instead of printing them")
+    arguments.add_argument("--compare", help="An earlier JSON results file to compare against")
+    arguments.add_argument("--lines", type=int, default=2000, help="About how many lines each pathological docstring has")
+    arguments.add_argument("--min-time", type=float, default=0.1, help="Seconds to spend timing each docstring")
+    arguments.add_argument("--min-calls", type=int, default=5)
+    arguments.add_argument("--max-calls", type=int, default=20000)
+    arguments.add_argument("--target", action="append", choices=TARGETS, help="Only time these functions")
+    options = arguments.parse_args()
+
+    corpus = build_corpus(options.lines)
+    configure_docstring_cache(False)
+
+    # Make sure every docstring parses, and that the single pass parser agrees with the tag functions on all of them
+    for _, name, docstring in corpus:
+        assert parse_docstring(docstring) == per_tag_passes(docstring), name
+
+    results = []
+    for target in options.target or TARGETS:
+        for kind, name, docstring in corpus:
+            result = {"target": target, "corpus": name, "kind": kind, "lines": docstring.count("\n") + 1}
+            result.update(measure(TARGETS[target], docstring, options.min_time, options.min_calls, options.max_calls))
+            results.append(result)
+            print(f"{target:17}{name:22}{result['ops_per_sec']:12.1f} ops/s   p50 {result['p50_us']:10.1f} us   "
+                  f"p90 {result['p90_us']:10.1f} us   p99 {result['p99_us']:10.1f} us")
+
+    configure_docstring_cache(True)
+    clear_docstring_cache()
+
+    report = {
+        "benchmark": "docstring_parsers",
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "settings": {
+            "lines": options.lines,
+            "min_time": options.min_time,
+            "min_calls": options.min_calls,
+            "max_calls": options.max_calls,
+        },
+        "results": results,
+    }
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(report, file, indent=4)
+        print(f"\nWrote {len(results)} results to {options.output}")
+    else:
+        print("\n" + json.dumps(report, indent=4))
+
+    if options.compare:
+        compare(results, options.compare)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compares the single pass `parse_docstring` against running every `get_*` tag function on its own, which is how
+`parse_docstring` used to work (one full scan of the docstring per tag).
+
+python -m benchmarks.bench_docstring_passes
+"""
+import inspect
+import timeit
+
+import src
+import src.parse_docstring_functions as parse_docstring_functions
+from src.parser import clear_docstring_cache, configure_docstring_cache, parse_docstring
+
+def per_tag_passes(docstring: str) -> dict:
+    """Builds the parsed docstring dict by scanning the docstring once for every tag."""
+    return {
+        "description": parse_docstring_functions.get_description(docstring),
+        "author": parse_docstring_functions.get_authors(docstring),
+        "copyright": parse_docstring_functions.get_copyright(docstring),
+        "deprecated": parse_docstring_functions.get_deprecated(docstring),
+        "examples": parse_docstring_functions.get_examples(docstring),
+        "global": parse_docstring_functions.get_global(docstring),
+        "ignore": parse_docstring_functions.get_ignore(docstring),
+        "license": parse_docstring_functions.get_license(docstring),
+        "memberof": parse_docstring_functions.get_memberof(docstring),
+        "namespaces": parse_docstring_functions.get_namespaces(docstring),
+        "parameters": parse_docstring_functions.get_parameters(docstring),
+        "private": parse_docstring_functions.get_private(docstring),
+        "returns": parse_docstring_functions.get_returns(docstring),
+        "since": parse_docstring_functions.get_since(docstring),
+        "throws": parse_docstring_functions.get_throws(docstring),
+        "todo": parse_docstring_functions.get_todo(docstring),
+        "version": parse_docstring_functions.get_version(docstring)
+    }
+
+def source_docstrings() -> list[str]:
+    """Every docstring found in the GraphicDocs source, as a realistic corpus."""
+    docstrings = []
+    for _, module in inspect.getmembers(src, inspect.ismodule):
+        for _, member in inspect.getmembers(module):
+            # Skips members like descriptor types, whose `__doc__` is a descriptor rather than a string
+            if (inspect.isfunction(member) or inspect.isclass(member)) and isinstance(member.__doc__, str):
+                docstrings.append(member.__doc__)
+    return docstrings
+
+def main(repeat: int = 5, number: int = 20) -> None:
+    corpus = source_docstrings()
+    for docstring in corpus:
+        assert parse_docstring(docstring) == per_tag_passes(docstring)
+
+    def run_single_pass():
+        for docstring in corpus:
+            parse_docstring(docstring).items()  # Works out every tag, the same as the per tag passes do
+
+    def run_per_tag_passes():
+        for docstring in corpus:
+            per_tag_passes(docstring)
+
+    # Otherwise every run after the first would only time cache hits
+    configure_docstring_cache(False)
+    try:
+        single = min(timeit.repeat(run_single_pass, repeat=repeat, number=number)) / (number * len(corpus))
+        multiple = min(timeit.repeat(run_per_tag_passes, repeat=repeat, number=number)) / (number * len(corpus))
+    finally:
+        configure_docstring_cache(True)
+        clear_docstring_cache()
+
+    print(f"Docstrings in corpus:   {len(corpus)}")
+    print(f"17 pass (per tag):      {multiple * 1e6:8.2f} us/docstring")
+    print(f"Single pass:            {single * 1e6:8.2f} us/docstring")
+    print(f"Speedup:                {multiple / single:8.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares working out the line numbers of every class, method, and function in a generated module of about 10,000 lines
+by calling `inspect.findsource` and `inspect.getsource` on each one (which is what the parser used to do) against
+looking them up in one source index shared by the whole module.
+
+python -m benchmarks.bench_line_numbers
+"""
+import importlib.util
+import inspect
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+from src.parser import _line_numbers, parse_module
+
+def make_module_source(lines: int = 10000) -> str:
+    """Source code for a module of about `lines` lines, made of functions and of classes with a few methods each."""
+    source = []
+    total = 0
+    i = 0
+    while total < lines:
+        source.append(
+            f"def function_{i}(key, value=None):\n"
+            f"    \"\"\"Does thing number {i}.\"\"\"\n"
+            f"    if key:\n        return value\n    return None\n"
+        )
+        source.append(f"class Class_{i}():\n    \"\"\"A class numbered {i}.\"\"\"\n")
+        for j in range(4):
+            source.append(f"    def method_{j}(self, key):\n        \"\"\"Method {j}.\"\"\"\n        return key\n")
+        total = sum(part.count("\n") + 1 for part in source)
+        i += 1
+    return "\n".join(source)
+
+def members(module) -> list:
+    """Every class, method, and function defined in the module."""
+    found = []
+    for value in vars(module).values():
+        if inspect.isfunction(value):
+            found.append(value)
+        elif inspect.isclass(value):
+            found.append(value)
+            found.extend(member for member in vars(value).values() if inspect.isfunction(member))
+    return found
+
+def inspect_line_numbers(object_ref) -> tuple[int, int]:
+    linestart = inspect.findsource(object_ref)[1] + 1
+    return (linestart, linestart + inspect.getsource(object_ref).count("\n") - 1)
+
+def main(repeat: int = 3, number: int = 1) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench_generated_module.py")
+        source = make_module_source()
+        with open(path, "w") as file:
+            file.write(source)
+
+        spec = importlib.util.spec_from_file_location("bench_generated_module", path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module     # Classes find their source file through their module
+        spec.loader.exec_module(module)
+
+        objects = members(module)
+        print(f"Module:                 {source.count(chr(10)) + 1} lines, {len(objects)} classes and functions")
+
+        def run_index() -> list[tuple[int, int]]:
+            sources = {}
+            return [_line_numbers(object_ref, sources) for object_ref in objects]
+
+        # The inspect way takes long enough on a file this size that it only gets timed once
+        start = time.perf_counter()
+        expected = [inspect_line_numbers(object_ref) for object_ref in objects]
+        inspect_time = time.perf_counter() - start
+        assert run_index() == expected
+
+        index_time = min(timeit.repeat(run_index, repeat=repeat, number=number)) / number
+        print("Line numbers only:")
+        print(f"    inspect per object: {inspect_time * 1e3:9.2f} ms")
+        print(f"    Shared index:       {index_time * 1e3:9.2f} ms")
+        print(f"    Speedup:            {inspect_time / index_time:9.2f}x")
+
+        module_time = min(timeit.repeat(lambda: parse_module(module), repeat=repeat, number=number)) / number
+        print(f"Whole parse_module:     {module_time * 1e3:9.2f} ms")
+
+        del sys.modules[spec.name]
+
+if __name__ == "__main__":
+    main()
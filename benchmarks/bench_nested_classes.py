@@ -0,0 +1,80 @@
+"""
+Times parsing a deeply aliased class graph, where every class holds references to the classes before it (the way shared
+`Meta` inner classes and alias attributes build up), with each class parsed once and shared against parsing every class
+again everywhere it shows up (which is what `parse_class` used to do).
+
+python -m benchmarks.bench_nested_classes
+"""
+import gc
+import time
+import tracemalloc
+
+from src.parser import clear_docstring_cache, parse_class
+
+class NoMemo(dict):
+    """Stands in for the classes parsed so far, but never remembers any. Only safe on class graphs without cycles."""
+    def get(self, key, default = None):
+        return default
+
+    def __setitem__(self, key, value) -> None:
+        pass
+
+def make_classes(depth: int, aliases: int = 2) -> list[type]:
+    """Makes `depth` classes, each holding a method and references to the `aliases` classes before it."""
+    def method(self, key, value=None):
+        """Does something."""
+        return value
+
+    classes = []
+    for i in range(depth):
+        members = {"__doc__": f"Class number {i}.", "method": method}
+        for j in range(1, aliases + 1):
+            if i - j >= 0:
+                members[f"Alias{j}"] = classes[i - j]
+        classes.append(type(f"Class{i}", (), members))
+    return classes
+
+def count_classes(parsed_class: dict, seen: set | None = None) -> tuple[int, int]:
+    """How many classes there are in a parse result, and how many of them are different objects."""
+    seen = set() if seen is None else seen
+    total = 1
+    seen.add(id(parsed_class))
+    for subclass in (parsed_class["subclasses"] or {}).values():
+        total += count_classes(subclass, seen)[0]
+    return total, len(seen)
+
+def measure(class_ref, parsed_classes: dict) -> tuple[float, int, dict]:
+    """Parses a class, returning the seconds it took, the peak bytes allocated, and the result."""
+    clear_docstring_cache()
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = parse_class(class_ref, parsed_classes=parsed_classes)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+def main(depths: tuple[int] = (10, 14, 18, 22)) -> None:
+    print(f"{'Depth':>6}{'Classes in result':>19}{'Parsed':>9}{'Memo time':>14}{'Memo peak':>12}"
+          f"{'No memo time':>15}{'No memo peak':>15}{'Speedup':>10}")
+    for depth in depths:
+        class_ref = make_classes(depth)[-1]
+
+        memo_time, memo_peak, memo_result = measure(class_ref, {})
+        total, distinct = count_classes(memo_result)
+
+        plain_time, plain_peak, plain_result = measure(class_ref, NoMemo())
+        assert plain_result == memo_result
+
+        print(f"{depth:6}{total:19}{distinct:9}{memo_time * 1e3:11.2f} ms{memo_peak / 1024:9.0f} KB"
+              f"{plain_time * 1e3:12.2f} ms{plain_peak / 1024:12.0f} KB{plain_time / memo_time:9.1f}x")
+
+    # With cycles, the classes parsed so far are what stops the recursion
+    classes = make_classes(500)
+    classes[0].Last = classes[-1]
+    memo_time, memo_peak, memo_result = measure(classes[-1], {})
+    print(f"\n500 classes in one cycle: {memo_time * 1e3:.2f} ms, {memo_peak / 1024:.0f} KB peak")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Times parsing a generated package of 1,000 source files one after another in this process against spreading them across
+more and more worker processes with the `jobs` setting, up to one per CPU.
+
+python -m benchmarks.bench_parallel_parsing
+"""
+import os
+import sys
+import tempfile
+import time
+
+from src.core import Core
+
+def write_corpus(directory: str, count: int = 1000) -> list[str]:
+    """Writes a package of `count` modules that each hold a few documented classes and functions."""
+    package = os.path.join(directory, "bench_corpus")
+    os.mkdir(package)
+    paths = [os.path.join(package, "__init__.py")]
+    with open(paths[0], "w") as init_file:
+        init_file.write('"""A generated package."""\n')
+
+    for i in range(count):
+        source = [f'"""Module number {i}."""\nfrom collections import OrderedDict\n']
+        for j in range(4):
+            source.append(
+                f"class Class{j}():\n"
+                f'    """A class numbered {j}.\n\n    @since 1.{j}\n    """\n'
+                f"    def __init__(self, name: str, size: int = {j}, items: OrderedDict | None = None):\n"
+                f"        pass\n\n"
+                f"    def method(self, key: str, value: list[int] | None = None) -> dict[str, int]:\n"
+                f'        """Does thing {j}.\n\n        @param key The key\n        @returns A mapping\n        """\n'
+                f"        return {{}}\n\n"
+                f"def function_{j}(key, value=None) -> str:\n"
+                f'    """Does function thing {j}.\n\n    @param key The key\n    @param value The value\n    """\n'
+                f"    return key\n"
+            )
+        path = os.path.join(package, f"module_{i}.py")
+        with open(path, "w") as module_file:
+            module_file.write("\n".join(source))
+        paths.append(path)
+    return paths
+
+def measure(paths: list[str], jobs: int) -> tuple[float, list]:
+    """Parses the paths with `jobs` workers, returning the seconds it took and the results."""
+    core = Core({"verbose": False, "source": [], "jobs": jobs, "normalize_values": True})
+    start = time.perf_counter()
+    parsed_results = core.parse_source_targets(paths)
+    elapsed = time.perf_counter() - start
+
+    # One at a time imports into this process, so drop the corpus to start the next run the same way
+    for name in [name for name in sys.modules if name.split(".")[0] == "bench_corpus"]:
+        del sys.modules[name]
+    return elapsed, parsed_results
+
+def main(count: int = 1000) -> None:
+    cpus = os.cpu_count() or 1
+    job_counts = sorted({1, *[jobs for jobs in (2, 4, 8, 16, 32) if jobs <= cpus], cpus})
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_corpus(directory, count)
+        print(f"Corpus:  {len(paths)} source files, {cpus} CPUs")
+        print(f"{'Jobs':>6}{'Time':>12}{'Speedup':>10}{'Efficiency':>12}")
+
+        serial_time, expected = measure(paths, 1)
+        for jobs in job_counts:
+            elapsed, parsed_results = (serial_time, expected) if jobs == 1 else measure(paths, jobs)
+            assert parsed_results == expected
+            speedup = serial_time / elapsed
+            print(f"{jobs:6}{elapsed:10.2f} s{speedup:9.2f}x{speedup / jobs:11.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Compares parsing a module's docstrings one call at a time against parsing them as one batch, on a generated module
+with thousands of functions and classes that reuse a small set of docstrings (as generated and overloaded code does).
+
+python -m benchmarks.bench_parse_docstrings_batch
+"""
+import timeit
+import types
+
+from src.parser import _collect_docstrings, clear_docstring_cache, configure_docstring_cache
+from src.parser import parse_docstring, parse_docstrings
+
+DOCSTRINGS = (
+    """
+        Gets a value.
+
+        @param key The key to look up
+        @returns The value, or `None`
+    """,
+    """
+        Sets a value.
+
+        @param key The key to set
+        @param value The new value
+        @throws [KeyError] If the key is read only
+    """,
+    """
+        A record with a few fields.
+
+        @since 1.2.0
+        @author Someone [someone@example.com]
+    """,
+    None
+)
+
+def make_module(members: int = 2000) -> types.ModuleType:
+    """Builds a module with `members` functions and `members // 10` classes, each class holding ten methods."""
+    module = types.ModuleType("bench_generated_module")
+    source = []
+    for i in range(members):
+        docstring = DOCSTRINGS[i % len(DOCSTRINGS)]
+        source.append(f"def function_{i}(key, value=None):\n    {docstring!r}\n")
+    for i in range(members // 10):
+        source.append(f"class Class_{i}():\n    {DOCSTRINGS[2]!r}\n")
+        for j in range(10):
+            source.append(f"    def method_{j}(self, key):\n        {DOCSTRINGS[j % len(DOCSTRINGS)]!r}\n")
+    exec(compile("\n".join(source), "<bench_generated_module>", "exec"), module.__dict__)
+    return module
+
+def main(repeat: int = 5, number: int = 3) -> None:
+    module = make_module()
+    functions = [value for value in module.__dict__.values() if isinstance(value, types.FunctionType)]
+    classes = [value for value in module.__dict__.values() if isinstance(value, type)]
+    docstrings = [function_ref.__doc__ for function_ref in functions]
+    for class_ref in classes:
+        docstrings.append(class_ref.__doc__)
+        docstrings.extend(member.__doc__ for member in vars(class_ref).values() if isinstance(member, types.FunctionType))
+
+    assert parse_docstrings(docstrings) == [parse_docstring(docstring) for docstring in docstrings]
+    assert set(_collect_docstrings(classes, functions)) == {docstring for docstring in docstrings if docstring}
+
+    print(f"Docstrings in module:   {len(docstrings)} ({len(set(docstrings))} unique)")
+    for enabled in (False, True):
+        configure_docstring_cache(enabled)
+
+        def run_per_call():
+            clear_docstring_cache()
+            for docstring in docstrings:
+                parse_docstring(docstring)
+
+        def run_batch():
+            clear_docstring_cache()
+            parse_docstrings(docstrings)
+
+        per_call = min(timeit.repeat(run_per_call, repeat=repeat, number=number)) / number
+        batch = min(timeit.repeat(run_batch, repeat=repeat, number=number)) / number
+
+        print(f"Cache {'on ' if enabled else 'off'}:")
+        print(f"    Per call:           {per_call * 1e3:8.2f} ms")
+        print(f"    Batch:              {batch * 1e3:8.2f} ms")
+        print(f"    Speedup:            {per_call / batch:8.2f}x")
+
+    configure_docstring_cache(True)
+    clear_docstring_cache()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Compares how much memory a parsed module takes up as sparse records and docstrings against the plain nested dicts
+the parser used to return, on a generated module with thousands of documented functions, classes, and methods.
+
+python -m benchmarks.bench_parsed_results_memory
+"""
+import gc
+import importlib.util
+import os
+import tempfile
+import tracemalloc
+
+from src.parsed_results import ParsedDocstring, ParsedRecord
+from src.parser import clear_docstring_cache, parse_module
+
+def make_module_source(functions: int = 2000, classes: int = 200, methods: int = 10) -> str:
+    """Source code for a module where every docstring is different, so nothing can be shared between objects."""
+    source = []
+    for i in range(functions):
+        source.append(
+            f"def function_{i}(key: str, value: int = {i}) -> int:\n"
+            f"    \"\"\"\n        Does thing number {i}.\n\n"
+            f"        @param key The key for thing {i}\n        @param value The value for thing {i}\n"
+            f"        @returns The result of thing {i}\n    \"\"\"\n"
+            f"    return value\n"
+        )
+    for i in range(classes):
+        source.append(f"class Class_{i}():\n    \"\"\"A class numbered {i}. @since 1.{i}\"\"\"\n")
+        source.append(f"    def __init__(self, arg_{i}):\n        \"\"\"Makes class {i}.\"\"\"\n        pass\n")
+        for j in range(methods):
+            source.append(f"    def method_{j}(self, key):\n        \"\"\"Method {j} of class {i}.\"\"\"\n        pass\n")
+        source.append(f"    @property\n    def value(self):\n        \"\"\"The value of class {i}.\"\"\"\n        return {i}\n")
+    return "\n".join(source)
+
+def as_plain_dicts(value):
+    """Turns a parse result into the fully expanded plain dicts the parser used to return."""
+    if isinstance(value, (ParsedDocstring, ParsedRecord, dict)):
+        return {key: as_plain_dicts(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [as_plain_dicts(item) for item in value]
+    return value
+
+# The docstring keys the graphic_md template reads
+TEMPLATE_KEYS = ("description", "deprecated", "private", "ignore", "returns", "examples", "parameters")
+
+def read_keys(value, keys: tuple[str] | None = None) -> None:
+    """Reads the given keys (or every key) of every parsed docstring, the same as a template would."""
+    if isinstance(value, ParsedDocstring):
+        for key in keys or value:
+            value[key]
+    elif isinstance(value, dict):
+        for item in value.values():
+            read_keys(item, keys)
+    elif isinstance(value, list):
+        for item in value:
+            read_keys(item, keys)
+
+def retained(build) -> int:
+    """How many bytes the result of `build()` keeps alive once the docstring cache is cleared."""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    result = build()
+    clear_docstring_cache()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del result
+    return size
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench_generated_module.py")
+        with open(path, "w") as file:
+            file.write(make_module_source())
+
+        spec = importlib.util.spec_from_file_location("bench_generated_module", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        def records():
+            return parse_module(module)
+
+        def records_template_read():
+            result = parse_module(module)
+            read_keys(result, TEMPLATE_KEYS)
+            return result
+
+        def records_fully_read():
+            result = parse_module(module)
+            read_keys(result)
+            return result
+
+        def plain_dicts():
+            return as_plain_dicts(parse_module(module))
+
+        assert records() == plain_dicts()
+
+        objects = len(module.__dict__)
+        sizes = {
+            "Plain dicts": retained(plain_dicts),
+            "Records": retained(records),
+            "Records, template keys read": retained(records_template_read),
+            "Records, every key read": retained(records_fully_read),
+        }
+
+    print(f"Module level objects:     {objects}")
+    for name, size in sizes.items():
+        print(f"{name + ':':30}{size / 2**20:8.2f} MiB  ({size / sizes['Plain dicts']:.0%})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Times parsing a generated package of 1,000 source files from a clean checkout (with no bytecode cached yet), compiling
+each one as it gets imported against compiling all of them ahead of time with the `precompile` setting, for more and
+more `jobs` up to one per CPU.
+
+python -m benchmarks.bench_precompile
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_parallel_parsing import write_corpus
+from src.core import Core
+
+def measure(paths: list[str], jobs: int, precompile: bool) -> tuple[float, float, list]:
+    """ Parses the paths with `jobs` workers after clearing their cached bytecode, returning the seconds it took in all,
+        the seconds compiling ahead of time took, and the results."""
+    shutil.rmtree(os.path.join(os.path.dirname(paths[0]), "__pycache__"), ignore_errors=True)
+    core = Core({"verbose": False, "source": [], "jobs": jobs, "precompile": precompile,
+        "normalize_values": True})
+    phases = []
+    core.actions.add("precompiled_source_files", lambda args: phases.append(args["seconds"]))
+
+    # Importing only writes bytecode if Python may, so cold imports compile the same way with or without it
+    dont_write_bytecode, sys.dont_write_bytecode = sys.dont_write_bytecode, False
+    start = time.perf_counter()
+    parsed_results = core.parse_source_targets(paths)
+    elapsed = time.perf_counter() - start
+    sys.dont_write_bytecode = dont_write_bytecode
+
+    for name in [name for name in sys.modules if name.split(".")[0] == "bench_corpus"]:
+        del sys.modules[name]
+    return elapsed, sum(phases), parsed_results
+
+def main(count: int = 1000) -> None:
+    cpus = os.cpu_count() or 1
+    job_counts = sorted({1, *[jobs for jobs in (2, 4, 8, 16, 32) if jobs <= cpus], cpus})
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_corpus(directory, count)
+        print(f"Corpus:  {len(paths)} source files, {cpus} CPUs")
+
+        print(f"{'Jobs':>6}{'Cold':>10}{'Precompile':>13}{'Total':>10}{'Speedup':>10}")
+
+        expected = None
+        for jobs in job_counts:
+            cold_time, _, cold_results = measure(paths, jobs, False)
+            elapsed, compile_time, parsed_results = measure(paths, jobs, True)
+            expected = cold_results if expected is None else expected
+            assert cold_results == expected and parsed_results == expected
+            print(f"{jobs:6}{cold_time:8.2f} s{compile_time:11.2f} s{elapsed:8.2f} s{cold_time / elapsed:9.2f}x")
+
+if __name__ == "__main__":
+    main()
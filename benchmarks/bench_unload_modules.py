@@ -0,0 +1,40 @@
+"""
+Times parsing generated packages of more and more source files one at a time, with and without the `unload_modules`
+setting, to check that unloading each module costs about the same however many files the build has parsed already.
+
+python -m benchmarks.bench_unload_modules
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_parallel_parsing import write_corpus
+from src.core import Core
+
+def measure(paths: list[str], unload_modules: bool) -> tuple[float, list]:
+    """Parses the paths one at a time, returning the seconds it took and the results."""
+    core = Core({"verbose": False, "source": [], "normalize_values": True, "unload_modules": unload_modules})
+    start = time.perf_counter()
+    parsed_results = core.parse_source_targets(paths)
+    elapsed = time.perf_counter() - start
+
+    for name in [name for name in sys.modules if name.split(".")[0] == "bench_corpus"]:
+        del sys.modules[name]
+    return elapsed, parsed_results
+
+def main(counts: tuple[int, ...] = (250, 500, 1000)) -> None:
+    print(f"{'Files':>7}{'Kept':>10}{'Unloaded':>12}{'Overhead':>11}{'Per file':>12}")
+
+    for count in counts:
+        with tempfile.TemporaryDirectory() as directory:
+            paths = write_corpus(directory, count)
+            kept_time, expected = measure(paths, False)
+            unloaded_time, parsed_results = measure(paths, True)
+        assert parsed_results == expected
+        overhead = unloaded_time - kept_time
+        # Flat if unloading scales with the file count, and growing if it costs more the more files came before
+        print(f"{len(paths):7}{kept_time:8.2f} s{unloaded_time:10.2f} s{overhead:9.2f} s{overhead / len(paths) * 1000:9.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Docstrings for the parser benchmarks. The realistic ones look like the docstrings people actually write. The
+pathological ones are generated to push a single part of the parser as hard as possible, and grow with `lines`.
+"""
+
+REALISTIC = {
+    "one line": "Gets the current value.",
+    "function": """
+        Looks up a value by its key, falling back to the default if the key has never been set.
+
+        Keys are case sensitive, and a key that was set to `None` counts as set.
+
+        @param key The key to look up
+        @param default What to return if the key is not set
+        @returns The value for the key, or `default`
+        @throws [KeyError] If the key is not a string
+        @throws [PermissionError] If the store is locked
+    """,
+    "class": """
+        A store of settings that can be read from and written to like a dict.
+
+        Settings are loaded lazily the first time they are read.
+
+        @since 1.2.0
+        @version 1.4.1
+        @author Someone [someone@example.com]
+        @author Someone Else
+        @license MIT
+        @copyright 2024 Someone
+        @memberof settings
+        @namespace Store
+    """,
+    "lists and examples": """
+        Formats a value for display.
+
+        The value can be:
+        - A string, which is returned as is
+        - A number, which is rounded
+        <ol>1. Formatted as a number first
+        <ol>2. Then given its unit
+
+        @example Formatting a number
+            format_value(1.2345)
+            # Returns "1.23"
+        @example
+            format_value("text")
+        @deprecated Use `display` instead
+        @todo Support dates
+    """,
+    "private": """
+        @private
+        @ignore
+    """,
+}
+
+def huge_example(lines: int) -> str:
+    """One `@example` block holding `lines` lines of indented code."""
+    return "Runs the example.\n@example A very long example\n" + "".join(
+        f"    value_{i} = compute({i}, key='value')\n" for i in range(lines))
+
+def deep_lists(lines: int) -> str:
+    """A description made of nothing but `- ` list items, each one indented further than the last."""
+    return "".join(" " * (i % 200) + f"- List item {i}\n" for i in range(lines))
+
+def many_throws(lines: int) -> str:
+    """Thousands of `@throws [X]` tags, with and without descriptions."""
+    return "Throws a lot.\n" + "".join(
+        f"@throws [Error{i}] When case {i} happens\n" if i % 2 else f"@throws [Error{i}]\n" for i in range(lines))
+
+def whitespace_lines(lines: int) -> str:
+    """A few tags separated by long runs of lines that hold only whitespace."""
+    blank = "".join((" ", "\t", "    ", " \t ", "")[i % 5] + "\n" for i in range(lines // 4))
+    return blank + "A description\n" + blank + "@param key The key\n" + blank + "@returns The value\n" + blank
+
+def many_parameters(lines: int) -> str:
+    """A parameter on every line, where every parameter after the first few repeats an earlier name."""
+    return "Takes a lot of parameters.\n" + "".join(
+        f"@param parameter_{i % 100} Description of parameter {i}\n" for i in range(lines))
+
+def long_continuations(lines: int) -> str:
+    """Every single line tag followed by a long run of continuation lines."""
+    tags = ("@returns", "@since", "@version", "@license", "@copyright", "@todo", "@deprecated", "@namespace")
+    return "".join(f"{tag} Start\n" + "continued\n" * (lines // len(tags)) for tag in tags)
+
+PATHOLOGICAL = {
+    "huge example": huge_example,
+    "deep lists": deep_lists,
+    "many throws": many_throws,
+    "whitespace lines": whitespace_lines,
+    "many parameters": many_parameters,
+    "long continuations": long_continuations,
+}
+
+def build_corpus(lines: int = 2000) -> list[tuple[str, str, str]]:
+    """Every docstring in the corpus as `(kind, name, docstring)`, with pathological docstrings of about `lines` lines."""
+    corpus = [("realistic", name, docstring) for name, docstring in REALISTIC.items()]
+    corpus.extend(("pathological", name, build(lines)) for name, build in PATHOLOGICAL.items())
+    return corpus
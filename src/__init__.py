@@ -1,3 +1,7 @@
 from src.core import Core, ConsoleColorCodes, FormatForConsole
 from src.hooks import HookException, Hooks
-from src.parser import parse_module, parse_class, parse_function, parse_docstring
+from src.parser import parse_module, parse_class, parse_function, parse_docstring, parse_docstrings
+from src.parser import clear_docstring_cache, configure_docstring_cache, docstring_cache_info
+from src.parser import register_docstring_tag, registered_docstring_tags, unregister_docstring_tag
+from src.static_parser import parse_module_file
+from src.parsed_results import ParsedArgument, ParsedClass, ParsedDocstring, ParsedFunction, ParsedModule, ParsedProperty
@@ -1,15 +1,36 @@
 """This is the core class."""
 
+import collections
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
 from enum import Enum
+import gc
+import importlib.machinery
 import importlib.util
 import inspect
+import itertools
 import json
+import linecache
+import multiprocessing
+import multiprocessing.connection
 import os
+import py_compile
 import re
+import sys
+import sysconfig
+import threading
+import time
+import typing
+
+try:
+    import resource     # Only on Unix, where it sets the memory limit for isolated source files
+except ImportError:
+    resource = None
 
 from src.hooks import Hooks
-from src.parser import parse_module
+from src.parsed_results import ParsedModule
+from src.parser import configure_docstring_cache, parse_class, parse_function, parse_module, register_docstring_tag
+from src.static_parser import parse_module_file
 import src.plugins as plugins
 import src.templates as templates
 
@@ -17,12 +38,26 @@ initial_default_settings = {
     "console_colors": True,             # Set to False to remove colored output from
     "destination": os.getcwd(),         # Absolute or relative destination file path for generated files
     "destination_overwrite": False,     # If True, will overwrite any file of the same name that already exists there
+    "docstring_cache": True,            # If False, identical docstrings get parsed again instead of reusing the result
+    "docstring_cache_size": 1024,       # How many parsed docstrings to keep for reuse. Truncates to lowest integer.
+    "exports_only": False,              # If True, modules that define `__all__` only get the names in it parsed
+    "inherited_members": False,         # If True, classes also document the methods and properties they inherit
+    "isolate_modules": False,           # If True, each source file gets imported and parsed in a process of its own
+    "jobs": 1,                          # How many processes parse source files at once. Set to 0 for one per CPU.
+    "module_memory_limit": 0,           # Megabytes each isolated source file's process may use. Set to 0 for no limit.
+    "module_timeout": 0,                # Seconds each isolated source file may take. Set to 0 for no limit.
+    "normalize_values": False,          # If True, types and defaults get stored as plain strings instead of live objects
+    "parse_mode": "import",             # Set to "static" to read source files with `ast` instead of importing them
     "plugins": [],                      # Ordered list of plugin names to use. Will resolve to absolute file paths.
+    "precompile": False,                # If True, source files get compiled to bytecode in parallel before importing
+    "skip_private": False,              # If True, private and ignored functions and classes only get a name and docstring
+    "unload_modules": False,            # If True, each source file's module gets dropped once parsed to bound memory use
     "source": [],                       # A list of modules, functions, classes, or absolute/relative paths to source files.
     "source_depth": 0,                  # How many folders to traverse down. Set to 0 for no limit. Truncates to lowest integer.
     "source_exclude_pattern": [],       # A regex pattern to exclude matching subfiles during parsing
     "template": "",                     # Defaults to the Graphic Markdown template folder in the GraphicDocs source
-    "verbose": True                     # If False, will not output console status messages
+    "verbose": True,                    # If False, will not output console status messages
+    "worker_type": "process"            # Set to "thread" for `jobs` to use threads on Python builds without the GIL
 }
 
 class ConsoleColorCodes(Enum):
@@ -50,6 +85,289 @@ def FormatForConsole(message: str, type: ConsoleColorCodes = ConsoleColorCodes.N
     """
     return type.value + str(message) + ConsoleColorCodes.ENDC.value
 
+def is_live_target(target: any) -> bool:
+    """ Checks if a `source` entry is a module, class, or function that is already imported, rather than a path.
+
+        @param target The `source` entry to check
+        @returns `True` if it gets parsed as it is, `False` if it is a path to search for source files
+    """
+    return inspect.ismodule(target) or inspect.isclass(target) or inspect.isfunction(target)
+
+# Where the standard library and installed packages live. Modules from these stay loaded when unloading, since there is
+#   a limited number of them and compiled extensions among them cannot always be imported a second time.
+_library_paths = tuple(
+    os.path.join(os.path.normcase(os.path.abspath(sysconfig.get_paths()[key])), "")
+    for key in ("stdlib", "platstdlib", "purelib", "platlib")
+)
+
+def _is_unloadable(module: any) -> bool:
+    """Checks if a module is plain Python source from outside the standard library and installed packages."""
+    module_file = getattr(module, "__file__", None)
+    if not isinstance(module_file, str) or module_file.endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES)):
+        return False
+    return not os.path.normcase(os.path.abspath(module_file)).startswith(_library_paths)
+
+def _module_name(path: str) -> tuple[str, str]:
+    """ Works out the dotted name the import system knows a source file by, from the packages (folders with an
+        `__init__.py`) it is in. For example, `project/pkg/sub/mod.py` is `pkg.sub.mod` if `pkg` and `sub` are packages
+        and `project` is not.
+
+        @param path A path to a Python source file
+        @returns A tuple of the dotted name and the folder the top level package (or the file itself) is in
+    """
+    directory, filename = os.path.split(os.path.abspath(path))
+    module_name = os.path.splitext(filename)[0]
+    parts = [] if module_name == "__init__" else [module_name]
+    while os.path.isfile(os.path.join(directory, "__init__.py")):
+        directory, package = os.path.split(directory)
+        parts.insert(0, package)
+    return ".".join(parts), directory
+
+def _is_same_file(first: str | None, second: str) -> bool:
+    """Checks if two paths lead to the same file."""
+    return isinstance(first, str) and os.path.normcase(os.path.realpath(first)) == os.path.normcase(os.path.realpath(second))
+
+def _import_source_file(path: str) -> any:
+    """ Imports a source file through the import system by its dotted package name, so that it gets its own entry in
+        `sys.modules`, can use relative imports, and only runs once in a build (`parse_source_targets` drops the
+        modules a build imported once it is done). If another module is imported under the same name already, or the
+        name cannot get imported from the file's folder, returns `None` instead.
+
+        @param path A path to a Python source file
+        @returns The imported module, or `None` if it could not get imported by its name
+    """
+    module_name, package_root = _module_name(path)
+    if not all(part.isidentifier() for part in module_name.split(".")):
+        return None     # File and folder names like `my-module.py` cannot get imported by name
+
+    module = sys.modules.get(module_name)
+    if module is None:
+        added_path = package_root not in sys.path
+        if added_path:
+            sys.path.insert(0, package_root)
+        try:
+            module = importlib.import_module(module_name)
+        except ModuleNotFoundError as err:
+            if err.name is None or not (module_name == err.name or module_name.startswith(err.name + ".")):
+                raise   # The module itself got found, but something it imports did not
+            return None
+        finally:
+            if added_path:
+                sys.path.remove(package_root)
+
+    if not _is_same_file(getattr(module, "__file__", None), path):
+        return None     # Another file already has this name, such as a package of the same name somewhere else
+    return module
+
+# Unloaded modules hold themselves through their functions' globals, so only the cycle collector frees them. It takes
+#   longer the more the build has parsed already, so it runs once every this many unloaded source files (and once the
+#   build is done) instead of after each one, which would make a build take time growing with the square of its files.
+_files_per_collection = 50
+_unload_stats: dict = {"since_collection": 0}
+
+def _unload_modules(loaded_before: set[str], source_file: str, keep_packages: bool = False) -> list[str]:
+    """ Drops every module imported since `loaded_before` was taken that `_is_unloadable`, along with the attribute its
+        parent package holds it by and the source lines `linecache` holds for it and for `source_file`. They only get
+        freed once `_collect_unloaded` runs.
+
+        @param loaded_before The names in `sys.modules` before the source file got imported
+        @param source_file The source file that got imported, which `Core` does not add to `sys.modules`, or `None`
+        @param keep_packages If True, packages stay loaded, so the next source files in them do not run them again
+        @returns The names of the modules that got dropped
+    """
+    unloaded = []
+    for name in [name for name in sys.modules if name not in loaded_before]:
+        module = sys.modules[name]
+        if not _is_unloadable(module) or (keep_packages and hasattr(module, "__path__")):
+            continue
+        del sys.modules[name]
+        unloaded.append(name)
+        linecache.cache.pop(module.__file__, None)
+
+        parent_name, _, child_name = name.rpartition(".")
+        parent = sys.modules.get(parent_name)
+        if parent is not None and getattr(parent, child_name, None) is module:
+            delattr(parent, child_name)
+
+    linecache.cache.pop(source_file, None)
+    return unloaded
+
+def _collect_unloaded() -> None:
+    """Frees the modules `_unload_modules` dropped, by running the cycle collector."""
+    _unload_stats["since_collection"] = 0
+    gc.collect()
+
+# Loading a source file changes `sys.path` and `sys.modules`, so threads take turns at it
+_load_lock = threading.RLock()
+
+def _gil_enabled() -> bool:
+    """Checks if this Python has the GIL turned on, which keeps threads from running Python code at the same time."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)     # Only there from Python 3.13 on
+    return is_gil_enabled is None or is_gil_enabled()
+
+def _load_source_path(input_path: str) -> any:
+    """ Loads a python module from a path to its file. Source files get imported by their dotted package name when they
+        can be, and get loaded on their own under their file name when they cannot. @see _import_source_file
+
+        @param input_path An absolute or relative path to the module, a package folder, or a module without `.py`
+        @returns The loaded module
+        @throws [FileNotFoundError] If there is no file at the path
+    """
+    if os.path.isdir(input_path):
+        # Convert a package path into the module that initializes it
+        input_path = os.path.join(input_path, "__init__.py")
+    elif os.path.exists(f"{input_path}.py"):
+        # Allow providing plugin modules without the .py extension
+        input_path = input_path + ".py"
+
+    if not os.path.isfile(input_path):
+        raise FileNotFoundError(input_path)
+    loaded_file = _import_source_file(input_path)
+    if loaded_file is not None:
+        return loaded_file
+
+    spec = importlib.util.spec_from_file_location(os.path.basename(input_path), input_path)
+    loaded_file = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded_file)
+    return loaded_file
+
+def _load_source_module(path_to_module: str, config_folder: str, console: typing.Callable) -> any:
+    """ Loads a python module from the first place it is found. @see Core.load_python_module
+
+        @param path_to_module An absolute or relative path to the module
+        @param config_folder The folder the config file is in
+        @param console Gets a message before each place it looks
+        @returns The loaded module, or `None` if it could not get loaded from anywhere
+    """
+    attempts = [
+        # Attempt to load from absolute path. If not an absolute path, it will try to load from a relative path to the
+        #   current working directory using the "./" or "../" indicators.
+        (path_to_module, f"Attempting to load '{path_to_module}' from absolute path..."),
+        (os.path.join(os.getcwd(), path_to_module),
+            f"Could not load '{path_to_module}'. Attempting to load from working directory..."),
+        (os.path.join(config_folder, path_to_module),
+            f"Could not load '{path_to_module}'. Attempting to load from the config file's directory..."),
+        (None, f"Could not load '{path_to_module}'. Attempting to load from the system path..."),
+    ]
+    with _load_lock:
+        for candidate_path, message in attempts:
+            console(message)
+            try:
+                if candidate_path is None:
+                    return __import__(path_to_module)
+                return _load_source_path(candidate_path)
+            except MemoryError:
+                raise   # Looking somewhere else would only run out of memory again
+            except:
+                continue
+    return None
+
+def _parse_source_file(src_path: str, settings: dict, console: typing.Callable | None = None) -> tuple[dict | None,
+        str | None, dict, list[str]]:
+    """ Loads and parses a source file for `Core.parse_source_targets`, whether one at a time or in worker processes and
+        threads. It does not need a `Core`, so the workers can run it too.
+
+        @param src_path An absolute or relative path to the source file
+        @param settings The core config values for parsing, along with `config_folder`, the folder the config file is in.
+            Worker processes always set `normalize_values`, so the results are plain data that can get sent back.
+        @param console Gets each console message as it comes up, or `None` to send them back instead
+        @returns A tuple of the parsed module (or `None`), and if it failed, the action to fire and the arguments to add,
+            then the console messages if there was no `console` to get them
+    """
+    messages = []
+    if settings["parse_mode"] == "static":
+        # Read the source file without importing it, so none of its code runs
+        for candidate_path in [src_path, os.path.join(settings["config_folder"], src_path)]:
+            if os.path.isfile(candidate_path):
+                try:
+                    parsed_mod = parse_module_file(candidate_path, settings["skip_private"], settings["exports_only"])
+                    return parsed_mod, None, {}, messages
+                except (OSError, SyntaxError, ValueError) as err:
+                    return None, "unable_to_load_module", {"exception": err}, messages
+        return None, "unable_to_load_module", {}, messages
+
+    loaded_before = set(sys.modules) if settings["unload_modules"] else None
+    src_module = _load_source_module(src_path, settings["config_folder"], console or messages.append)
+    if not src_module:
+        return None, "unable_to_load_module", {}, messages
+
+    # Unloading only frees the module if the results hold nothing from it, so they have to be plain data
+    parsed_mod = parse_module(src_module, settings["skip_private"], settings["exports_only"],
+        settings["inherited_members"], settings["normalize_values"] or settings["unload_modules"])
+    if not parsed_mod:
+        return None, "unable_to_parse", {}, messages
+    # Imported by its dotted package name, but named after its file like every other parsed module
+    parsed_mod["name"] = os.path.basename(src_module.__file__)
+
+    if settings["unload_modules"]:
+        source_file = getattr(src_module, "__file__", None)
+        del src_module
+        _unload_modules(loaded_before, source_file, keep_packages=True)
+        _unload_stats["since_collection"] += 1
+        if _unload_stats["since_collection"] >= _files_per_collection:
+            _collect_unloaded()
+    return parsed_mod, None, {}, messages
+
+def _parse_isolated_source_file(connection: multiprocessing.connection.Connection, src_path: str, settings: dict,
+        memory_limit: int) -> None:
+    """ Runs in a worker process of its own for each isolated source file. Loads and parses it with `_parse_source_file`
+        and sends back what it returns, or a reason for why it could not.
+
+        @param connection Where to send the results
+        @param src_path An absolute or relative path to the source file
+        @param settings The same as for `_parse_source_file`
+        @param memory_limit The most memory in megabytes this process may use, or 0 for no limit
+    """
+    try:
+        if memory_limit > 0 and resource is not None:
+            limit = memory_limit * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        outcome = _parse_source_file(src_path, settings)
+    except MemoryError:
+        outcome = (None, "unable_to_load_module", {"reason": f"Went over the memory limit of {memory_limit} MB."}, [])
+    except BaseException as err:
+        outcome = (None, "unable_to_parse", {"reason": f"{type(err).__name__}: {err}"}, [])
+
+    try:
+        connection.send(outcome)
+    except Exception as err:
+        # Such as an exception in the arguments that cannot get pickled, or running out of memory while pickling
+        connection.send((None, outcome[1] or "unable_to_parse", {"reason": f"The results could not get sent back: {err}"},
+            outcome[3]))
+    connection.close()
+
+def _bytecode_is_current(src_path: str) -> bool:
+    """ Checks if a source file's cached bytecode matches it, the same way importing it would check (by the source
+        file's modification time and size). Bytecode checked by a hash of the source always gets compiled again.
+
+        @param src_path An absolute or relative path to the source file
+        @returns True if importing the source file would use its cached bytecode
+    """
+    try:
+        with open(importlib.util.cache_from_source(src_path), "rb") as cache_file:
+            header = cache_file.read(16)
+        source_stats = os.stat(src_path)
+    except (OSError, ValueError, NotImplementedError):
+        return False
+    return (header[:4] == importlib.util.MAGIC_NUMBER
+        and header[4:8] == bytes(4)     # The flags, which are only set for bytecode checked by hash
+        and int.from_bytes(header[8:12], "little") == int(source_stats.st_mtime) & 0xFFFFFFFF
+        and int.from_bytes(header[12:16], "little") == source_stats.st_size & 0xFFFFFFFF)
+
+def _compile_source_file(src_path: str) -> str | None:
+    """ Compiles a source file to bytecode where importing it looks for it (`__pycache__` next to it, unless
+        `sys.pycache_prefix` is set). Runs in the worker processes or threads for `precompile`. It is always checked by
+        timestamp, even when `SOURCE_DATE_EPOCH` is set, so `_bytecode_is_current` can tell it is current next time.
+
+        @param src_path An absolute or relative path to the source file
+        @returns None if it compiled, or the reason it could not
+    """
+    try:
+        py_compile.compile(src_path, doraise=True, invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP)
+    except (py_compile.PyCompileError, OSError, ValueError) as err:
+        return str(err).strip()
+    return None
+
 class Core():
     def __init__(self, user_defined_config: str=""):
         """Initial class load
@@ -155,16 +473,74 @@ class Core():
             - `destination`: An absolute or relative path for where the generated writes to.
             - `destination_overwrite`: If True, will overwrite any file of the same name that already exists there.
                 Converts truthy or falsy inputs to booleans.
+            - `docstring_cache`: If False, the parser will not reuse results for identical docstrings. Converts truthy or
+                falsy inputs to booleans.
+            - `docstring_cache_size`: How many parsed docstrings the parser keeps for reuse, evicting the least
+                recently used. Converts to an integer, or uses the default if it cannot.
+            - `exports_only`: If True, the parser only inspects the names listed in a module's `__all__`. Modules
+                without `__all__` still get parsed in full. Converts truthy or falsy inputs to booleans.
+            - `inherited_members`: If True, classes also list the methods and properties they inherit from each of their
+                base classes. Only used when `parse_mode` is `"import"`. Converts truthy or falsy inputs to booleans.
+            - `isolate_modules`: If True, each source file gets imported and parsed in a worker process of its own
+                (with up to `jobs` of them at once), so one that hangs, runs out of memory, or crashes cannot stop the
+                others. Source files that fail get reported through `unable_to_load_module` or `unable_to_parse` with
+                a `reason`, then get left out while the rest keep going. @see module_timeout, module_memory_limit. Only
+                used on platforms that can fork processes. Converts truthy or falsy inputs to booleans.
+            - `jobs`: How many worker processes load and parse source files at once. 1 parses them one after another in
+                this process, and 0 or less uses one per CPU. Workers always return plain data (the same as
+                `normalize_values`), and hooks still fire in this process in the same order as the source files. Only
+                used on platforms that can fork processes, unless `worker_type` is `"thread"`. Converts to an integer,
+                or uses the default if it cannot.
+            - `module_memory_limit`: The most memory (address space) in megabytes that each isolated source file's
+                process may use, which includes everything it starts out with from this process. Set to 0 or less for
+                no limit. Only used with `isolate_modules` on platforms with the `resource` module. Converts to an
+                integer, or uses the default if it cannot.
+            - `module_timeout`: How many seconds each isolated source file may take to import and parse before its
+                process gets stopped. Set to 0 or less for no limit. Only used with `isolate_modules`. Converts to a
+                number, or uses the default if it cannot.
+            - `normalize_values`: If True, the parser turns argument types, return types, and annotations into strings
+                and default values into short strings or plain literals, so parsed modules hold no live objects. Only
+                used when `parse_mode` is `"import"`. Converts truthy or falsy inputs to booleans.
+            - `parse_mode`: Either `"import"` to import each source file and inspect the live objects, or `"static"` to
+                read each source file with the `ast` module without running any of its code. Anything else uses the
+                default. @see static_parser
             - `plugins`: A list of plugins path to use. The inputs must be strings or coercible to strings. The values
                 may be either a Python module name, or an absolute or relative path to the plugin script.
                 If provided anything other than a list, it will use the default empty list.
                 The initialization step will not resolve paths yet, just enforce strings.
+            - `precompile`: If True, every source file found gets compiled to bytecode by `jobs` worker processes (or
+                threads, the same as `worker_type`) before any of them get imported, so importing them one at a time
+                only has to read the cached bytecode. Source files with current bytecode get skipped. It reports how
+                long it took through `precompiled_source_files`. It writes the bytecode even when Python is set not to
+                (such as with `PYTHONDONTWRITEBYTECODE`), since importing still reads it. Only used when `parse_mode`
+                is `"import"`. Converts truthy or falsy inputs to booleans.
+            - `skip_private`: If True, the parser skips everything but the name and docstring of functions and classes
+                that are private (by a leading underscore or the `@private` tag) or ignored (by the `@ignore` tag),
+                since templates leave them out anyway. Converts truthy or falsy inputs to booleans.
+            - `source`: A list of absolute or relative paths to source files or folders, or of modules, classes, or
+                functions that are already imported. Those get parsed as they are, without reading or importing
+                anything again. Everything else gets converted to a string. If provided anything other than a list, it
+                will use the default empty list.
             - `source_exclude_pattern`: A list of regex patterns that will get omitted from the source inclusions.
                 If provided anything other than a list, it will use the default empty list. All values inside the list
                 convert to strings if not already in string format.
+            - `unload_modules`: If True, the parser copies everything templates need out of each source file it imports
+                as plain data (the same as `normalize_values`), then drops the module, the modules it newly imported,
+                and their cached source lines, so memory use stays flat however many files get parsed. The dropped
+                modules get freed together every 50 source files. Packages stay loaded until the build is done, so
+                their `__init__.py` runs once for all the files in them. Modules from the standard library, from
+                installed packages, and compiled extensions stay loaded. Only used when
+                `parse_mode` is `"import"`, and never for modules given as imported objects in `source`. Converts
+                truthy or falsy inputs to booleans.
             - `template`: Either a Python module name, or an absolute or relative path for where the template script
                 is located. The initialization step will not resolve paths yet, just enforce strings.
             - `verbose`: If True, will output console status messages. Converts truthy or falsy inputs to booleans.
+            - `worker_type`: Either `"process"` for `jobs` to use worker processes, or `"thread"` to use threads in this
+                process instead, which skips copying the results between processes. Threads only parse at the same time
+                on Python builds without the GIL (free threaded builds), so if the GIL is on, worker processes get used
+                anyway. Threads keep live objects unless `normalize_values` is set, and with `unload_modules`, modules
+                only get dropped once every thread is done. Threads also share their modules, so a package's
+                `__init__.py` can list submodules that other threads imported already. Anything else uses the default.
         """
 
         self.console(FormatForConsole("Setting initial GraphicDocs configuration.", ConsoleColorCodes.CONTROL))
@@ -179,7 +555,8 @@ class Core():
                     if key == "destination":
                         self.config[key] = self.validate_filepath(user_config_data[key])
 
-                    elif key in ["console_colors", "destination_overwrite", "verbose"]:
+                    elif key in ["console_colors", "destination_overwrite", "docstring_cache", "exports_only", "inherited_members",
+                            "isolate_modules", "normalize_values", "precompile", "skip_private", "unload_modules", "verbose"]:
                         self.config[key] = bool(user_config_data[key])
 
                     elif key in ["plugins", "source", "source_exclude_pattern"]:
@@ -187,18 +564,51 @@ class Core():
                             return  # Default is empty list... leave it that way
                         processed_list = []
                         for entry in user_config_data[key]:
-                            processed_list.append(str(entry))
+                            if key == "source" and is_live_target(entry):
+                                processed_list.append(entry)    # Already imported, so it gets parsed as it is
+                            else:
+                                processed_list.append(str(entry))
                         self.config[key] = processed_list
                         
                     elif key == "template":
                         self.config[key] = str(user_config_data[key])
 
+                    elif key == "parse_mode":
+                        parse_mode = str(user_config_data[key]).lower()
+                        if parse_mode not in ["import", "static"]:
+                            parse_mode = initial_default_settings["parse_mode"]
+                        self.config[key] = parse_mode
+
+                    elif key == "worker_type":
+                        worker_type = str(user_config_data[key]).lower()
+                        if worker_type not in ["process", "thread"]:
+                            worker_type = initial_default_settings["worker_type"]
+                        self.config[key] = worker_type
+
                     elif key == "source_depth": # Force to integers
                         try:
                             self.config["source_depth"] = int(user_config_data[key])
                         except:
                             self.config["source_depth"] = 0
 
+                    elif key in ["jobs", "module_memory_limit"]: # Force to integers
+                        try:
+                            self.config[key] = int(user_config_data[key])
+                        except:
+                            self.config[key] = initial_default_settings[key]
+
+                    elif key == "module_timeout": # Force to numbers
+                        try:
+                            self.config[key] = float(user_config_data[key])
+                        except:
+                            self.config[key] = initial_default_settings[key]
+
+                    elif key == "docstring_cache_size": # Force to integers
+                        try:
+                            self.config["docstring_cache_size"] = int(user_config_data[key])
+                        except:
+                            self.config["docstring_cache_size"] = initial_default_settings["docstring_cache_size"]
+
                     else:
                         self.config[key] = user_config_data[key]
                         action = "Added new"
@@ -289,6 +699,7 @@ class Core():
         self.filters.add("next_parsing_target", core_filter_hook, 0)
 
         self.actions.add("no_parsing_targets_specified", core_action_hook, 0)
+        self.actions.add("precompiled_source_files", core_action_hook, 0)
         self.actions.add("unable_to_load_module", core_action_hook, 0)
         self.actions.add("unable_to_parse", core_action_hook, 0)
         self.actions.add("parsed_module", core_action_hook, 0)
@@ -314,55 +725,15 @@ class Core():
 
             3. The system path (e.g. you build and install callable modules as packages using PIP)
 
+            Source files get imported by their dotted package name (e.g. `pkg/sub/mod.py` as `pkg.sub.mod`) through the
+            import system, so each one only runs once in a build, even if other source files import it too. Files that
+            cannot get imported by name (such as a file whose name another module already has) get loaded on their
+            own under their file name instead.
+
             @param path_to_module An absolute or relative path to the module
             @returns A loaded reference to the module.
         """
-
-        loaded_module = None
-
-        def load_by_spec(input_path: str) -> None:
-            """ Helper function that tries to load a python module from spec based on the file location.
-                @param input_path An absolute or relative path to the module
-            """
-
-            nonlocal loaded_module
-            if os.path.isdir(input_path):
-                # Convert a package path into the module that initializes it
-                input_path = os.path.join(input_path, "__init__.py")
-            elif os.path.exists(f"{input_path}.py"):
-                # Allow providing plugin modules without the .py extension
-                input_path = input_path + ".py"
-
-            spec = importlib.util.spec_from_file_location(os.path.basename(input_path), input_path)
-            loaded_file = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(loaded_file)
-            return loaded_file
-
-        try:
-            # Attempt to load from absolute path. If not an absolute path, it will try to load from a relative path
-            #   to the current working directory using the "./" or "../" indicators.
-            self.console(f"Attempting to load '{path_to_module}' from absolute path...")
-            loaded_module = load_by_spec(path_to_module)
-        except:
-            try:
-                # Attempts to load from working directory.
-                formatted_path = os.path.join(os.getcwd(), path_to_module)
-                self.console(f"Could not load '{path_to_module}'. Attempting to load from working directory...")
-                loaded_module = load_by_spec(formatted_path)
-            except:
-                try:
-                    # Attempt to load from the config file directory
-                    formatted_path = os.path.join(os.path.dirname(self.user_defined_config_path), path_to_module)
-                    self.console(f"Could not load '{path_to_module}'. Attempting to load from the config file's directory...")
-                    loaded_module = load_by_spec(formatted_path)
-                except:
-                    try:
-                        # Attempts to load from the system path.
-                        self.console(f"Could not load '{path_to_module}'. Attempting to load from the system path...")
-                        loaded_module = __import__(path_to_module)
-                    except:
-                        pass
-        return loaded_module
+        return _load_source_module(path_to_module, os.path.dirname(self.user_defined_config_path), self.console)
 
     def _load_plugins(self) -> None:
         """ Loads all plugins from the config file.
@@ -474,10 +845,19 @@ class Core():
         """ Parses source files into a list target path.
             It will search using the exclusion patterns and source folder depth limit.
 
+            Modules, classes, and functions that are already imported get parsed as they are, in the same order as the
+            other targets, without reading or importing any files. The exclusion patterns and the
+            `next_parsing_target` filter only work on paths, so they get skipped. Classes and functions get grouped
+            into a parsed module for the module they come from, and every parsed module is named after its file the
+            same as the ones loaded from a path are, so templates treat them all the same way. With `jobs` set, worker
+            processes or threads load and parse the source files, but the results and hooks come in the same order
+            either way.
+
             This method runs during initialization, but is designed so that it can be used again later for other
             purposes. It does not update any core instance settings directly.
             
-            @param target_path A filesystem path to search and parse. Can be a file or folder.
+            @param target_path A list of filesystem paths to search and parse (each can be a file or folder), or of
+                imported modules, classes, and functions
             @returns A list of parsed dictionaries for each file in the source list.
         """
 
@@ -524,45 +904,313 @@ class Core():
                 return
             add_path(os.path.join(src)) # It's a file in the provided source list, add it
 
+        def source_file_settings() -> dict:
+            """The settings `_parse_source_file` needs, which the worker modes change to suit them."""
+            settings = {key: self.config[key] for key in
+                ["exports_only", "inherited_members", "normalize_values", "parse_mode", "skip_private", "unload_modules"]}
+            settings["config_folder"] = os.path.dirname(self.user_defined_config_path)
+            return settings
+
         def process_module(src_path):
-            # Attempt to load the module, and raise an exception if it can't.
-            src_module = self.load_python_module(src_path)
-            if not src_module:
-                self.do_action("unable_to_load_module", {"bad_source_target": src_path})
+            # Loads and parses the same way the workers do, and raises an exception if it can't
+            parsed_mod, failed_action, failed_args, _ = _parse_source_file(src_path, source_file_settings(), self.console)
+            if failed_action:
+                self.do_action(failed_action, {"bad_source_target": src_path, **failed_args})
                 raise(Exception)
+            return parsed_mod
 
-            parsed_mod = parse_module(src_module)
-            if not parsed_mod:
-                self.do_action("unable_to_parse", {"bad_source_target": src_path})
+        # Classes and functions given on their own, grouped into a parsed module for each module they come from. They
+        #   also share the parser's caches, the same as everything parsed from one module does.
+        live_modules = {}
+        live_caches = {"sources": {}, "signatures": {}, "parsed_classes": {}, "type_hints": {}}
+
+        def process_live_target(target) -> ParsedModule | None:
+            """ Parses an imported module, class, or function. Returns `None` for a class or function that got added to
+                a parsed module already in the results."""
+            module_ref = target if inspect.ismodule(target) else sys.modules.get(target.__module__)
+            module_file = getattr(module_ref, "__file__", None)
+            if not module_file:
+                # Built in and namespace modules do not have a source file to name the results after
+                self.do_action("unable_to_parse", {"bad_source_target": target})
                 raise(Exception)
-            return parsed_mod
+
+            if inspect.ismodule(target):
+                parsed_mod = parse_module(target, self.config["skip_private"], self.config["exports_only"],
+                    self.config["inherited_members"], self.config["normalize_values"])
+                parsed_mod["name"] = os.path.basename(module_file)
+                return parsed_mod
+
+            if inspect.isclass(target):
+                parsed = parse_class(target, None, self.config["skip_private"], live_caches["sources"],
+                    live_caches["signatures"], live_caches["parsed_classes"], self.config["inherited_members"],
+                    self.config["normalize_values"], live_caches["type_hints"])
+                key = "classes"
+            else:
+                parsed = parse_function(target, None, self.config["skip_private"], live_caches["sources"],
+                    live_caches["signatures"], self.config["normalize_values"], live_caches["type_hints"])
+                key = "functions"
+            if not parsed:
+                self.do_action("unable_to_parse", {"bad_source_target": target})
+                raise(Exception)
+
+            parsed_mod = live_modules.get(module_ref.__name__)
+            is_new = parsed_mod is None
+            if is_new:
+                parsed_mod = live_modules[module_ref.__name__] = ParsedModule(classes=None, functions=None,
+                    imported={"classes": None, "functions": None, "modules": None},
+                    name=os.path.basename(module_file), sourcefile=os.path.abspath(module_file))
+            parsed_mod[key] = {**(parsed_mod[key] or {}), target.__name__: parsed}
+            return parsed_mod if is_new else None
+
+        def parse_in_workers(jobs: int, use_threads: bool) -> list[dict] | None:
+            """ Parses the targets the same as one at a time does, but has `jobs` worker processes or threads load and
+                parse the source files while the imported objects get parsed here. Every `next_parsing_target` filter
+                runs before any file gets sent out, and `parsed_module` fires here for each target in order as its
+                results come back, so the results are in the same order whatever order the workers finish in."""
+            src_paths = [self.apply_filter("next_parsing_target", target) for target in formatted_source_list
+                if not is_live_target(target) and target[-3:] == ".py"]
+            settings = source_file_settings()
+
+            if use_threads:
+                # Threads share the modules, so they only get dropped once the whole build is done with them
+                settings["normalize_values"] = settings["normalize_values"] or settings["unload_modules"]
+                settings["unload_modules"] = False
+                executor = ThreadPoolExecutor(jobs)
+            else:
+                # Forked workers start out with the same registered docstring tags, plugins, and import paths as this
+                #   process. Their results always need to be plain data to get sent back.
+                settings["normalize_values"] = True
+                executor = ProcessPoolExecutor(jobs, mp_context=multiprocessing.get_context("fork"))
+
+            with executor:
+                # Larger chunks cut down on sending files back and forth, but enough of them keeps every worker busy
+                file_results = executor.map(_parse_source_file, src_paths, itertools.repeat(settings),
+                    chunksize=max(1, len(src_paths) // (jobs * 4)))
+                next_paths = iter(src_paths)
+
+                parsed_results = []
+                for target in formatted_source_list:
+                    try:
+                        if is_live_target(target):
+                            parsed_mod = process_live_target(target)
+                        elif target[-3:] != ".py":
+                            continue
+                        else:
+                            src_path = next(next_paths)
+                            parsed_mod, failed_action, failed_args, messages = next(file_results)
+                            for message in messages:
+                                self.console(message)
+                            if failed_action:
+                                self.do_action(failed_action, {"bad_source_target": src_path, **failed_args})
+                                raise(Exception)
+                        if parsed_mod is not None:
+                            parsed_results.append(parsed_mod)
+                        self.do_action("parsed_module")
+                    except:
+                        executor.shutdown(cancel_futures=True)
+                        return
+
+            return parsed_results
+
+        def parse_isolated(jobs: int) -> list[dict]:
+            """ Parses each source file in a worker process of its own, with up to `jobs` of them running at once, while
+                the imported objects get parsed here. Source files that fail, take longer than `module_timeout`, or go
+                over `module_memory_limit` get reported with a `reason` and left out, and the rest keep going. Hooks
+                fire here in the same order as the targets, the same as with `parse_in_workers`."""
+            targets = [target for target in formatted_source_list if is_live_target(target) or target[-3:] == ".py"]
+            src_paths = {index: self.apply_filter("next_parsing_target", target) for index, target in enumerate(targets)
+                if not is_live_target(target)}
+            settings = source_file_settings()
+            settings["normalize_values"] = True     # The results need to be plain data to get sent back
+            settings["unload_modules"] = False      # The whole process ends once its source file is done anyway
+
+            timeout = self.config["module_timeout"] if self.config["module_timeout"] > 0 else None
+            context = multiprocessing.get_context("fork")
+            waiting = collections.deque(src_paths)
+            running = {}    # The connection to each running process, mapped to its target index, process, and deadline
+            outcomes = {}   # What `_parse_source_file` returned for each target index that finished
+
+            def start(index: int) -> None:
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(target=_parse_isolated_source_file, daemon=True,
+                    args=(sender, src_paths[index], settings, self.config["module_memory_limit"]))
+                process.start()
+                sender.close()  # Only the worker writes to it now, so reading gets an `EOFError` if the worker dies
+                running[receiver] = (index, process, None if timeout is None else time.monotonic() + timeout)
+
+            def finish(receiver: multiprocessing.connection.Connection, outcome: tuple) -> None:
+                index, process, deadline = running.pop(receiver)
+                receiver.close()
+                process.join()
+                outcomes[index] = outcome
+
+            def wait_for_workers() -> None:
+                """Waits until at least one worker finishes or runs out of time."""
+                deadlines = [deadline for index, process, deadline in running.values() if deadline is not None]
+                wait_time = max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+                for receiver in multiprocessing.connection.wait(list(running), wait_time):
+                    try:
+                        outcome = receiver.recv()
+                    except EOFError:
+                        process = running[receiver][1]
+                        process.join()
+                        outcome = (None, "unable_to_load_module",
+                            {"reason": f"The worker process stopped with exit code {process.exitcode}."}, [])
+                    finish(receiver, outcome)
+
+                for receiver, (index, process, deadline) in list(running.items()):
+                    if deadline is not None and deadline <= time.monotonic():
+                        process.kill()
+                        finish(receiver, (None, "unable_to_load_module",
+                            {"reason": f"Took longer than {self.config['module_timeout']:g} seconds."}, []))
+
+            parsed_results = []
+            try:
+                for index, target in enumerate(targets):
+                    if is_live_target(target):
+                        try:
+                            parsed_mod = process_live_target(target)
+                        except:
+                            continue    # Already reported
+                        if parsed_mod is not None:
+                            parsed_results.append(parsed_mod)
+                        self.do_action("parsed_module")
+                        continue
+
+                    while index not in outcomes:
+                        while waiting and len(running) < jobs:
+                            start(waiting.popleft())
+                        wait_for_workers()
+
+                    parsed_mod, failed_action, failed_args, messages = outcomes.pop(index)
+                    for message in messages:
+                        self.console(message)
+                    if failed_action:
+                        self.do_action(failed_action, {"bad_source_target": src_paths[index], **failed_args})
+                        continue
+                    parsed_results.append(parsed_mod)
+                    self.do_action("parsed_module")
+            finally:
+                for receiver, (index, process, deadline) in list(running.items()):
+                    process.kill()
+                    finish(receiver, None)
+            return parsed_results
+
+        def precompile_source_files(jobs: int) -> None:
+            """ Compiles every source file found to bytecode, with `jobs` worker processes or threads, before any of
+                them get imported. Source files that cannot compile get left for importing them to report. Fires
+                `precompiled_source_files` with the source files it `compiled`, the ones that were `current` already,
+                the reasons the `failed` ones could not compile, and how many `seconds` it took."""
+            start = time.perf_counter()
+            src_paths = []
+            config_folder = os.path.dirname(self.user_defined_config_path)
+            for target in formatted_source_list:
+                if is_live_target(target) or target[-3:] != ".py":
+                    continue
+                for candidate_path in [target, os.path.join(config_folder, target)]:
+                    if os.path.isfile(candidate_path):
+                        src_paths.append(os.path.abspath(candidate_path))
+                        break
+            src_paths = list(dict.fromkeys(src_paths))   # Packages can list the same file more than once
+            current, stale = [], []
+            for src_path in src_paths:
+                (current if _bytecode_is_current(src_path) else stale).append(src_path)
+
+            jobs = min(jobs, len(stale))
+            use_threads = self.config["worker_type"] == "thread" and not _gil_enabled()
+            if jobs > 1 and (use_threads or "fork" in multiprocessing.get_all_start_methods()):
+                executor = ThreadPoolExecutor(jobs) if use_threads else \
+                    ProcessPoolExecutor(jobs, mp_context=multiprocessing.get_context("fork"))
+                with executor:
+                    reasons = list(executor.map(_compile_source_file, stale, chunksize=max(1, len(stale) // (jobs * 4))))
+            else:
+                reasons = [_compile_source_file(src_path) for src_path in stale]
+
+            failed = {src_path: reason for src_path, reason in zip(stale, reasons) if reason is not None}
+            seconds = time.perf_counter() - start
+            self.console(f"Compiled {len(stale) - len(failed)} source files to bytecode in {seconds:.2f} seconds "
+                f"({len(current)} already compiled, {len(failed)} could not compile).")
+            self.do_action("precompiled_source_files", {
+                "compiled": [src_path for src_path in stale if src_path not in failed],
+                "current": current,
+                "failed": failed,
+                "seconds": seconds
+            })
 
         if not target_path:
             self.do_action("no_parsing_targets_specified")
             return
 
         self.console("Parsing source targets...")
+        configure_docstring_cache(self.config["docstring_cache"], self.config["docstring_cache_size"])
 
         for src in target_path:
-            traverse_folders(src, 0)
+            if is_live_target(src):
+                formatted_source_list.append(src)   # There are no files to search for
+            else:
+                traverse_folders(src, 0)
 
-        parsed_results = []
-        for target in formatted_source_list:
+        jobs = self.config["jobs"] if self.config["jobs"] > 0 else os.cpu_count() or 1
+        if self.config["precompile"] and self.config["parse_mode"] == "import":
+            precompile_source_files(jobs)
 
-            if target[-3:] != ".py":
-                continue    # Trying to process non-python files will cause errors
+        # Source files only run once in a build, even when other source files import them too. The modules this build
+        #   imported get dropped once it is done, so the next build runs (and documents) each source file as it is then.
+        loaded_before = set(sys.modules)
+        try:
+            if self.config["isolate_modules"]:
+                if "fork" in multiprocessing.get_all_start_methods():
+                    parsed_results = parse_isolated(jobs)
+                    self.do_action("parsing_complete")
+                    return parsed_results
+                self.console("Isolating source files needs a platform that can fork processes. Parsing them here instead...")
+
+            file_count = len([target for target in formatted_source_list
+                if not is_live_target(target) and target[-3:] == ".py"])
+            if jobs > 1 and file_count > 1:
+                use_threads = self.config["worker_type"] == "thread"
+                if use_threads and _gil_enabled():
+                    self.console("Threads cannot parse at the same time while the GIL is enabled. Using worker processes "
+                        "instead...")
+                    use_threads = False
+
+                if use_threads or "fork" in multiprocessing.get_all_start_methods():
+                    parsed_results = parse_in_workers(min(jobs, file_count), use_threads)
+                    if parsed_results is not None:
+                        self.do_action("parsing_complete")
+                    return parsed_results
+                self.console("Worker processes need a platform that can fork. Parsing one file at a time instead...")
+
+            parsed_results = []
+            for target in formatted_source_list:
+
+                if is_live_target(target):
+                    try:
+                        parsed_mod = process_live_target(target)
+                        if parsed_mod is not None:
+                            parsed_results.append(parsed_mod)
+                        self.do_action("parsed_module")
+                    except:
+                        return
+                    continue
 
-            # Check each provided source file against the exclusion criteria using regexp and core config. Skip matches.
-            src_path = self.apply_filter("next_parsing_target", target)
+                if target[-3:] != ".py":
+                    continue    # Trying to process non-python files will cause errors
 
-            try:
-                parsed_results.append(process_module(src_path))
-                self.do_action("parsed_module")
-            except:
-                return
+                # Check each provided source file against the exclusion criteria using regexp and core config. Skip matches.
+                src_path = self.apply_filter("next_parsing_target", target)
 
-        self.do_action("parsing_complete")
-        return parsed_results
+                try:
+                    parsed_results.append(process_module(src_path))
+                    self.do_action("parsed_module")
+                except:
+                    return
+
+            self.do_action("parsing_complete")
+            return parsed_results
+        finally:
+            _unload_modules(loaded_before, None)
+            _collect_unloaded()
 
     def build(self) -> None:
         """ Runs the template's build function while passing the core object to it."""
@@ -583,6 +1231,26 @@ class Core():
             self.do_action("error_building_documentation", {"error": err})
             self.console(FormatForConsole("Documentation failed to build.", ConsoleColorCodes.CONTROL))
 
+    def register_tag(self, tag: str, handler: callable, key: str | None = None) -> None:
+        """ Registers a custom docstring tag for the parser to extract alongside the built-in tags.
+
+            Plugins should call this from their `load()` method so the tag is known before source targets get parsed.
+            Tags are registered with the parser itself, so they apply to every `Core` instance.
+
+            @param tag The tag name, including the `@` (e.g. `@threadsafe`)
+            @param handler A callable that takes the list of `DocstringBlock` objects using this tag and returns the
+                parsed value
+            @param key The parsed docstring key for the value. Defaults to the tag name without the `@`.
+            @throws [ValueError] If the tag name is invalid or its key is already used
+            @throws [TypeError] If the handler is not callable
+            @see parser.register_docstring_tag
+            @example
+            def load(core):
+                core.register_tag("@threadsafe", lambda blocks: len(blocks) > 0)
+        """
+        register_docstring_tag(tag, handler, key)
+        self.console(f"Registered docstring tag '{tag}'.")
+
     def do_action(self, action_name: str, args: dict = {}) -> None:
         """ Executes all actions with the provided name in order of priority.
         
@@ -611,23 +1279,23 @@ class Core():
         if args:
             self.console(f"    {FormatForConsole('Hook Arguments:', ConsoleColorCodes.PYTHON)} {args}.")
 
-        for priority in sorted(self.actions._registered[action_name]):
-            # Actions must be carried out in priority order. Cannot rely on a dict structure to self-sort.
-            for action in self.actions._registered[action_name][priority]:
-                # Within the priority level though, actions should carry out in the order added.
-                self.actions.doing["hook_name"] = action_name
-                self.actions.doing["callback"] = action
-                self.actions.doing["priority"] = priority
-                if args and inspect.getfullargspec(action).args:
-                    # Trying to execute with arguments will error if the callback doesn't expect or need them.
-                    action(args)
-                else:
-                    action()
+        # Actions must be carried out in priority order, and within the priority level, in the order added. Goes
+        #   through a copy, so other threads can add and remove actions in the meantime.
+        doing = self.actions.doing
+        for priority, action in self.actions.callbacks(action_name):
+            doing["hook_name"] = action_name
+            doing["callback"] = action
+            doing["priority"] = priority
+            if args and inspect.getfullargspec(action).args:
+                # Trying to execute with arguments will error if the callback doesn't expect or need them.
+                action(args)
+            else:
+                action()
 
         self.actions.done.append(action_name)
-        self.actions.doing["hook_name"] = None
-        self.actions.doing["callback"] = None
-        self.actions.doing["priority"] = None
+        doing["hook_name"] = None
+        doing["callback"] = None
+        doing["priority"] = None
 
     def apply_filter(self, filter_name: str, filter_input: any) -> any:
         """ Applies all filters with the provided name to the provided input sequentially and in order of priority.
@@ -652,13 +1320,13 @@ class Core():
             if self.config["verbose"]:
                 self.console(f"Filter hook '{filter_name}' not found.")
         else:
-            for priority in sorted(self.filters._registered[filter_name]):
-                for filter in self.filters._registered[filter_name][priority]:
-                    # Apply filters to the input in sequential order until all have been applied
-                    self.filters.doing["hook_name"] = filter_name
-                    self.filters.doing["callback"] = filter
-                    self.filters.doing["priority"] = priority
-                    filter_output = filter(filter_output)
+            doing = self.filters.doing
+            for priority, filter in self.filters.callbacks(filter_name):
+                # Apply filters to the input in sequential order until all have been applied
+                doing["hook_name"] = filter_name
+                doing["callback"] = filter
+                doing["priority"] = priority
+                filter_output = filter(filter_output)
 
         self.console(f"Applying filter {FormatForConsole(filter_name, ConsoleColorCodes.FILTER)}.")
 
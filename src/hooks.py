@@ -1,4 +1,5 @@
 import inspect
+import threading
 import typing
 
 class HookException(Exception):
@@ -9,9 +10,38 @@ class HookException(Exception):
 class Hooks():
     def __init__(self) -> None:
         self._registered: dict[dict[list[int]]] = {}
-        self.doing: dict = {"hook_name": None, "callback": None, "priority": None}
+        self._lock = threading.RLock()          # Guards `_registered`, so hooks can get added while others are firing
+        self._thread_state = threading.local()  # Holds `doing` for each thread
         self.done: list|None = []
 
+    @property
+    def doing(self) -> dict:
+        """ The hook the calling thread is running right now, as {hook_name, callback, priority}. Every thread has its
+            own, so hooks firing on one thread never show up as what another one is doing."""
+        try:
+            return self._thread_state.doing
+        except AttributeError:
+            self._thread_state.doing = {"hook_name": None, "callback": None, "priority": None}
+            return self._thread_state.doing
+
+    @doing.setter
+    def doing(self, value: dict) -> None:
+        self._thread_state.doing = value
+
+    def callbacks(self, hook_name: str) -> list[tuple[int, typing.Callable]]:
+        """ Lists the callbacks registered under a hook in the order they should run.
+
+            This is a copy, so callbacks can get added or removed (including by the callbacks themselves, or from other
+            threads) while going through it.
+
+            @param hook_name The identifying name for the hook
+            @returns A list of tuples as (priority, callback), in order of priority followed by the order they were
+                registered in. Empty if the hook is not registered.
+        """
+        with self._lock:
+            registered = self._registered.get(hook_name, {})
+            return [(priority, callback) for priority in sorted(registered) for callback in registered[priority]]
+
     def add(self, hook_name: str, callback: typing.Callable, priority: int = 10) -> True:
         """ Register a new hook.
             @param hook_name The identifying name for the hook
@@ -43,13 +73,14 @@ class Hooks():
         if len(args) > 1:
             raise HookException("Hooks may only take a single argument. Use a list/tuple/dict for more args.")
 
-        if hook_name in self._registered:
-            if priority in self._registered[hook_name]:
-                self._registered[hook_name][priority].append(callback) # Hook and priority already existed
+        with self._lock:
+            if hook_name in self._registered:
+                if priority in self._registered[hook_name]:
+                    self._registered[hook_name][priority].append(callback) # Hook and priority already existed
+                else:
+                    self._registered[hook_name][priority] = [callback] # Hook priority did not exist
             else:
-                self._registered[hook_name][priority] = [callback] # Hook priority did not exist
-        else:
-            self._registered[hook_name] = {priority: [callback]} # Hook didn't exist
+                self._registered[hook_name] = {priority: [callback]} # Hook didn't exist
 
         return True
 
@@ -72,16 +103,17 @@ class Hooks():
             hook_name = str(hook_name)
             priority = int(priority)
 
-            # Try to remove callback
-            self._registered[hook_name][priority].remove(callback)
+            with self._lock:
+                # Try to remove callback
+                self._registered[hook_name][priority].remove(callback)
 
-            # Try to remove priority if there are no more under this dict
-            if len(self._registered[hook_name][priority]) == 0:
-                del self._registered[hook_name][priority]
+                # Try to remove priority if there are no more under this dict
+                if len(self._registered[hook_name][priority]) == 0:
+                    del self._registered[hook_name][priority]
 
-            # Try to remove hook if there are no more under this dict
-            if len(self._registered[hook_name]) == 0:
-                del self._registered[hook_name]
+                # Try to remove hook if there are no more under this dict
+                if len(self._registered[hook_name]) == 0:
+                    del self._registered[hook_name]
 
             return True
         except:
@@ -106,11 +138,12 @@ class Hooks():
             hook_name = str(hook_name)
             
             # Try to remove priority if there are no more under this dict, otherwise remove whole dict
-            if priority is not None:
-                priority = int(priority)
-                del self._registered[hook_name][priority]
-            else:
-                del self._registered[hook_name]
+            with self._lock:
+                if priority is not None:
+                    priority = int(priority)
+                    del self._registered[hook_name][priority]
+                else:
+                    del self._registered[hook_name]
 
             return True
         except:
@@ -137,17 +170,18 @@ class Hooks():
         except:
             return False
 
-        if hook_name in self._registered:
-            if priority is None:
-                return True
-            elif priority in self._registered[hook_name]:
-                if callback is None:
+        with self._lock:
+            if hook_name in self._registered:
+                if priority is None:
                     return True
-                else:
-                    if callback in self._registered[hook_name][priority]:
+                elif priority in self._registered[hook_name]:
+                    if callback is None:
                         return True
+                    else:
+                        if callback in self._registered[hook_name][priority]:
+                            return True
+                        return False
+                else:
                     return False
             else:
                 return False
-        else:
-            return False
@@ -1,19 +1,47 @@
-
 # Import the local functions that are only used for docstring validation
-from src.parse_docstring_functions.get_description import get_description
-from src.parse_docstring_functions.get_authors import get_authors
-from src.parse_docstring_functions.get_copyright import get_copyright
-from src.parse_docstring_functions.get_deprecated import get_deprecated
-from src.parse_docstring_functions.get_examples import get_examples
-from src.parse_docstring_functions.get_global import get_global
-from src.parse_docstring_functions.get_ignore import get_ignore
-from src.parse_docstring_functions.get_license import get_license
-from src.parse_docstring_functions.get_memberof import get_memberof
-from src.parse_docstring_functions.get_namespaces import get_namespaces
-from src.parse_docstring_functions.get_parameters import get_parameters
-from src.parse_docstring_functions.get_private import get_private
-from src.parse_docstring_functions.get_returns import get_returns
-from src.parse_docstring_functions.get_since import get_since
-from src.parse_docstring_functions.get_throws import get_throws
-from src.parse_docstring_functions.get_todo import get_todo
-from src.parse_docstring_functions.get_version import get_version
\ No newline at end of file
+from src.parse_docstring_functions.get_description import get_description, handle_description
+from src.parse_docstring_functions.get_authors import get_authors, handle_authors
+from src.parse_docstring_functions.get_copyright import get_copyright, handle_copyright
+from src.parse_docstring_functions.get_deprecated import get_deprecated, handle_deprecated
+from src.parse_docstring_functions.get_examples import get_examples, handle_examples
+from src.parse_docstring_functions.get_global import get_global, handle_global
+from src.parse_docstring_functions.get_ignore import get_ignore, handle_ignore
+from src.parse_docstring_functions.get_license import get_license, handle_license
+from src.parse_docstring_functions.get_memberof import get_memberof, handle_memberof
+from src.parse_docstring_functions.get_namespaces import get_namespaces, handle_namespaces
+from src.parse_docstring_functions.get_parameters import get_parameters, check_parameters, handle_parameters
+from src.parse_docstring_functions.get_private import get_private, handle_private
+from src.parse_docstring_functions.get_returns import get_returns, handle_returns
+from src.parse_docstring_functions.get_since import get_since, handle_since
+from src.parse_docstring_functions.get_throws import get_throws, check_throws, handle_throws
+from src.parse_docstring_functions.get_todo import get_todo, handle_todo
+from src.parse_docstring_functions.get_version import get_version, handle_version
+
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, tokenize_docstring
+
+# Each parsed docstring key, the tag that owns it, and the handler that reads that tag's blocks (Alphabetical Order)
+TAG_HANDLERS = (
+    ("author", "@author", handle_authors),
+    ("copyright", "@copyright", handle_copyright),
+    ("deprecated", "@deprecated", handle_deprecated),
+    ("examples", "@example", handle_examples),
+    ("global", "@global", handle_global),
+    ("ignore", "@ignore", handle_ignore),
+    ("license", "@license", handle_license),
+    ("memberof", "@memberof", handle_memberof),
+    ("namespaces", "@namespace", handle_namespaces),
+    ("parameters", "@param", handle_parameters),
+    ("private", "@private", handle_private),   # If False, implicitly makes this a public module
+    ("returns", "@returns", handle_returns),
+    ("since", "@since", handle_since),
+    ("throws", "@throws", handle_throws),
+    ("todo", "@todo", handle_todo),
+    ("version", "@version", handle_version)
+)
+
+# Handlers that can reject a malformed docstring, mapped to a quick check that raises the same error. Parsed docstrings
+#   only run handlers when something reads their tag, so these checks run up front to keep raising while parsing.
+TAG_CHECKS = {
+    handle_parameters: check_parameters,
+    handle_throws: check_throws
+}
@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, tokenize_docstring
+
 def get_authors(docstring: str) -> list[dict[str | None, str | None]] | None:
     """
         Goes through the docstring and looks for authors annotated by the `@author` tag. You can add as many of these
@@ -16,14 +18,17 @@ def get_authors(docstring: str) -> list[dict[str | None, str | None]] | None:
             - Returns: `{"name": None, "email": "john.doe@somedomain.com"}`
     """
 
-    parsed = docstring.splitlines()
+    return handle_authors(tokenize_docstring(docstring)[1].get("@author", []))
+
+def handle_authors(blocks: list[DocstringBlock]) -> list[dict[str | None, str | None]] | None:
+    """ Reads the `@author` blocks of a tokenized docstring. @see get_authors"""
 
     authors = []
     author_name = ""
     author_email = ""
 
-    for line in parsed:
-        stripped_line = line.strip()
+    for block in blocks:
+        stripped_line = block.header
 
         if stripped_line[0:8] == "@author ":
             # We have encountered a new author, start recording the info
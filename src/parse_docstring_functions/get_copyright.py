@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, join_paragraph_lines, tokenize_docstring
+
 def get_copyright(docstring: str) -> list[str] | None:
     """
         Goes through the docstring and looks for any `@copyright` tags. It returns either an array of all the tags
@@ -6,50 +8,26 @@ def get_copyright(docstring: str) -> list[str] | None:
         - `@copyright 2022 John Doe. All rights reserved.`
     """
 
-    parsed = docstring.splitlines()
+    return handle_copyright(tokenize_docstring(docstring)[1].get("@copyright", []))
 
-    desc = ""
-    record_desc = False # Used as a flag to tell if in the process of recording a block of description text
-    copyrights = []
+def handle_copyright(blocks: list[DocstringBlock]) -> list[str] | None:
+    """ Reads the `@copyright` blocks of a tokenized docstring. @see get_copyright"""
 
-    for line in parsed:
-        stripped_line = line.strip()
-        
-        if stripped_line[0:11] == "@copyright ":
-            # Start a new @copyright check. Only the last @returns should work, so no check if we've already found one 
-            if desc != "":
-                # We were in the middle of parsing another copyright tag, add this one before continuing
-                copyrights.append(desc.strip("\n"))
+    copyrights = []
 
-            desc = desc.strip()
-            record_desc = True
-            
-            # We have encountered a new return description, start recording the info
-            desc = stripped_line[11:len(stripped_line)]
+    for block in blocks:
+        if block.header[0:11] != "@copyright ":
             continue
 
-        if desc != "" and stripped_line[0:1] == "@" and record_desc:
-            # Already started parsing a parameter, but now encountering a new tag
-            desc = desc.strip()
-            copyrights.append(desc.strip("\n"))
+        # Have found a copyright tag, and its description may have spilled on to other lines
+        desc = join_paragraph_lines(block.header[11:len(block.header)], block.lines)
 
-            desc = ""
-            record_desc = False
-            continue
-
-        if desc != "" and record_desc:
-            # Have found a returns tag already, and now its description has spilled on to another line
-            if stripped_line == "": # Add a paragraph break
-                desc += "\n"
-            elif desc[-1:] == "\n": # Do not add an extra space for new paragraphs.
-                desc += stripped_line
-            else:
-                desc += " " + stripped_line
-
-    if desc != "":   # If trying to .strip() the value 'None', then it will throw an error.
-        desc.strip()
+        following = block.next
+        if following is not None and following.header[0:11] != "@copyright ":
+            # Ended by a different tag rather than another copyright or the end of the docstring
+            desc = desc.strip()
         copyrights.append(desc.strip("\n"))
-    
+
     if len(copyrights) > 0:
         return copyrights
     return None
@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, join_paragraph_lines, tokenize_docstring
+
 def get_deprecated(docstring: str) -> bool | str:
     """
         Goes through the docstring and looks for the final deprecation value annotated by a `@deprecated` tag.
@@ -11,40 +13,22 @@ def get_deprecated(docstring: str) -> bool | str:
         - `@deprecated This was deprecated in v1.5.2 because it was superceded by a newer function.`
     """
 
-    parsed = docstring.splitlines()
+    return handle_deprecated(tokenize_docstring(docstring)[1].get("@deprecated", []))
+
+def handle_deprecated(blocks: list[DocstringBlock]) -> bool | str:
+    """ Reads the `@deprecated` blocks of a tokenized docstring. @see get_deprecated"""
 
     desc = ""
-    record_desc = False # Used as a flag to tell if in the process of recording a block of description text
     found_deprecated = False
 
-    for line in parsed:
-        stripped_line = line.strip()
-        
-        if stripped_line[0:11] == "@deprecated":
-            # Start a new @deprecated check.
-            # Only the last @deprecated should work, so no need to check if we've already found one 
-            desc = desc.strip()
-            record_desc = True
+    for block in blocks:
+        if block.header[0:11] == "@deprecated":
+            # Only the last @deprecated should work, so no need to check if we've already found one
             found_deprecated = True
-            
-            # We have encountered a new deprecated description, start recording the info
-            desc = stripped_line[11:len(stripped_line)]
-            continue
-
-        if desc != "" and stripped_line[0:1] == "@" and record_desc:
-            # Already started parsing a deprecation string, but now encountering a new tag
-            desc = desc.strip()
-            record_desc = False
-            continue
-
-        if desc != "" and record_desc:
-            # Have found a deprecated tag already, and now its description has spilled on to another line
-            if stripped_line == "": # Add a paragraph break
-                desc += "\n"
-            elif desc[-1:] == "\n": # Do not add an extra space for new paragraphs.
-                desc += stripped_line
-            else:
-                desc += " " + stripped_line
+            desc = block.header[11:len(block.header)]
+            if desc != "":
+                # Its description may have spilled on to other lines
+                desc = join_paragraph_lines(desc, block.lines)
 
     if desc != "":   # If trying to .strip() the value 'None', then it will throw an error.
         return desc.strip()
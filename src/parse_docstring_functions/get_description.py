@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import tokenize_docstring
+
 def get_description(docstring: str) -> str | None:
     """
         Parses the docstring up to the end of the description (either the first line that has a tag as indicated by the
@@ -11,36 +13,35 @@ def get_description(docstring: str) -> str | None:
 
         If there is no description, it will return `None`.
     """
-    
-    parsed = docstring.splitlines()
 
-    def find_description_end() -> int:
-        """Searches the docstring and finds which the first tag. The line before is where the description ends."""
-        i = 0
-        for line in parsed:
-            this_line = line.strip()
-            if this_line[0:1] == "@":
-                return i
-            i += 1
-        
-        return i # No tags found, the entire thing is the description
+    return handle_description(tokenize_docstring(docstring)[0])
 
-    parsed_desc = ""
+def handle_description(lines: list[str]) -> str | None:
+    """ Formats the stripped description lines of a tokenized docstring. @see get_description"""
+
+    # Collect the pieces and join them once at the end, so long descriptions stay linear. Every piece has at least one
+    #   character, so the description is empty until the first piece and only the last piece decides how it ends.
+    pieces = []
+    last_character = ""
     
-    for i in range(0, find_description_end()):
-        if parsed_desc != "" and parsed[i].strip() == "":   # Make sure the opening doesn't have a carriage returns
-            parsed_desc += "\n"
-        elif parsed_desc[-1:] == "\n":  # No spaces after new lines
-            parsed_desc += parsed[i].strip()
-        elif parsed[i].strip()[0:2] == "- ": # Bulleted (i.e. unordered) lists
-                parsed_desc += "\n" + parsed[i].strip()
-        elif parsed[i].strip()[0:4] == "<ul>": # Bulleted (i.e. unordered) lists using <ul> code
-            parsed_desc += "\n- " + parsed[i].strip()[4:len(parsed[i].strip())]
-        elif parsed[i].strip()[0:4] == "<ol>": # Numbered (i.e. ordered) lists
-            parsed_desc += "\n" + parsed[i].strip()[4:len(parsed[i].strip())]
+    for stripped_line in lines:
+        if pieces and stripped_line == "":   # Make sure the opening doesn't have a carriage returns
+            piece = "\n"
+        elif last_character == "\n":  # No spaces after new lines
+            piece = stripped_line
+        elif stripped_line[0:2] == "- ": # Bulleted (i.e. unordered) lists
+                piece = "\n" + stripped_line
+        elif stripped_line[0:4] == "<ul>": # Bulleted (i.e. unordered) lists using <ul> code
+            piece = "\n- " + stripped_line[4:len(stripped_line)]
+        elif stripped_line[0:4] == "<ol>": # Numbered (i.e. ordered) lists
+            piece = "\n" + stripped_line[4:len(stripped_line)]
         else:   # continue the sentence from the interrupted paragraph with a space separator
-            parsed_desc += " " + parsed[i].strip()
+            piece = " " + stripped_line
+
+        pieces.append(piece)
+        last_character = piece[-1]
     
-    if parsed_desc.strip() == "":
+    parsed_desc = "".join(pieces).strip()
+    if parsed_desc == "":
         return None
-    return parsed_desc.strip()
+    return parsed_desc
@@ -1,5 +1,7 @@
 import re
 
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, tokenize_docstring
+
 def get_examples(docstring: str) -> list[dict[str | None, str]] | None:
     """
         Goes through the docstring and looks for examples annotated by the `@example` tag.
@@ -18,53 +20,51 @@ def get_examples(docstring: str) -> list[dict[str | None, str]] | None:
         will ignore that partiucular tag.
     """
 
-    parsed = docstring.splitlines()
+    return handle_examples(tokenize_docstring(docstring)[1].get("@example", []))
 
-    examples = []
+def handle_examples(blocks: list[DocstringBlock]) -> list[dict[str | None, str]] | None:
+    """ Reads the `@example` blocks of a tokenized docstring. @see get_examples"""
 
-    code_block = None
-    caption = ""
-    code_offset = 0
+    examples = []
 
     def add_example(code: str, capt: str) -> None:
         """
             Adds the example code dictionary to the examples list.
             Can have multiple examples, and each can be the exact same if desired.
         """
-        nonlocal code_block
-
         if capt == "":
             capt = None
         if code.strip('\n') == "":
-            return None # Empty code examples are meaningless
+            return # Empty code examples are meaningless
 
         examples.append({"caption": capt, "code": code.strip('\n')})
-        code_block = None
-
-    for line in parsed:
 
-        if line.strip()[0:8] == "@example":
-            if code_block is not None:
-                # Previous example code block complete, about to start a new one
-                add_example(code_block, caption)
+    def read_code(block: DocstringBlock, code_offset: int) -> list[str]:
+        """Cuts the continuation lines of a block off at the example's indentation."""
+        return [line[code_offset:len(line)] for line in block.raw_lines]
 
-            # We have encountered a new example, start recording the info
-            code_offset = re.search("@example", line).start()    # How many white spaces exist before the @example tag
-            code_block = ""
-
-            caption = line.strip()[9:len(line)]
-            continue
-
-        if code_block is not None and line.strip()[0:1] != "@":
-            code_block += line[code_offset:len(line)] + "\n"
+    for block in blocks:
+        line = block.line
+        if block.header[0:8] != "@example":
             continue
 
-        if code_block is not None and line.strip()[0:1] == "@":  
-            # Already started parsing an example block, but now encountering a new tag
-            add_example(code_block, caption)
-
-    if code_block is not None:   # Final catch for examples not added yet
-        add_example(code_block, caption)
+        # We have encountered a new example, start recording the info
+        code_offset = re.search("@example", line).start()    # How many white spaces exist before the @example tag
+        caption = block.header[9:len(line)]
+        code_lines = read_code(block, code_offset)
+
+        # An example without code stays open and keeps recording the lines of the tags that follow it, up until it has
+        #   some code or another example starts. Lines never hold a line break, so any line with a character in it is code.
+        has_code = any(code_lines)
+        following = block.next
+        while not has_code and following is not None and following.header[0:8] != "@example":
+            following_lines = read_code(following, code_offset)
+            code_lines.extend(following_lines)
+            has_code = any(following_lines)
+            following = following.next
+
+        code_lines.append("")   # Every line of code ends with a line break, including the last one
+        add_example("\n".join(code_lines), caption)
 
     if len(examples) > 0:
         return examples
@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, tokenize_docstring
+
 def get_global(docstring: str) -> bool:
     """
         Goes through the docstring and looks for a `@global` tag. This indicates that this should be treated as part of
@@ -6,11 +8,14 @@ def get_global(docstring: str) -> bool:
         If found, it returns `True`. If omitted, it returns `False`.
     """
 
-    parsed = docstring.splitlines()
+    return handle_global(tokenize_docstring(docstring)[1].get("@global", []))
+
+def handle_global(blocks: list[DocstringBlock]) -> bool:
+    """ Reads the `@global` blocks of a tokenized docstring. @see get_global"""
 
-    for line in parsed:
+    for block in blocks:
 
-        if line.strip() == "@global":
+        if block.header == "@global":
             return True
 
     return False
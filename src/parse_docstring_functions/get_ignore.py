@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, tokenize_docstring
+
 def get_ignore(docstring: str) -> bool:
     """
         Goes through the docstring and looks for an `@ignore` tag. This indicates that the generated documentation
@@ -6,11 +8,14 @@ def get_ignore(docstring: str) -> bool:
         If found, it returns `True`. If omitted, it returns `False`.
     """
 
-    parsed = docstring.splitlines()
+    return handle_ignore(tokenize_docstring(docstring)[1].get("@ignore", []))
+
+def handle_ignore(blocks: list[DocstringBlock]) -> bool:
+    """ Reads the `@ignore` blocks of a tokenized docstring. @see get_ignore"""
 
-    for line in parsed:
+    for block in blocks:
 
-        if line.strip() == "@ignore":
+        if block.header == "@ignore":
             return True
     
     return False
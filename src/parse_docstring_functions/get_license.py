@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, join_paragraph_lines, tokenize_docstring
+
 def get_license(docstring: str) -> dict[str | None, str | None] | None:
     """
         Goes through the docstring and looks for the final license value annotated by a `@license` tag.
@@ -17,40 +19,19 @@ def get_license(docstring: str) -> dict[str | None, str | None] | None:
         - ```
     """
 
-    parsed = docstring.splitlines()
+    return handle_license(tokenize_docstring(docstring)[1].get("@license", []))
+
+def handle_license(blocks: list[DocstringBlock]) -> dict[str | None, str | None] | None:
+    """ Reads the `@license` blocks of a tokenized docstring. @see get_license"""
 
     text = ""
-    record_text = False # Used as a flag to tell if in the process of recording a block of description text
     license_name = ""
 
-    for line in parsed:
-        stripped_line = line.strip()
-
-        if stripped_line[0:8] == "@license":
-            # Start a new @license check.
-            # Only the last @license should work, so no need to check if we've already found one 
-            text = text.strip()
-            record_text = True
-
-            # We have encountered a new license description, start recording the info
-            text = ""
-            license_name = line.strip()[9:len(line)]
-            continue
-
-        if stripped_line[0:1] == "@" and record_text:
-            # Already started parsing a deprecation string, but now encountering a new tag
-            text = text.strip()
-            record_text = False
-            continue
-
-        if record_text:
-            # Have found a license tag already, and now its description has spilled on to another line
-            if stripped_line == "": # Add a paragraph break
-                text += "\n"
-            elif text[-1:] == "\n": # Do not add an extra space for new paragraphs.
-                text += stripped_line
-            else:
-                text += " " + stripped_line
+    for block in blocks:
+        if block.header[0:8] == "@license":
+            # Only the last @license should work, so no need to check if we've already found one
+            license_name = block.header[9:len(block.line)]
+            text = join_paragraph_lines("", block.lines)
 
     text = text.strip()
     if text == "":
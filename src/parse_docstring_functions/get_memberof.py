@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, tokenize_docstring
+
 def get_memberof(docstring: str) -> list[str] | None:
     """
     Goes through the docstring and looks for the `@memberof` tag.
@@ -12,19 +14,24 @@ def get_memberof(docstring: str) -> list[str] | None:
     - `@memberof Tools.Wrenches`
     """
 
-    parsed = docstring.splitlines()
+    return handle_memberof(tokenize_docstring(docstring)[1].get("@memberof", []))
+
+def handle_memberof(blocks: list[DocstringBlock]) -> list[str] | None:
+    """ Reads the `@memberof` blocks of a tokenized docstring. @see get_memberof"""
 
     membersof = []
+    seen = set()    # Checking the list itself for every member would be quadratic
 
-    for line in parsed:
-        stripped_line = line.strip()
+    for block in blocks:
+        stripped_line = block.header
 
         if stripped_line[0:10] == "@memberof ":
 
-            member = stripped_line[10:len(line)].strip()
+            member = stripped_line[10:len(block.line)].strip()
 
             if member.isidentifier():
-                if member not in membersof:  # Only add unique members
+                if member not in seen:  # Only add unique members
+                    seen.add(member)
                     membersof.append(member)
             continue
 
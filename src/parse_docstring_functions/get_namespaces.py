@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, join_paragraph_lines, tokenize_docstring
+
 def get_namespaces(docstring: str) -> list[dict[str, str | None]] | None:
     """
     Goes through the docstring and looks for namespaces annotated by the `@namespace` tag.
@@ -15,10 +17,11 @@ def get_namespaces(docstring: str) -> list[dict[str, str | None]] | None:
         - Returns: {"name": "Tools.Wrenches", "description": None}
     """
 
-    parsed = docstring.splitlines()
+    return handle_namespaces(tokenize_docstring(docstring)[1].get("@namespace", []))
+
+def handle_namespaces(blocks: list[DocstringBlock]) -> list[dict[str, str | None]] | None:
+    """ Reads the `@namespace` blocks of a tokenized docstring. @see get_namespaces"""
 
-    description = None
-    namespace = ""
     namespaces = []
 
     def add_namespace(name: str, desc: str) -> None:
@@ -27,8 +30,6 @@ def get_namespaces(docstring: str) -> list[dict[str, str | None]] | None:
             Can have multiple namespaces, and each can be the exact same if desired.
             Repeated namespaces will get handled in later documentation generating.
         """
-        nonlocal description
-
         if desc is not None:
             desc = desc.strip('\n').strip()
         if desc == "":
@@ -38,37 +39,13 @@ def get_namespaces(docstring: str) -> list[dict[str, str | None]] | None:
 
         if name.isidentifier(): # Namespaces must follow Python variable name validation rules
             namespaces.append({"name": name, "description": desc})
-        description = None
 
-    for line in parsed:
-        stripped_line = line.strip()
+    for block in blocks:
+        stripped_line = block.header
 
         if stripped_line[0:11] == "@namespace ":
-            if description is not None:
-                # Previous namespace description complete, about to start a new one
-                add_namespace(namespace, description)
-
-            # We have encountered a new namespace, start recording the info
-            description = ""
-
-            namespace = stripped_line[11:len(line)]
-            continue
-
-        if description is not None and stripped_line[0:1] != "@":
-            if stripped_line == "": # Add a paragraph break
-                description += "\n"
-            elif description[-1:] == "\n": # Do not add an extra space for new paragraphs.
-                description += stripped_line
-            else:
-                description += " " + stripped_line
-            continue
-
-        if description is not None and stripped_line[0:1] == "@":
-            # Already started parsing a namespace, but now encountering a new tag
-            add_namespace(namespace, description)
-
-    if description is not None:   # Final catch for namespaces not added yet
-        add_namespace(namespace, description)
+            # We have encountered a new namespace, its description is everything up to the next tag
+            add_namespace(stripped_line[11:len(block.line)], join_paragraph_lines("", block.lines))
 
     if len(namespaces) > 0:
         return namespaces
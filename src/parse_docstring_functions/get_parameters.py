@@ -1,5 +1,7 @@
 import re
 
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, join_paragraph_lines, tokenize_docstring
+
 def get_parameters(docstring: str) -> list[dict[str]] | None:
     """
         Goes through the docstring and looks for parameters annotated by the `@param` tag.
@@ -12,60 +14,62 @@ def get_parameters(docstring: str) -> list[dict[str]] | None:
             - Returns: `{"MyParam": "This is my parameter description."}`
     """
 
-    parsed = docstring.splitlines()
+    return handle_parameters(tokenize_docstring(docstring)[1].get("@param", []))
+
+def check_parameters(blocks: list[DocstringBlock]) -> None:
+    """ Raises the same error `handle_parameters` would for a parameter without a description after its name, without
+        reading the rest of the blocks. This lets a malformed `@param` fail while parsing even if nothing ever reads the
+        tag.
+
+        @throws [AttributeError] If a `@param` tag is missing its name or its description
+    """
+    for block in blocks:
+        if block.header[0:7] == "@param " and re.search("[A-Za-z0-9] ", block.header[8:]) is None:
+            raise AttributeError(f"The @param tag is missing its name or description: {block.header}")
+
+def handle_parameters(blocks: list[DocstringBlock]) -> list[dict[str]] | None:
+    """ Reads the `@param` blocks of a tokenized docstring. @see get_parameters"""
 
     parameters = []
-    parameter_name = ""
-    parameter_description = ""
+    parameters_by_name = {}     # The first parameter recorded under each name, so finding one never scans the list
 
     def add_parameter(name:str, desc: str) -> None:
         """
             Adds the parameter and description to the parameters list.
             If the parameter was already added, it was overwrites it.
         """
-        nonlocal parameter_name
-        nonlocal parameter_description
+        if name in parameters_by_name:
+            parameters_by_name[name][name] = desc.strip()
+            return
 
-        for param in parameters:
-            if name in param:
-                param[name] = parameter_description.strip()
-                return
+        param = {name.strip(): desc.strip()}
+        parameters.append(param)
+        parameters_by_name.setdefault(name.strip(), param)
 
-        parameters.append({name.strip(): desc.strip()})
-        parameter_name = ""
-        parameter_description = ""
+    for block in blocks:
+        stripped_line = block.header
 
-    for line in parsed:
-        stripped_line = line.strip()
-
-        if stripped_line[0:7] == "@param ":
-            if parameter_name != "":
-                # Previous parameter complete, about to start a new one
-                add_parameter(parameter_name, parameter_description)
+        if stripped_line[0:7] != "@param ":
+            continue
 
-            # We have encountered a new parameter, start recording the info
-            end_of_param_name = re.search("[A-Za-z0-9] ", stripped_line[8:len(stripped_line)]).end()
+        # We have encountered a new parameter, start recording the info
+        end_of_param_name = re.search("[A-Za-z0-9] ", stripped_line[8:len(stripped_line)])
+        if end_of_param_name is None:
+            raise AttributeError(f"The @param tag is missing its name or description: {stripped_line}")
+        end_of_param_name = end_of_param_name.end()
 
-            parameter_name = stripped_line[7:7 + end_of_param_name]
-            parameter_description = stripped_line[8 + end_of_param_name:len(stripped_line)]
-            continue
+        parameter_name = stripped_line[7:7 + end_of_param_name]
+        parameter_description = stripped_line[8 + end_of_param_name:len(stripped_line)]
+        description_lines = block.lines
 
-        if parameter_name != "" and stripped_line[0:1] == "@":  
-            # Already started parsing a parameter, but now encountering a new tag
-            add_parameter(parameter_name, parameter_description)
-            continue
+        if parameter_name in parameters_by_name:
+            # An overwritten parameter keeps recording the lines of the tags that follow it, up until the next parameter
+            following = block.next
+            while following is not None and following.header[0:7] != "@param ":
+                description_lines.extend(following.lines)
+                following = following.next
 
-        if parameter_name != "":
-            # Have found a parameter already, and now its description has spilled on to another line
-            if stripped_line == "": # Add a paragraph break
-                parameter_description += "\n"
-            elif parameter_description[-1:] == "\n": # Do not add an extra space for new paragraphs.
-                parameter_description += stripped_line
-            else:
-                parameter_description += " " + stripped_line
-
-    if parameter_name != "":   # Final catch for parameters not added yet
-        add_parameter(parameter_name, parameter_description)
+        add_parameter(parameter_name, join_paragraph_lines(parameter_description, description_lines))
 
     if len(parameters) > 0:
         return parameters
@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, tokenize_docstring
+
 def get_private(docstring: str) -> bool:
     """
         Goes through the docstring and looks for a `@private` tag. This indicates that this object should be treated as
@@ -6,14 +8,17 @@ def get_private(docstring: str) -> bool:
         If found, it returns `True`. If omitted, it returns `False`.
     """
 
-    parsed = docstring.splitlines()
+    return handle_private(tokenize_docstring(docstring)[1].get("@private", []))
+
+def handle_private(blocks: list[DocstringBlock]) -> bool:
+    """ Reads the `@private` blocks of a tokenized docstring. @see get_private"""
 
     # Note: Because the parser assumes public by default and private takes precedence over public, there is no need
     #   for an additional @public tag search. Lack of a @private tag indicates it is public.
 
-    for line in parsed:
+    for block in blocks:
 
-        if line.strip() == "@private":
+        if block.header == "@private":
             return True
 
     return False
@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, join_paragraph_lines, tokenize_docstring
+
 def get_returns(docstring: str) -> str | None:
     """
         Goes through the docstring and looks for the description of the return value annotated by the `@returns` tag.
@@ -10,37 +12,17 @@ def get_returns(docstring: str) -> str | None:
             - Returns: `"This is a description of what the return value does"`
     """
 
-    parsed = docstring.splitlines()
+    return handle_returns(tokenize_docstring(docstring)[1].get("@returns", []))
+
+def handle_returns(blocks: list[DocstringBlock]) -> str | None:
+    """ Reads the `@returns` blocks of a tokenized docstring. @see get_returns"""
 
     desc = ""
-    record_desc = False # Used as a flag to tell if in the process of recording a block of description text
-
-    for line in parsed:
-        stripped_line = line.strip()
-
-        if stripped_line[0:9] == "@returns ":
-            # Start a new @returns check. Only the last @returns should work, so no check if we've already found one 
-            desc = desc.strip()
-            record_desc = True
-            
-            # We have encountered a new return description, start recording the info
-            desc = stripped_line[9:len(stripped_line)]
-            continue
-
-        if desc != "" and stripped_line[0:1] == "@" and record_desc:
-            # Already started parsing a parameter, but now encountering a new tag
-            desc = desc.strip()
-            record_desc = False
-            continue
-
-        if desc != "" and record_desc:
-            # Have found a returns tag already, and now its description has spilled on to another line
-            if stripped_line == "": # Add a paragraph break
-                desc += "\n"
-            elif desc[-1:] == "\n": # Do not add an extra space for new paragraphs.
-                desc += stripped_line
-            else:
-                desc += " " + stripped_line
+
+    for block in blocks:
+        if block.header[0:9] == "@returns ":
+            # Only the last @returns should work, so no check if we've already found one
+            desc = join_paragraph_lines(block.header[9:len(block.header)], block.lines)
 
     if desc != "":   # If trying to .strip() the value 'None', then it will throw an error.
         return desc.strip()
@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, join_paragraph_lines, tokenize_docstring
+
 def get_since(docstring: str) -> str | None:
     """
         Goes through the docstring and looks for the final since value annotated by a `@since` tag.
@@ -9,39 +11,21 @@ def get_since(docstring: str) -> str | None:
         - `@since v1.2.2`
             - Returns: `"v1.2.2"`
     """
+
+    return handle_since(tokenize_docstring(docstring)[1].get("@since", []))
+
+def handle_since(blocks: list[DocstringBlock]) -> str | None:
+    """ Reads the `@since` blocks of a tokenized docstring. @see get_since"""
+
     desc = ""
 
-    parsed = docstring.splitlines()
-
-    record_desc = False # Used as a flag to tell if in the process of recording a block of description text
-
-    for line in parsed:
-        stripped_line = line.strip()
-        
-        if stripped_line[0:6] == "@since":
-            # Start a new @since check.
-            # Only the last @since should work, so no need to check if we've already found one 
-            desc = desc.strip()
-            record_desc = True
-            
-            # We have encountered a new since description, start recording the info
-            desc = stripped_line[6:len(stripped_line)]
-            continue
-
-        if desc != "" and stripped_line[0:1] == "@" and record_desc:
-            # Already started parsing a since string, but now encountering a new tag
-            desc = desc.strip()
-            record_desc = False
-            continue
-
-        if desc != "" and record_desc:
-            # Have found a since tag already, and now its description has spilled on to another line
-            if stripped_line == "": # Add a paragraph break
-                desc += "\n"
-            elif desc[-1:] == "\n": # Do not add an extra space for new paragraphs.
-                desc += stripped_line
-            else:
-                desc += " " + stripped_line
+    for block in blocks:
+        if block.header[0:6] == "@since":
+            # Only the last @since should work, so no need to check if we've already found one
+            desc = block.header[6:len(block.header)]
+            if desc != "":
+                # Its description may have spilled on to other lines
+                desc = join_paragraph_lines(desc, block.lines)
 
     if desc != "":   # If trying to .strip() the value 'None', then it will throw an error.
         return desc.strip()
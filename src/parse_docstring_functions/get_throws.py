@@ -1,5 +1,7 @@
 import re
 
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, join_paragraph_lines, tokenize_docstring
+
 def get_throws(docstring: str) -> list[dict[str | None, str | None]] | None:
     """
         Goes through the docstring and looks for exceptions annotated by the `@throws` tag.
@@ -19,20 +21,28 @@ def get_throws(docstring: str) -> list[dict[str | None, str | None]] | None:
             - Returns: `{"type": "MyCustomErrorType", "description": "A description of what would have caused this error"}`
     """
 
-    parsed = docstring.splitlines()
+    return handle_throws(tokenize_docstring(docstring)[1].get("@throws", []))
+
+def check_throws(blocks: list[DocstringBlock]) -> None:
+    """ Raises the same error `handle_throws` would for a type that is missing its closing bracket, without reading the
+        rest of the blocks. This lets a malformed `@throws` fail while parsing even if nothing ever reads the tag.
+
+        @throws [AttributeError] If a `@throws` type is missing its closing bracket
+    """
+    for block in blocks:
+        if block.header[0:9] == "@throws [" and "]" not in block.header[8:]:
+            raise AttributeError(f"The @throws type is missing its closing bracket: {block.header}")
+
+def handle_throws(blocks: list[DocstringBlock]) -> list[dict[str | None, str | None]] | None:
+    """ Reads the `@throws` blocks of a tokenized docstring. @see get_throws"""
 
     throws = []
-    error_type = None
-    error_description = None
 
     def add_throw(type:str, desc: str) -> None:
         """
             Adds the error name and description to the throws list.
             Can have multiple errors of the same type and description.
         """
-        nonlocal error_type
-        nonlocal error_description
-
         if type is not None:
             type = type.strip() # Trying to strip None causes an error. This is only needed if an error type given
 
@@ -40,47 +50,31 @@ def get_throws(docstring: str) -> list[dict[str | None, str | None]] | None:
             desc = desc.strip()
 
         throws.append({"type": type, "description": desc})
-        error_type = None
-        error_description = None
-
-    for line in parsed:
-        stripped_line = line.strip()
-
-        if stripped_line[0:8] == "@throws ":
-            if error_description is not None or error_type is not None:
-                # Previous parameter complete, about to start a new one
-                add_throw(error_type, error_description)
-            
-            # We have encountered a new parameter, start recording the info
-            if stripped_line[8:9] == "[":
-                end_of_throw_type = re.search("]", stripped_line[8:len(stripped_line)]).end()
-
-                error_type = stripped_line[9:7 + end_of_throw_type]
-                error_description = stripped_line[8 + end_of_throw_type:len(stripped_line)]
-                if error_description == "":
-                    error_description = None
-            else:
-                error_type = None
-                error_description = stripped_line[8:len(stripped_line)]
-            continue
 
-        if (error_description is not None  or error_type is not None) and stripped_line[0:1] == "@":  
-            # Already started parsing a parameter, but now encountering a new tag
-            add_throw(error_type, error_description)
+    for block in blocks:
+        stripped_line = block.header
+
+        if stripped_line[0:8] != "@throws ":
             continue
 
+        # We have encountered a new exception, start recording the info
+        if stripped_line[8:9] == "[":
+            end_of_throw_type = re.search("]", stripped_line[8:len(stripped_line)]).end()
+
+            error_type = stripped_line[9:7 + end_of_throw_type]
+            error_description = stripped_line[8 + end_of_throw_type:len(stripped_line)]
+            if error_description == "":
+                error_description = None
+        else:
+            error_type = None
+            error_description = stripped_line[8:len(stripped_line)]
+
+        if error_description is not None:
+            # Its description may have spilled on to other lines
+            error_description = join_paragraph_lines(error_description, block.lines)
+
         if error_description is not None or error_type is not None:
-            # Have found a parameter already, and now its description has spilled on to another line
-            if error_description is not None:
-                if stripped_line == "": # Add a paragraph break
-                    error_description += "\n"
-                elif error_description[-1:] == "\n": # Do not add an extra space for new paragraphs.
-                    error_description += stripped_line
-                else:
-                    error_description += " " + stripped_line
-
-    if error_description is not None or error_type is not None:   # Final catch for parameters not added yet
-        add_throw(error_type, error_description)
+            add_throw(error_type, error_description)
 
     if len(throws) > 0:
         return throws
@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, join_paragraph_lines, tokenize_docstring
+
 def get_todo(docstring: str) -> list[str] | None:
     """
         Goes through the docstring and looks for any `@todo` tags. It returns a list of strings with all the tags
@@ -7,48 +9,24 @@ def get_todo(docstring: str) -> list[str] | None:
         - `@todo A description of some stuff to add in later`
     """
 
-    parsed = docstring.splitlines()
+    return handle_todo(tokenize_docstring(docstring)[1].get("@todo", []))
 
-    desc = ""
-    record_desc = False # Used as a flag to tell if in the process of recording a block of description text
-    todo_array = []
+def handle_todo(blocks: list[DocstringBlock]) -> list[str] | None:
+    """ Reads the `@todo` blocks of a tokenized docstring. @see get_todo"""
 
-    for line in parsed:
-        stripped_line = line.strip()
-        
-        if stripped_line[0:6] == "@todo ":
-            # Start a new @todo check. Only the last @returns should work, so no check if we've already found one 
-            if desc != "":
-                # We were in the middle of parsing another todo tag, add this one before continuing
-                todo_array.append(desc.strip("\n"))
+    todo_array = []
 
-            desc = desc.strip()
-            record_desc = True
-            
-            # We have encountered a new return description, start recording the info
-            desc = stripped_line[6:len(stripped_line)]
+    for block in blocks:
+        if block.header[0:6] != "@todo ":
             continue
 
-        if desc != "" and stripped_line[0:1] == "@" and record_desc:
-            # Already started parsing a parameter, but now encountering a new tag
-            desc = desc.strip()
-            todo_array.append(desc.strip("\n"))
-
-            desc = ""
-            record_desc = False
-            continue
+        # Have found a todo tag, and its description may have spilled on to other lines
+        desc = join_paragraph_lines(block.header[6:len(block.header)], block.lines)
 
-        if desc != "" and record_desc:
-            # Have found a returns tag already, and now its description has spilled on to another line
-            if stripped_line == "": # Add a paragraph break
-                desc += "\n"
-            elif desc[-1:] == "\n": # Do not add an extra space for new paragraphs.
-                desc += stripped_line
-            else:
-                desc += " " + stripped_line
-
-    if desc != "":   # If trying to .strip() the value 'None', then it will throw an error.
-        desc.strip()
+        following = block.next
+        if following is not None and following.header[0:6] != "@todo ":
+            # Ended by a different tag rather than another todo or the end of the docstring
+            desc = desc.strip()
         todo_array.append(desc.strip("\n"))
 
     if len(todo_array) > 0:
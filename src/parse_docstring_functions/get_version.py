@@ -1,3 +1,5 @@
+from src.parse_docstring_functions.tokenize_docstring import DocstringBlock, join_paragraph_lines, tokenize_docstring
+
 def get_version(docstring: str) -> str | None:
     """
         Goes through the docstring and looks for the version value of an object as annotated by a `@version` tag.
@@ -10,39 +12,21 @@ def get_version(docstring: str) -> str | None:
             - Returns: `"v1.2.2"`
     """
 
-    parsed = docstring.splitlines()
+    return handle_version(tokenize_docstring(docstring)[1].get("@version", []))
+
+def handle_version(blocks: list[DocstringBlock]) -> str | None:
+    """ Reads the `@version` blocks of a tokenized docstring. @see get_version"""
 
     desc = ""
-    record_desc = False # Used as a flag to tell if in the process of recording a block of description text
     this_tag = "@version"
 
-    for line in parsed:
-        stripped_line = line.strip()
-        
-        if stripped_line[0:len(this_tag)] == this_tag:
-            # Start a new @version check.
-            # Only the last @version should work, so no need to check if we've already found one 
-            desc = desc.strip()
-            record_desc = True
-            
-            # We have encountered a new version description, start recording the info
-            desc = stripped_line[len(this_tag):len(stripped_line)]
-            continue
-
-        if desc != "" and stripped_line[0:1] == "@" and record_desc:
-            # Already started parsing a version string, but now encountering a new tag
-            desc = desc.strip()
-            record_desc = False
-            continue
-
-        if desc != "" and record_desc:
-            # Have found a version tag already, and now its description has spilled on to another line
-            if stripped_line == "": # Add a paragraph break
-                desc += "\n"
-            elif desc[-1:] == "\n": # Do not add an extra space for new paragraphs.
-                desc += stripped_line
-            else:
-                desc += " " + stripped_line
+    for block in blocks:
+        if block.header[0:len(this_tag)] == this_tag:
+            # Only the last @version should work, so no need to check if we've already found one
+            desc = block.header[len(this_tag):len(block.header)]
+            if desc != "":
+                # Its description may have spilled on to other lines
+                desc = join_paragraph_lines(desc, block.lines)
 
     if desc != "":   # If trying to .strip() the value 'None', then it will throw an error.
         return desc.strip()
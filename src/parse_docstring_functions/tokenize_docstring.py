@@ -0,0 +1,128 @@
+BUILT_IN_TAGS = (
+    "@author",
+    "@copyright",
+    "@deprecated",
+    "@example",
+    "@global",
+    "@ignore",
+    "@license",
+    "@memberof",
+    "@namespace",
+    "@param",
+    "@private",
+    "@returns",
+    "@since",
+    "@throws",
+    "@todo",
+    "@version"
+)
+
+# These tags have always matched on the start of the line alone (e.g. `@since` also claims a line reading `@sincev1`).
+#   Unrecognized tags fall back to them so the single pass claims the exact same lines the old per-tag scans did.
+PREFIX_TAGS = ("@deprecated", "@example", "@license", "@since", "@version")
+
+class DocstringBlock():
+    """ A single tag line and every line that follows it up until the next tag or the end of the docstring.
+
+        Blocks are linked in the order they appear in the docstring through `next`, regardless of which tag owns them.
+    """
+    __slots__ = ("tag", "line", "header", "raw_lines", "next")
+
+    def __init__(self, tag: str, line: str, header: str) -> None:
+        self.tag: str = tag                 # The tag that owns this block, e.g. `@param`
+        self.line: str = line               # The tag line exactly as it appears in the docstring
+        self.header: str = header           # The tag line with surrounding whitespace stripped
+        self.raw_lines: list[str] = []      # Continuation lines exactly as they appear in the docstring
+        self.next: DocstringBlock | None = None
+
+    @property
+    def lines(self) -> list[str]:
+        """Continuation lines with surrounding whitespace stripped. These are worked out each time rather than stored."""
+        return [line.strip() for line in self.raw_lines]
+
+def resolve_tag(header: str, known_tags = BUILT_IN_TAGS) -> str:
+    """ Works out which tag owns a stripped tag line.
+
+        @param header A stripped line from the docstring that starts with `@`
+        @param known_tags A container of recognized tag names
+        @returns The owning tag name. Unrecognized tags return their own name.
+    """
+    tag = header.partition(" ")[0]
+    if tag in known_tags:
+        return tag
+    for prefix in PREFIX_TAGS:
+        if header.startswith(prefix):
+            return prefix
+    return tag
+
+def tokenize_docstring(docstring: str, known_tags = BUILT_IN_TAGS) -> tuple[list[str], dict[str, list[DocstringBlock]]]:
+    """
+        Splits a docstring into its description and tag blocks in a single pass over its lines.
+
+        Every line is split and stripped exactly once. Everything before the first line starting with `@` is the
+        description. Each line starting with `@` opens a new block that collects the lines after it until the next tag.
+
+        @param docstring The docstring to split
+        @param known_tags A container of recognized tag names used to work out which tag owns each block
+        @returns A tuple of the stripped description lines, and a dict of blocks grouped by their owning tag in the
+            order they appear
+    """
+
+    description = []
+    blocks = {}
+    previous = None
+    raw_lines = None
+
+    for line in docstring.splitlines():
+        stripped_line = line.strip()
+
+        if stripped_line[0:1] == "@":
+            tag = resolve_tag(stripped_line, known_tags)
+            block = DocstringBlock(tag, line, stripped_line)
+            if previous is not None:
+                previous.next = block
+            previous = block
+
+            if tag in blocks:
+                blocks[tag].append(block)
+            else:
+                blocks[tag] = [block]
+
+            raw_lines = block.raw_lines
+            continue
+
+        if raw_lines is not None:
+            raw_lines.append(line)
+        else:
+            description.append(stripped_line)
+
+    return description, blocks
+
+def join_paragraph_lines(text: str, lines: list[str]) -> str:
+    """
+        Continues a block of tag text with its stripped continuation lines.
+
+        A blank line starts a new paragraph. Any other line continues the previous sentence with a space separator.
+
+        The pieces are collected and joined once at the end, so this stays linear in the size of the text no matter how
+        many lines there are.
+
+        @param text The text already recorded for the block
+        @param lines The stripped lines to add
+        @returns The combined text
+    """
+    pieces = [text]
+    new_paragraph = text[-1:] == "\n"
+
+    for stripped_line in lines:
+        if stripped_line == "": # Add a paragraph break
+            pieces.append("\n")
+            new_paragraph = True
+        elif new_paragraph: # Do not add an extra space for new paragraphs.
+            pieces.append(stripped_line)
+            new_paragraph = False
+        else:
+            pieces.append(" ")
+            pieces.append(stripped_line)
+
+    return "".join(pieces)
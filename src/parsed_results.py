@@ -0,0 +1,377 @@
+def copy_parsed_value(value):
+    """ Copies a parsed docstring value deep enough that changing the copy can never change the original.
+
+        Parsed values are only ever strings, booleans, `None`, flat dicts, or lists of strings or flat dicts, so this is
+        much cheaper than `deepcopy`.
+    """
+    if isinstance(value, list):
+        return [dict(item) if isinstance(item, dict) else item for item in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+def as_plain_dict(value):
+    """Gets a plain `dict` with the same keys and values as a parsed result, or returns anything else unchanged."""
+    if isinstance(value, SparseDict):
+        return value._as_dict()
+    return value
+
+class SparseDict(dict):
+    """ A `dict` that only stores the keys whose value differs from a template shared between many of them, and reads the
+        rest from the template. Keys can also be pending, which means their value only gets worked out the first time
+        something reads it. @see ParsedDocstring
+
+        It is a real `dict`, so `[]`, `.get()`, `in`, iterating, comparing against a plain dict, `json`, and `pickle` all
+        behave the same as for a plain dict with every key stored.
+    """
+    __slots__ = ("_defaults",)
+    _pending: tuple | None = None   # Only parsed docstrings ever have keys pending
+
+    def __init__(self, values: dict | None = None, defaults: dict | None = None) -> None:
+        """
+            @param values The keys to store
+            @param defaults The value of every key that is not stored, in the order the keys should appear. This is
+                shared, so it must never change and its values must be immutable.
+        """
+        super().__init__(values or ())
+        self._defaults: dict | None = defaults
+
+    def _is_pending(self, key: str) -> bool:
+        """Checks if a key still needs working out."""
+        pending = self._pending
+        if pending is not None:
+            for entry in pending:
+                if entry[0] == key:
+                    return True
+        return False
+
+    def _key_list(self) -> list[str]:
+        """Every key in order, without working any of them out."""
+        keys = []
+        defaults = self._defaults
+        if defaults is not None:
+            keys.extend(defaults)
+        for key in list(dict.keys(self)):
+            if defaults is None or key not in defaults:
+                keys.append(key)
+        pending = self._pending
+        if pending:
+            for key, _ in pending:
+                if (defaults is None or key not in defaults) and not dict.__contains__(self, key):
+                    keys.append(key)
+        return keys
+
+    def _as_dict(self) -> dict:
+        """Works out every key and returns them all as a plain `dict`."""
+        return {key: self[key] for key in self._key_list()}
+
+    def _materialize(self) -> None:
+        """Stores every key in the dict itself, so that it behaves exactly like a plain `dict` from then on."""
+        values = self._as_dict()
+        dict.clear(self)
+        dict.update(self, values)
+        self._defaults = None
+
+    def __missing__(self, key: str):
+        if self._is_pending(key):
+            return self._resolve(key)
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)  # Another thread worked it out since looking in the dict
+        if self._defaults is not None and key in self._defaults:
+            return self._defaults[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default = None):
+        """Same as `dict.get`."""
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        try:
+            return self.__missing__(key)
+        except KeyError:
+            return default
+
+    def __contains__(self, key) -> bool:
+        return (
+            dict.__contains__(self, key)
+            or self._is_pending(key)
+            or (self._defaults is not None and key in self._defaults)
+        )
+
+    def __len__(self) -> int:
+        if self._defaults is None and not self._pending:
+            return dict.__len__(self)
+        return len(self._key_list())
+
+    def __bool__(self) -> bool:
+        return bool(self._defaults) or bool(self._pending) or dict.__len__(self) > 0
+
+    def __iter__(self):
+        return iter(self._key_list())
+
+    def __reversed__(self):
+        return reversed(self._key_list())
+
+    def keys(self):
+        """Same as `dict.keys`, except the view does not follow later changes."""
+        return dict.fromkeys(self._key_list()).keys()
+
+    def values(self):
+        """Same as `dict.values`, except it works out every key first and the view does not follow later changes."""
+        return self._as_dict().values()
+
+    def items(self):
+        """Same as `dict.items`, except it works out every key first and the view does not follow later changes."""
+        return self._as_dict().items()
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, dict):
+            return NotImplemented
+        return self._as_dict() == as_plain_dict(other)
+
+    def __ne__(self, other) -> bool:
+        if not isinstance(other, dict):
+            return NotImplemented
+        return self._as_dict() != as_plain_dict(other)
+
+    def __repr__(self) -> str:
+        return repr(self._as_dict())
+
+    def __delitem__(self, key: str) -> None:
+        if self._defaults is not None and key in self._defaults:
+            self._materialize()     # Otherwise the template would bring the key straight back
+        dict.__delitem__(self, key)
+
+    def setdefault(self, key: str, default = None):
+        """Same as `dict.setdefault`."""
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        """Same as `dict.update`."""
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return self._as_dict() | as_plain_dict(other)
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return as_plain_dict(other) | self._as_dict()
+
+    def pop(self, *args):
+        """Same as `dict.pop`."""
+        self._materialize()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        """Same as `dict.popitem`."""
+        self._materialize()
+        return dict.popitem(self)
+
+    def clear(self) -> None:
+        """Same as `dict.clear`."""
+        self._defaults = None
+        dict.clear(self)
+
+class ParsedDocstring(SparseDict):
+    """ A parsed docstring that only stores the tags a docstring actually uses, and only works out each of those the
+        first time something reads it.
+
+        Tags the docstring does not use are read from a template shared by every parsed docstring instead of being
+        stored again. Tags it does use stay pending until something reads them. Until then, the parsed docstring only
+        holds on to the raw docstring and which tags to work out from it, rather than the lines of each tag. Reading a
+        pending tag splits the docstring again, runs the tag's handler, and stores the result.
+    """
+    __slots__ = ("_pending", "_source")
+
+    def __init__(self, values: dict | None = None, pending: tuple | None = None, defaults: dict | None = None,
+            source: "str | ParsedDocstring | None" = None) -> None:
+        """
+            @param values Keys that already have their final value. Any that are also pending get left out.
+            @param pending Keys that still need working out, as a tuple of (key, work) pairs. `work` takes the raw
+                docstring and returns the key's value. The pairs get shared between parsed docstrings.
+            @param defaults The value of every key that is not stored or pending, in the order the keys should appear.
+                This is shared between parsed docstrings, so it must never change and its values must be immutable.
+            @param source The raw docstring the pending keys get worked out from, or another `ParsedDocstring` to copy
+                their values from
+        """
+        super().__init__(values, defaults)
+        self._pending: tuple | None = pending or None
+        self._source: str | ParsedDocstring | None = source if self._pending else None
+
+        if self._pending:
+            for key, _ in self._pending:
+                if dict.__contains__(self, key):
+                    dict.__delitem__(self, key)
+
+    def _resolve(self, key: str):
+        """ Works out a pending key, stores it, and returns its value.
+
+            Cached docstrings and the hidden originals their copies read from get shared between threads, so this stores
+            the value before it stops being pending, and the first value stored wins if two threads work out the same
+            key at once.
+        """
+        entry = None
+        for pending_entry in self._pending or ():
+            if pending_entry[0] == key:
+                entry = pending_entry
+                break
+        source = self._source
+        if entry is None or source is None:
+            return dict.__getitem__(self, key)  # Another thread worked it out in the meantime
+
+        if isinstance(source, ParsedDocstring):
+            value = copy_parsed_value(source[key])
+        else:
+            value = entry[1](source)
+        value = dict.setdefault(self, key, value)
+        self._forget_pending(key)
+        return value
+
+    def _forget_pending(self, key: str) -> None:
+        """Stops a key from being pending, and lets go of the raw docstring once nothing is pending anymore."""
+        remaining = tuple(entry for entry in self._pending or () if entry[0] != key)
+        self._pending = remaining or None
+        if not remaining:
+            self._source = None
+
+    def _materialize(self) -> None:
+        super()._materialize()
+        self._pending = None
+        self._source = None
+
+    def __setitem__(self, key: str, value) -> None:
+        if self._is_pending(key):
+            self._forget_pending(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if self._is_pending(key) and (self._defaults is None or key not in self._defaults):
+            self._forget_pending(key)
+            return
+        super().__delitem__(key)
+
+    def copy(self) -> "ParsedDocstring":
+        """ Copies the parsed docstring deep enough that changing the copy can never change the original.
+
+            Keys that are still pending stay pending. The copy reads them through a shared original when it needs them,
+            so a tag only ever gets worked out once no matter how many copies read it.
+        """
+        # Pending keys get looked at first, so a key that another thread works out in the meantime can end up in both.
+        #   The copy then just reads the value it already has.
+        pending = self._pending
+        source = self._source
+        if pending and not isinstance(source, ParsedDocstring):
+            # Nothing ever changes the hidden original, so changing this docstring after copying it can never leak into
+            #   the copies
+            source = ParsedDocstring(pending=pending, source=source)
+            self._source = source
+        return ParsedDocstring(
+            {key: copy_parsed_value(value) for key, value in list(dict.items(self))}, pending, self._defaults, source
+        )
+
+    __copy__ = copy
+
+    def __reduce__(self):
+        while self._pending:
+            self._resolve(self._pending[0][0])
+        # Pickling a whole tree at once only writes the shared template out once
+        return (ParsedDocstring, (dict(dict.items(self)), None, self._defaults))
+
+    def clear(self) -> None:
+        """Same as `dict.clear`."""
+        self._pending = None
+        self._source = None
+        super().clear()
+
+def _rebuild_record(record_type: type, values: dict) -> "ParsedRecord":
+    """Makes a record again from its fields, for `pickle` and `copy.deepcopy`."""
+    return record_type(**values)
+
+class ParsedRecord(SparseDict):
+    """ A parsed function, class, or module. It is a `dict` with its fields always in the same order, so `json`, `pickle`,
+        and everything else that works with the plain dicts the parser used to return still does. Fields can also be read
+        as attributes (e.g. `record.name`).
+
+        Fields that are `None` (as most of them are) are read from a template shared by every record of the same type
+        with the same fields, rather than being stored in each record.
+    """
+    __slots__ = ()
+    _fields: tuple[str] = ()
+    _field_set: frozenset[str] = frozenset()
+    _templates: dict[tuple[str], dict] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls._fields)
+        cls._templates = {}
+
+    def __init__(self, **values) -> None:
+        fields = tuple(field for field in self._fields if field in values)
+        # At least one field always gets stored, since `json` writes a dict with nothing stored in it as `{}` without
+        #   reading any of its keys
+        stored = {field: values[field] for field in fields if values[field] is not None} or \
+            {field: values[field] for field in fields[:1]}
+        for key, value in values.items():
+            if key not in self._field_set:
+                stored[key] = value
+
+        template = None
+        if fields:
+            template = self._templates.get(fields)
+            if template is None:
+                template = self._templates.setdefault(fields, dict.fromkeys(fields))
+        super().__init__(stored, template)
+
+    def __getattr__(self, name: str):
+        if name in self._field_set:
+            try:
+                return self[name]
+            except KeyError:
+                pass
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def copy(self) -> "ParsedRecord":
+        """A shallow copy, the same as `dict.copy()`."""
+        return type(self)(**self._as_dict())
+
+    __copy__ = copy
+
+    def __reduce__(self):
+        return (_rebuild_record, (type(self), self._as_dict()))
+
+class ParsedArgument(ParsedRecord):
+    """A single function or class argument. @see parse_function"""
+    _fields = ("name", "type", "required", "default")
+    __slots__ = ()
+
+class ParsedFunction(ParsedRecord):
+    """A parsed function. @see parse_function"""
+    _fields = ("arguments", "docstring", "lineno", "name", "returns", "sourcefile")
+    __slots__ = ()
+
+class ParsedProperty(ParsedRecord):
+    """A parsed class property. @see parse_class"""
+    _fields = ("docstring", "readable", "writable")
+    __slots__ = ()
+
+class ParsedClass(ParsedRecord):
+    """A parsed class. @see parse_class"""
+    _fields = (
+        "annotations", "arguments", "docstring", "inherited", "lineno", "methods", "name", "parent", "properties",
+        "sourcefile", "subclasses"
+    )
+    __slots__ = ()
+
+class ParsedModule(ParsedRecord):
+    """A parsed module. @see parse_module"""
+    _fields = ("classes", "functions", "imported", "name", "sourcefile")
+    __slots__ = ()
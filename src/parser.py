@@ -1,10 +1,190 @@
+import ast
+from collections import OrderedDict
 from enum import Enum
 import inspect
+import linecache
 import os
+import re
+import reprlib
+import sys
+import threading
+from types import BuiltinFunctionType, FunctionType, GetSetDescriptorType, MemberDescriptorType, MethodType, ModuleType
+import typing
 
 import src.parse_docstring_functions as parse_docstring_functions
+from src.parsed_results import ParsedArgument, ParsedClass, ParsedDocstring, ParsedFunction, ParsedModule, ParsedProperty
 
-def parse_docstring(docstring: str) -> dict:
+# Parsed docstrings keyed on their raw text, in least to most recently used order
+_docstring_cache: OrderedDict[str, dict] = OrderedDict()
+_docstring_cache_settings: dict = {"enabled": True, "maxsize": 1024}
+_docstring_cache_stats: dict = {"hits": 0, "misses": 0}
+# Guards the cache, its settings and counters, and the tag registry, so several threads can parse at once. Docstrings
+#   get parsed outside of it, so threads only wait on each other for the bookkeeping.
+_parser_lock = threading.RLock()
+
+# Bounds the text that normalized default values (and annotations that are not types) get turned into
+_value_repr = reprlib.Repr()
+_value_repr.maxstring = 80
+_value_repr.maxother = 80
+
+# Every recognized tag, mapped to the parsed docstring key it fills and the handler that reads its blocks
+_tag_registry: dict[str, tuple[str, callable]] = {
+    tag: (key, handler) for key, tag, handler in parse_docstring_functions.TAG_HANDLERS
+}
+_built_in_tags: dict[str, tuple[str, callable]] = dict(_tag_registry)
+
+# What a docstring that uses no tags parses to. Every parsed docstring shares this as the template for the tags it does
+#   not use, so it gets replaced rather than changed whenever the tag registry changes. Handlers only get called for the
+#   tags a docstring actually uses, except for handlers whose unused value is mutable. Those need to make a fresh value
+#   every time.
+_unused_tag_values: dict = {}
+_mutable_unused_tags: list[tuple[str, callable]] = []
+# The pending (key, work) pair for each registered tag, which parsed docstrings that use the tag share. Each one splits
+#   the docstring again with the tags registered when it was made, so a pending tag always gets worked out the same way
+#   it would have been while parsing.
+_pending_tags: dict[str, tuple[str, callable]] = {}
+
+def _tag_work(tag: str, handler: callable, known_tags: dict) -> callable:
+    """Makes the function that works out a tag from a raw docstring. @see ParsedDocstring"""
+    def work(docstring: str):
+        return handler(parse_docstring_functions.tokenize_docstring(docstring, known_tags)[1].get(tag, []))
+    return work
+
+def _refresh_unused_tag_values() -> None:
+    """Records what each registered handler returns for an unused tag. Runs whenever the tag registry changes."""
+    global _mutable_unused_tags, _pending_tags, _unused_tag_values
+    unused_tag_values = {"description": None}
+    mutable_unused_tags = []
+    pending_tags = {}
+
+    for tag, (key, handler) in _tag_registry.items():
+        value = handler([])
+        unused_tag_values[key] = value
+        if value is not None and not isinstance(value, (bool, int, float, str, tuple)):
+            mutable_unused_tags.append((key, lambda docstring, handler=handler: handler([])))
+        pending_tags[tag] = (key, _tag_work(tag, handler, pending_tags))
+    # Replaced rather than changed, so docstrings being parsed on other threads keep a consistent set
+    _mutable_unused_tags = mutable_unused_tags
+    _pending_tags = pending_tags
+    _unused_tag_values = unused_tag_values
+
+_refresh_unused_tag_values()
+
+def register_docstring_tag(tag: str, handler: callable, key: str | None = None) -> None:
+    """
+        Registers a custom docstring tag so `parse_docstring` extracts it in the same pass as the built-in tags.
+
+        The handler receives a list of `DocstringBlock` objects, one per line that uses the tag, in the order they
+        appear. Each block has the stripped tag line as `header` and the stripped lines that follow it up until the
+        next tag as `lines` (`line` and `raw_lines` hold the same text without stripping). If the tag is not used, the
+        handler receives an empty list. Whatever it returns is stored in the parsed docstring under `key`. The handler
+        gets called with an empty list once when registering, and that value is reused for every docstring that does not
+        use the tag (unless it is a mutable value like a list, which gets made fresh each time).
+
+        Registering a built-in tag replaces its handler but keeps its key. Changing tags clears the docstring cache.
+
+        @param tag The tag name, including the `@` (e.g. `@threadsafe`)
+        @param handler A callable that takes the list of blocks and returns the parsed value
+        @param key The parsed docstring key for the value. Defaults to the tag name without the `@`.
+        @throws [ValueError] If the tag does not start with `@`, contains whitespace, or its key is already used
+        @throws [TypeError] If the handler is not callable
+        @example
+        def get_threadsafe(blocks):
+            return len(blocks) > 0
+
+        register_docstring_tag("@threadsafe", get_threadsafe)
+        parse_docstring("@threadsafe")["threadsafe"]
+            # True
+    """
+    tag = str(tag)
+    if tag[0:1] != "@" or len(tag) == 1 or len(tag.split()) != 1:
+        raise ValueError(f"Docstring tag '{tag}' must start with '@' and cannot contain whitespace.")
+    if not callable(handler):
+        raise TypeError(f"Handler for docstring tag '{tag}' must be callable.")
+
+    if tag in _built_in_tags:
+        key = _built_in_tags[tag][0]
+    elif key is None:
+        key = tag[1:]
+
+    with _parser_lock:
+        used_keys = [registered[0] for registered_tag, registered in _tag_registry.items() if registered_tag != tag]
+        if key == "description" or key in used_keys:
+            raise ValueError(f"Parsed docstring key '{key}' is already used.")
+
+        _tag_registry[tag] = (key, handler)
+        _refresh_unused_tag_values()
+        _docstring_cache.clear()
+
+def unregister_docstring_tag(tag: str) -> bool:
+    """
+        Removes a custom docstring tag, or restores the original handler for a built-in tag. Clears the docstring cache.
+
+        @param tag The tag name, including the `@`
+        @returns True if the tag was registered, False otherwise
+    """
+    with _parser_lock:
+        if tag not in _tag_registry:
+            return False
+
+        if tag in _built_in_tags:
+            _tag_registry[tag] = _built_in_tags[tag]
+        else:
+            del _tag_registry[tag]
+        _refresh_unused_tag_values()
+        _docstring_cache.clear()
+    return True
+
+def registered_docstring_tags() -> dict[str, str]:
+    """
+        Lists every tag `parse_docstring` recognizes.
+
+        @returns A dictionary of tag names mapped to the parsed docstring key they fill
+    """
+    with _parser_lock:
+        return {tag: registered[0] for tag, registered in _tag_registry.items()}
+
+def configure_docstring_cache(enabled: bool = True, maxsize: int = 1024) -> None:
+    """
+        Turns the `parse_docstring` cache on or off and sets how many parsed docstrings it holds.
+
+        When the cache is full, the least recently used entry gets evicted. Changing the settings keeps the counters,
+        but drops any entries beyond the new size (or all of them, if disabling).
+
+        @param enabled If `False`, every call to `parse_docstring` parses from scratch
+        @param maxsize The maximum number of parsed docstrings to keep. Values less than 1 store nothing.
+    """
+    with _parser_lock:
+        _docstring_cache_settings["enabled"] = bool(enabled)
+        _docstring_cache_settings["maxsize"] = int(maxsize)
+
+        limit = _docstring_cache_settings["maxsize"] if _docstring_cache_settings["enabled"] else 0
+        while len(_docstring_cache) > max(limit, 0):
+            _docstring_cache.popitem(last=False)
+
+def clear_docstring_cache() -> None:
+    """Removes every entry from the `parse_docstring` cache and resets its hit and miss counters."""
+    with _parser_lock:
+        _docstring_cache.clear()
+        _docstring_cache_stats["hits"] = 0
+        _docstring_cache_stats["misses"] = 0
+
+def docstring_cache_info() -> dict:
+    """
+        Reports on the `parse_docstring` cache.
+
+        @returns A dictionary as {enabled: `bool`, hits: `int`, misses: `int`, maxsize: `int`, currsize: `int`}
+    """
+    with _parser_lock:
+        return {
+            "enabled": _docstring_cache_settings["enabled"],
+            "hits": _docstring_cache_stats["hits"],
+            "misses": _docstring_cache_stats["misses"],
+            "maxsize": _docstring_cache_settings["maxsize"],
+            "currsize": len(_docstring_cache)
+        }
+
+def parse_docstring(docstring: str) -> ParsedDocstring:
     """
         Parses a docstring and returns a dict of the string formatted into component parts.
         
@@ -37,40 +217,501 @@ def parse_docstring(docstring: str) -> dict:
         - @throws
         - @todo
         - @version
+
+        Plugins can add their own tags. @see register_docstring_tag
+
+        Identical docstrings come up often (e.g. overridden methods, or the `@private` docstring made for underscored
+        names), so results are cached on the raw docstring text. Every call gets its own copy, so changing a returned
+        value never affects later calls. @see configure_docstring_cache
+
+        The result is a `ParsedDocstring`, a `dict` that only works out each tag the first time something reads it. Tags
+        a template never reads are never processed.
     """
 
     # Guard clause
     if not isinstance(docstring, str):
         return
 
-    return {
-        "description": parse_docstring_functions.get_description(docstring),
-
-        # Tags (Alphabetical Order)
-        "author": parse_docstring_functions.get_authors(docstring),
-        "copyright": parse_docstring_functions.get_copyright(docstring),
-        "deprecated": parse_docstring_functions.get_deprecated(docstring),
-        "examples": parse_docstring_functions.get_examples(docstring),
-        "global": parse_docstring_functions.get_global(docstring),
-        "ignore": parse_docstring_functions.get_ignore(docstring),
-        "license": parse_docstring_functions.get_license(docstring),
-        "memberof": parse_docstring_functions.get_memberof(docstring),
-        "namespaces": parse_docstring_functions.get_namespaces(docstring),
-        "parameters": parse_docstring_functions.get_parameters(docstring),
-        "private": parse_docstring_functions.get_private(docstring), # If False, implicitly makes this a public module
-        "returns": parse_docstring_functions.get_returns(docstring),
-        "since": parse_docstring_functions.get_since(docstring),
-        "throws": parse_docstring_functions.get_throws(docstring),
-        "todo": parse_docstring_functions.get_todo(docstring),
-        "version": parse_docstring_functions.get_version(docstring)
-    }
-
-def parse_function(function_ref: object) -> dict:
+    if _docstring_cache_settings["enabled"]:
+        return _lookup_docstring(docstring).copy()
+    return _parse_docstring(docstring)
+
+def parse_docstrings(docstrings) -> list[dict | None]:
+    """
+        Parses a batch of docstrings at once. Identical docstrings within the batch only get parsed once.
+
+        @param docstrings An iterable of docstrings. Entries that are not strings return `None`, the same as
+            `parse_docstring`.
+        @returns A list of parsed docstrings in the same order as the input. Every entry is its own copy, even for
+            identical docstrings.
+        @see parse_docstring
+    """
+    docstrings = list(docstrings)
+    parsed_batch = _parse_docstring_batch(docstrings)
+
+    results = []
+    for docstring in docstrings:
+        if isinstance(docstring, str):
+            results.append(parsed_batch[docstring].copy())
+        else:
+            results.append(None)
+    return results
+
+def _parse_docstring_batch(docstrings) -> dict[str, dict]:
+    """ Parses each unique docstring in a batch once.
+
+        @param docstrings An iterable of docstrings. Entries that are not strings get skipped.
+        @returns A dictionary of parsed docstrings keyed on their raw text. The values may be shared with the docstring
+            cache, so copy them before handing them out.
+    """
+    parsed_batch = {}
+    for docstring in docstrings:
+        if isinstance(docstring, str) and docstring not in parsed_batch:
+            if _docstring_cache_settings["enabled"]:
+                parsed_batch[docstring] = _lookup_docstring(docstring)
+            else:
+                parsed_batch[docstring] = _parse_docstring(docstring)
+    return parsed_batch
+
+def _lookup_docstring(docstring: str) -> dict:
+    """ Gets a parsed docstring from the cache, parsing and caching it if it is not there yet.
+
+        @returns The cached entry itself. Copy it before handing it out.
+    """
+    with _parser_lock:
+        cached = _docstring_cache.get(docstring)
+        if cached is not None:
+            _docstring_cache_stats["hits"] += 1
+            _docstring_cache.move_to_end(docstring)
+            return cached
+        _docstring_cache_stats["misses"] += 1
+
+    parsed_docstring = _parse_docstring(docstring)
+    with _parser_lock:
+        if _docstring_cache_settings["maxsize"] > 0:
+            # Another thread may have parsed the same docstring in the meantime. Its entry gets kept, so every copy
+            #   handed out shares one original.
+            parsed_docstring = _docstring_cache.setdefault(docstring, parsed_docstring)
+            _docstring_cache.move_to_end(docstring)
+            if len(_docstring_cache) > _docstring_cache_settings["maxsize"]:
+                _docstring_cache.popitem(last=False)    # Evict the least recently used entry
+    return parsed_docstring
+
+def _parse_docstring(docstring: str) -> ParsedDocstring:
+    """Parses a docstring without checking the cache. @see parse_docstring"""
+
+    # Split the docstring into its description and tag blocks once. Each tag's handler only runs once something reads
+    #   that tag from the result, which splits the docstring again rather than keeping the blocks until then.
+    pending_tags = _pending_tags
+    description_lines, tag_blocks = parse_docstring_functions.tokenize_docstring(docstring, pending_tags)
+
+    # Everything reads the description, so there is nothing to gain by putting it off. It always gets stored, even when
+    #   it is `None`, since `json` writes a dict with nothing stored in it as `{}` without reading any of its keys.
+    values = {"description": parse_docstring_functions.handle_description(description_lines)}
+
+    pending = {key: entry for key, entry in ((entry[0], entry) for entry in _mutable_unused_tags)}
+    for tag, blocks in tag_blocks.items():
+        entry = pending_tags.get(tag)
+        if entry is not None:
+            pending[entry[0]] = entry
+            registered = _tag_registry.get(tag)
+            if registered is not None and registered[1] in parse_docstring_functions.TAG_CHECKS:
+                parse_docstring_functions.TAG_CHECKS[registered[1]](blocks)
+
+    return ParsedDocstring(values, tuple(pending.values()), _unused_tag_values, docstring)
+
+def _get_docstring(docstring: str, docstrings: dict[str, dict] | None) -> dict | None:
+    """ Copies an already parsed docstring out of a batch, or parses it on its own if the batch does not have it.
+
+        @param docstring The raw docstring
+        @param docstrings A batch of parsed docstrings keyed on their raw text (or `None`)
+    """
+    if docstrings is not None and isinstance(docstring, str) and docstring in docstrings:
+        return docstrings[docstring].copy()
+    return parse_docstring(docstring)
+
+def _mark_private(name: str, parsed_docstring: dict | None, docstrings: dict[str, dict] | None) -> dict | None:
+    """ Flags the parsed docstring of an underscored name as private, making a docstring for it if it has none.
+
+        @param name The name of the function or class
+        @param parsed_docstring Its parsed docstring (or `None`)
+        @param docstrings A batch of parsed docstrings keyed on their raw text (or `None`)
+        @returns The parsed docstring to use for it
+    """
+    if name[0] == "_":
+        # Starting the name with an underscore indicates it is private.
+        if parsed_docstring is not None:
+            parsed_docstring["private"] = True
+        else:
+            # If there was no docstring provided, we need to make our own docstring
+            parsed_docstring = _get_docstring("@private", docstrings)
+    return parsed_docstring
+
+def _is_hidden(parsed_docstring: dict | None) -> bool:
+    """True if a parsed docstring marks its object as private or ignored, which templates leave out of the docs."""
+    return parsed_docstring is not None and bool(parsed_docstring["private"] or parsed_docstring["ignore"])
+
+def _class_members(class_ref) -> tuple[list[tuple[str, object]], list[tuple[str, object]], list[tuple[str, object]]]:
+    """ Sorts what a class defines (other than `__dunder__` names) into its methods, subclasses, and properties. Members
+        get read straight from the class `__dict__` and sorted by their type alone, so no descriptor `__get__`, metaclass
+        hook, or proxy `__class__` runs just to document them.
+
+        Static methods count as methods, documented from their function. Class methods and descriptors that do not set
+        anything (like `functools.cached_property`) are left out, the same as they always have been.
+
+        @returns Lists of `(name, value)` tuples for the methods, subclasses, and properties, in the order defined
+    """
+    methods = []
+    subclasses = []
+    properties = []
+
+    for item, attribute in class_ref.__dict__.items():
+        if item[0:2] == "__":
+            # Eliminate built in Python properties and functions (double __) and go on to the next one
+            continue
+
+        attribute_type = type(attribute)
+        if issubclass(attribute_type, staticmethod):
+            attribute = attribute.__func__
+            attribute_type = type(attribute)
+
+        if attribute_type is FunctionType:
+            methods.append((item, attribute))
+        elif issubclass(attribute_type, type):
+            subclasses.append((item, attribute))
+        elif attribute_type is not MethodType and (hasattr(attribute_type, "__set__") or hasattr(attribute_type, "__delete__")):
+            # Data descriptors, i.e. properties and slots
+            properties.append((item, attribute))
+
+    return methods, subclasses, properties
+
+def _static_attribute(value, name: str):
+    """ Reads an attribute without running any descriptor code other than the built in slots and fields of types like
+        `property`. Returns `None` if there is no such attribute. @see inspect.getattr_static
+    """
+    attribute = inspect.getattr_static(value, name, None)
+    if type(attribute) in (GetSetDescriptorType, MemberDescriptorType):
+        return attribute.__get__(value)
+    return attribute
+
+def _descriptor_docstring(descriptor) -> str | None:
+    """The raw docstring of a property or other data descriptor, read statically."""
+    docstring = _static_attribute(descriptor, "__doc__")
+    return docstring if issubclass(type(docstring), str) else None
+
+def _collect_docstrings(classes: list, functions: list, skip_private: bool = False) -> dict[str, None]:
+    """ Gathers the docstrings of functions, classes, and everything defined in those classes so they can all get
+        parsed in one batch. Class members are found with `_class_members`, so no descriptors run.
+
+        @param skip_private If True, does not gather anything defined in private or ignored classes
+        @returns The docstrings as the keys of a dictionary, in the order found and without duplicates
+    """
+    collected = {}
+    seen_classes = set()
+
+    def collect_docstring(docstring) -> None:
+        # Anything other than a string gets no parsed docstring anyway, and might not be hashable
+        if isinstance(docstring, str):
+            collected[docstring] = None
+
+    def collect_function(function_ref) -> None:
+        collect_docstring(function_ref.__doc__)
+        if function_ref.__name__[0] == "_":
+            collected["@private"] = None    # The docstring made for underscored names without one of their own
+
+    def collect_class(class_ref) -> None:
+        if id(class_ref) in seen_classes:
+            return
+        seen_classes.add(id(class_ref))
+
+        collect_docstring(class_ref.__doc__)
+        if class_ref.__name__[0] == "_":
+            collected["@private"] = None
+            if skip_private:
+                return
+        if skip_private and _is_hidden(parse_docstring(class_ref.__doc__)):
+            return
+
+        methods, subclasses, properties = _class_members(class_ref)
+        for _, method in methods:
+            collect_function(method)
+        for _, subclass in subclasses:
+            collect_class(subclass)
+        for _, descriptor in properties:
+            collect_docstring(_descriptor_docstring(descriptor))
+
+    for function_ref in functions:
+        collect_function(function_ref)
+    for class_ref in classes:
+        collect_class(class_ref)
+    return collected
+
+# The lines `inspect.findsource` walks back to from the first line number of a function's code object
+_definition_line = re.compile(r'^(\s*def\s)|(\s*async\s+def\s)|(.*(?<!\w)lambda(:|\s))|^(\s*@)')
+
+def _source_index(object_ref, sources: dict[str, dict]) -> dict:
+    """ Looks up the source index for the file a class or function was defined in, starting one the first time the file
+        gets looked up. An index holds the `sourcefile` path and the `lines` of the file as `linecache` has them. The
+        `blocks` and `classes` in it get filled in by `_index_blocks` when they are first needed.
+
+        @param object_ref The class or function
+        @param sources Source indexes keyed on file name, shared by everything parsed from the same module
+        @throws [TypeError] If the object is built in, the same as `inspect.getfile`
+    """
+    file = inspect.getfile(object_ref)
+    index = sources.get(file)
+    if index is None:
+        sourcefile = inspect.getsourcefile(object_ref)
+        if sourcefile:
+            linecache.checkcache(sourcefile)    # Only checked once per file, instead of once per object
+            lines = linecache.getlines(sourcefile, getattr(sys.modules.get(object_ref.__module__), "__dict__", None))
+        elif file.startswith("<") and file.endswith(">"):
+            lines = linecache.getlines(file)    # Source that was registered with linecache by whatever compiled it
+        else:
+            lines = []
+        index = sources[file] = {"sourcefile": sourcefile, "lines": lines, "blocks": None, "classes": None}
+    return index
+
+def _index_blocks(index: dict) -> dict:
+    """ Parses the source of an index once to find where every class and function block in the file starts and ends.
+
+        `blocks` maps the (zero indexed) first line of each block, including its decorators, to the line just past its
+        end. Like `inspect.getblock`, the end takes in comments after the last statement that are indented at least as
+        far as the body. `classes` maps each class `__qualname__` to its first line, taking the first one found when a
+        name gets defined more than once, the same as `inspect.findsource`.
+    """
+    if index["blocks"] is not None:
+        return index
+
+    lines = index["lines"]
+    index["blocks"] = {}
+    try:
+        tree = ast.parse("".join(lines))
+    except (SyntaxError, ValueError):
+        return index    # The file changed since it was imported. Blocks get found one at a time instead.
+    index["classes"] = {}
+
+    def visit(node, qualname: list[str]) -> None:
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                visit(child, qualname)
+                continue
+
+            start = (child.decorator_list[0] if child.decorator_list else child).lineno - 1
+            end = child.end_lineno
+            first = child.body[0]
+            if lines[first.lineno - 1][:first.col_offset].isspace():
+                # The body starts on its own line, so trailing comments indented as far as it belong to the block
+                for line_number in range(end, len(lines)):
+                    code = lines[line_number].lstrip()
+                    if code and code[0] != "#":
+                        break
+                    if code and len(lines[line_number]) - len(code) >= first.col_offset:
+                        end = line_number + 1
+            index["blocks"].setdefault(start, end)
+
+            if isinstance(child, ast.ClassDef):
+                index["classes"].setdefault(".".join(qualname + [child.name]), start)
+                visit(child, qualname + [child.name])
+            else:
+                visit(child, qualname + [child.name, "<locals>"])
+
+    visit(tree, [])
+    return index
+
+def _first_line(object_ref, sources: dict[str, dict]) -> tuple[dict, int]:
+    """ Finds the zero indexed line a class or function starts on (at its first decorator), the same as
+        `inspect.findsource`. Functions start at the first line number of their code object, and classes get looked up
+        by their `__qualname__`.
+
+        @returns The source index of the file, and the line number
+        @throws [OSError] If the source code cannot be found
+    """
+    index = _source_index(object_ref, sources)
+    lines = index["lines"]
+    if not lines:
+        raise OSError("could not get source code")
+
+    if inspect.isclass(object_ref):
+        classes = _index_blocks(index)["classes"]
+        if classes is None or object_ref.__qualname__ not in classes:
+            raise OSError("could not find class definition")
+        return index, classes[object_ref.__qualname__]
+
+    line_number = object_ref.__code__.co_firstlineno - 1
+    while line_number > 0:
+        if line_number >= len(lines):
+            raise OSError("lineno is out of bounds")
+        if _definition_line.match(lines[line_number]):
+            break
+        line_number -= 1
+    return index, line_number
+
+def _line_numbers(object_ref, sources: dict[str, dict]) -> tuple[int, int]:
+    """ Works out the first and last lines of a class or function the same as `inspect.findsource` and
+        `inspect.getsource` do, but from the source index of its file instead of searching and tokenizing the file again
+        for every object. Like `inspect.getsource`, the length of a wrapped function comes from the function it wraps.
+
+        @param object_ref The class or function
+        @param sources Source indexes keyed on file name, shared by everything parsed from the same module
+        @returns The `lineno` tuple of (linestart: int, lineend: int), counting lines from 1
+        @throws [OSError] If the source code cannot be found
+    """
+    index, start = _first_line(object_ref, sources)
+
+    unwrapped = inspect.unwrap(object_ref)
+    if unwrapped is not object_ref:
+        if not inspect.isfunction(unwrapped) and not inspect.isclass(unwrapped):
+            return start + 1, start + inspect.getsource(object_ref).count("\n")
+        index, block_start = _first_line(unwrapped, sources)
+    else:
+        block_start = start
+
+    block_end = _index_blocks(index)["blocks"].get(block_start)
+    if block_end is None:
+        # Not a class or function statement (such as a lambda), so tokenize just this block
+        block_end = block_start + len(inspect.getblock(index["lines"][block_start:]))
+
+    return start + 1, start + block_end - block_start
+
+def _signature(callable_ref, signatures: dict | None) -> inspect.Signature:
+    """ Gets the signature of a function, building it only the first time it gets looked up.
+
+        @param signatures Signatures keyed on the function they are for, shared by everything parsed from the same
+            module. This way classes that inherit their `__init__` share its signature. If `None`, nothing is cached.
+    """
+    if signatures is None:
+        return inspect.signature(callable_ref)
+    signature = signatures.get(callable_ref)
+    if signature is None:
+        signature = signatures[callable_ref] = inspect.signature(callable_ref)
+    return signature
+
+def _type_hints(object_ref, type_hints: dict) -> dict:
+    """ Gets the resolved annotations of a function or class from `typing.get_type_hints`, working them out only the
+        first time they get looked up. String annotations (including every one in a module that uses
+        `from __future__ import annotations`) get evaluated in the module they come from. If they cannot be resolved,
+        this returns an empty `dict` so the raw annotations get used instead.
+
+        @param type_hints Type hints keyed on the function or class they are for, shared by everything parsed from the
+            same module
+    """
+    hints = type_hints.get(object_ref)
+    if hints is None:
+        try:
+            hints = typing.get_type_hints(object_ref, include_extras=True)
+        except Exception:
+            hints = {}
+        type_hints[object_ref] = hints
+    return hints
+
+def _type_name(annotation, module_name: str | None) -> str | None:
+    """ Turns an annotation into the string it gets documented as. Types are named the way `inspect` writes them in
+        signatures (e.g. `int | None`, `Optional[List[str]]`, `collections.OrderedDict`), leaving off the module name of
+        built in types and of types from `module_name`. Strings and `None` stay as they are.
+    """
+    if annotation is None or isinstance(annotation, str):
+        return annotation
+    if annotation is type(None):
+        return "None"
+    if isinstance(annotation, (FunctionType, BuiltinFunctionType)):
+        return annotation.__name__  # Like the `any` that class arguments without an annotation get
+    if isinstance(annotation, type):
+        return inspect.formatannotation(annotation, module_name)
+    if type(annotation).__module__ in ("types", "typing"):
+        # Generics and unions name the types inside them in full, so leave off the module name the same way
+        type_name = inspect.formatannotation(annotation, module_name)
+        if module_name:
+            type_name = re.sub(r"(?<![\w.])" + re.escape(module_name) + r"\.", "", type_name)
+        return type_name
+    return _value_repr.repr(annotation)
+
+def _default_value(default):
+    """ Turns a default value into plain data. `None`, booleans, numbers, and short strings stay as they are (the same
+        as the literals `static_parser` gives), and everything else becomes a `reprlib` style string of bounded length.
+    """
+    if default is None or type(default) in (bool, int, float):
+        return default
+    if type(default) is str and len(default) <= _value_repr.maxstring:
+        return default
+    return _value_repr.repr(default)
+
+def _parse_arguments(parameters, missing_type, hints: dict | None = None,
+        module_name: str | None = None) -> list[ParsedArgument]:
+    """ Turns the parameters of a signature into `ParsedArgument` records, in the order they appear.
+
+        @param parameters The `inspect.Parameter`s to parse
+        @param missing_type The `type` to give arguments without an annotation
+        @param hints The resolved type hints of the function the parameters are from. If given, every type and default
+            gets normalized into plain data. @see _type_name @see _default_value
+        @param module_name The module the function is from, whose types get named without their module
+    """
+    arguments = []
+    for parameter in parameters:
+        arg_type = parameter.annotation
+        if arg_type == inspect._empty:
+            arg_type = missing_type
+
+        arg_required = False
+        arg_default = parameter.default
+        if arg_default == inspect._empty:   # If no default was found, then this is one of the required params
+            arg_required = True
+            arg_default = None
+
+        if hints is not None:
+            arg_type = _type_name(hints.get(parameter.name, arg_type), module_name)
+            arg_default = _default_value(arg_default)
+
+        arguments.append(ParsedArgument(name=parameter.name, type=arg_type, required=arg_required, default=arg_default))
+    return arguments
+
+def _class_arguments(class_ref, signatures: dict | None, type_hints: dict | None = None) -> list[ParsedArgument]:
+    """ Parses the positional arguments of a class's `__init__`, leaving out the first one. That is always a reference
+        to `self`, even if named something else, and has little value to the end user.
+
+        Which arguments are positional comes from `inspect.getfullargspec` of the class, which can differ from the
+        `__init__` signature when a metaclass or `__new__` changes how the class gets called. When the class gets called
+        straight through a plain `__init__` function, the names come from that one signature instead.
+
+        @param type_hints If given, the arguments get normalized into plain data using the type hints cached in it
+    """
+    init = class_ref.__init__
+    if (type(class_ref).__call__ is type.__call__ and class_ref.__new__ is object.__new__ and inspect.isfunction(init)
+            and not hasattr(init, "__wrapped__") and getattr(class_ref, "__signature__", None) is None):
+        parameters = _signature(init, signatures).parameters
+        positional = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        class_arguments = [name for name, parameter in parameters.items() if parameter.kind in positional]
+    else:
+        class_arguments = inspect.getfullargspec(class_ref).args
+        if len(class_arguments) < 2:
+            return []
+        parameters = _signature(init, signatures).parameters
+
+    hints = None if type_hints is None else _type_hints(init, type_hints)
+    return _parse_arguments([parameters[name] for name in class_arguments[1:]], any, hints, class_ref.__module__)
+
+def parse_function(function_ref: object, docstrings: dict[str, dict] | None = None, skip_private: bool = False,
+        sources: dict[str, dict] | None = None, signatures: dict | None = None, normalize: bool = False,
+        type_hints: dict | None = None) -> dict:
     """
         Inpsect a function and return a dictionary of documentation values.
 
-        @returns If not passed a function, returns `None`. Otherwise, it returns a dictionary of documentation values
-            for that function:
+        @param function_ref The function to inspect
+        @param docstrings Docstrings already parsed in a batch, keyed on their raw text. Any docstring missing from it
+            gets parsed on its own.
+        @param skip_private If True, a function that is private (by its `@private` tag or a leading underscore) or has
+            an `@ignore` tag only gets its `name` and `docstring` parsed. Every other value is `None`.
+        @param sources Source indexes keyed on file name, shared by everything parsed from the same module so each file
+            only gets read and parsed once for line numbers. Without it, the function's file gets indexed on its own.
+        @param signatures Signatures keyed on the function they are for, shared by everything parsed from the same
+            module so each one only gets built once
+        @param normalize If True, argument and return types become strings and defaults become plain data, so the
+            result holds no references to live objects. @see _type_name @see _default_value
+        @param type_hints Resolved type hints keyed on the function or class they are for, shared by everything parsed
+            from the same module so each one only gets worked out once. Only used with `normalize`.
+
+        @returns If not passed a function, returns `None`. Otherwise, it returns a `ParsedFunction` (a `dict`) of
+            documentation values for that function:
                 
         {
             arguments: List of dictionaries as [default: `any`, name: `str`, required: bool, type: any] (or `None`),
@@ -84,38 +725,20 @@ def parse_function(function_ref: object) -> dict:
     if not inspect.isfunction(function_ref):
         return
     
-    parsed_docstring = parse_docstring(function_ref.__doc__)
-    if function_ref.__name__[0] == "_":
-        # Starting the function name with an underscore indicates it is private.
-        if parsed_docstring is not None:
-            parsed_docstring["private"] = True
-        else:
-            # If there was no docstring provided, we need to make our own docstring
-            parsed_docstring = parse_docstring("@private")
+    parsed_docstring = _mark_private(function_ref.__name__, _get_docstring(function_ref.__doc__, docstrings), docstrings)
 
-    func_args = []
+    if skip_private and _is_hidden(parsed_docstring):
+        # Templates leave these out anyway, so skip the signature and source lookups
+        return ParsedFunction(arguments=None, docstring=parsed_docstring, lineno=None, name=function_ref.__name__,
+            returns=None, sourcefile=None)
 
-    # ARGUMENTS
-    for arg in inspect.signature(function_ref).parameters:
-
-        try:
-            # If the argument type is specified, it will be found here
-            class_arguments = inspect.signature(function_ref).parameters[arg]
-            arg_type = class_arguments.annotation
-            if arg_type == inspect._empty:
-                arg_type = None
-
-            arg_required = False
-            arg_default = class_arguments.default
-            if arg_default == inspect._empty:
-                arg_required = True
-                arg_default = None
-
-        except:
-            arg_type = None
-            arg_default = None
+    hints = None
+    if normalize:
+        hints = _type_hints(function_ref, {} if type_hints is None else type_hints)
 
-        func_args.append({"name": arg, "type": arg_type, "required": arg_required, "default": arg_default})
+    # ARGUMENTS
+    func_args = _parse_arguments(_signature(function_ref, signatures).parameters.values(), None, hints,
+        function_ref.__module__)
     if len(func_args) == 0:
         func_args = None
 
@@ -125,25 +748,152 @@ def parse_function(function_ref: object) -> dict:
         func_returns = function_ref.__annotations__['return']
     except:
         func_returns = None
+    if hints is not None:
+        func_returns = _type_name(hints.get("return", func_returns), function_ref.__module__)
 
     # LINE NUMBERS
-    linestart = inspect.findsource(function_ref)[1] + 1, # This is zero indexed, but we read line numbers starting at 1
-    num_code_lines = inspect.getsource(function_ref).count("\n")  # total number of code as separated by a new line
+    if sources is None:
+        sources = {}
+    lineno = _line_numbers(function_ref, sources)
+
+    return ParsedFunction(
+        arguments=func_args, # In order in which they appear in the function
+        docstring=parsed_docstring,
+        lineno=lineno, # Tuple of (linestart: int, lineend: int)
+        name=function_ref.__name__,
+        returns=func_returns,
+        sourcefile=_source_index(function_ref, sources)["sourcefile"],
+    )
+
+def _parse_members(methods: list[tuple[str, object]], properties: list[tuple[str, object]],
+        docstrings: dict[str, dict] | None, skip_private: bool, sources: dict[str, dict], signatures: dict,
+        type_hints: dict | None) -> tuple[dict | None, dict | None]:
+    """ Parses the methods and properties a class defines itself, as sorted by `_class_members`. @see parse_class
+
+        @returns A tuple of the parsed properties and the parsed methods, each keyed on their name (or `None` if empty)
+    """
+    class_properties = {}
+    class_methods = {}
+
+    for item, attribute in properties:
+        # Slots and other data descriptors that are not properties do not have `fget` or `fset`
+        class_properties[item] = ParsedProperty(
+            docstring=_get_docstring(_descriptor_docstring(attribute), docstrings),
+            readable=type(_static_attribute(attribute, "fget")) is FunctionType,
+            writable=type(_static_attribute(attribute, "fset")) is FunctionType
+        )
+
+    for item, attribute in methods:
+        parsed_function = parse_function(attribute, docstrings, skip_private, sources, signatures,
+            type_hints is not None, type_hints)
+        # if parsed_function["arguments"] is not None:
+        if parsed_function["arguments"] == None:
+            # There was no self argument provided. This is likely a static method.
+            class_methods[parsed_function["name"]] = parsed_function
+            continue
+
+        # Remove the existing first argument, which is always a reference to self in class functions
+        del parsed_function["arguments"][0]    
+
+        if len(parsed_function["arguments"]) == 0:
+            parsed_function["arguments"] = None
+
+        class_methods[parsed_function["name"]] = parsed_function
+
+    if len(class_properties) == 0:
+        class_properties = None
+    if len(class_methods) == 0:
+        class_methods = None
+
+    return class_properties, class_methods
 
-    return {
-        "arguments": func_args, # In order in which they appear in the function
-        "docstring": parsed_docstring,
-        "lineno": (linestart[0], linestart[0] + num_code_lines - 1), # Tuple of (linestart: int, lineend: int)
-        "name": function_ref.__name__,
-        "returns": func_returns,
-        "sourcefile": inspect.getsourcefile(function_ref),
-    }
+def _inherited_members(class_ref, docstrings: dict[str, dict] | None, skip_private: bool, sources: dict[str, dict],
+        signatures: dict, parsed_classes: dict[int, tuple], type_hints: dict | None) -> list[dict] | None:
+    """ Finds the methods and properties a class inherits, walking its whole method resolution order so that multiple
+        inheritance picks the same member Python would. A member defined by the class itself, or by a class earlier in
+        its MRO, hides any of the same name further along. Classes from `builtins` (like `object`) still hide names but
+        are not documented.
 
-def parse_class(class_ref) -> dict:
+        Each base class gets parsed once through `parsed_classes`, and its parsed methods and properties are the ones
+        used for every class that inherits them. A base class that is private or ignored while `skip_private` is on
+        only gets a `name` and `docstring`, so nothing gets listed as inherited from it. A base class that cannot get
+        parsed, such as one that is frozen or written in C and has no Python source, gets left out the same way.
+
+        @returns A list, in method resolution order, of a dict for each base class that anything gets inherited from:
+            {
+                methods: Parsed methods inherited from it, keyed on their name (or `None`),
+                name: String of the base class name,
+                properties: Parsed properties inherited from it, keyed on their name (or `None`)
+            }
+            Returns `None` if the class does not inherit anything.
+    """
+    defined = set(class_ref.__dict__)
+    inherited = []
+
+    for base in inspect.getmro(class_ref)[1:]:
+        if base.__module__ != "builtins":
+            parsed_count = len(parsed_classes)
+            try:
+                if id(base) in parsed_classes and parsed_classes[id(base)][1] is None:
+                    # The base class is still being parsed further up (it refers to a class that inherits from it), so
+                    #   its own members have to be parsed here instead
+                    methods, _, properties = _class_members(base)
+                    base_properties, base_methods = _parse_members(methods, properties, docstrings, skip_private,
+                        sources, signatures, type_hints)
+                else:
+                    parsed_base = parse_class(base, docstrings, skip_private, sources, signatures, parsed_classes, True,
+                        type_hints is not None, type_hints)
+                    base_properties, base_methods = parsed_base["properties"], parsed_base["methods"]
+            except (OSError, TypeError):
+                # No source or signature to read. Classes it started parsing would otherwise look like they are still
+                #   being parsed further up, and only ever get referenced by name from then on.
+                for key in list(parsed_classes)[parsed_count:]:
+                    if parsed_classes[key][1] is None:
+                        del parsed_classes[key]
+                defined.update(base.__dict__)
+                continue
+
+            methods = {name: method for name, method in (base_methods or {}).items() if name not in defined}
+            properties = {name: prop for name, prop in (base_properties or {}).items() if name not in defined}
+            if methods or properties:
+                inherited.append({"methods": methods or None, "name": base.__name__, "properties": properties or None})
+
+        defined.update(base.__dict__)
+
+    if len(inherited) == 0:
+        return None
+    return inherited
+
+def parse_class(class_ref, docstrings: dict[str, dict] | None = None, skip_private: bool = False,
+        sources: dict[str, dict] | None = None, signatures: dict | None = None,
+        parsed_classes: dict[int, tuple] | None = None, inherited: bool = False, normalize: bool = False,
+        type_hints: dict | None = None) -> dict:
     """
         Inspect a class and return a dictionary of documentation values.
 
-        @returns a dictionary of documentation values:
+        @param class_ref The class to inspect
+        @param docstrings Docstrings already parsed in a batch, keyed on their raw text. Any docstring missing from it
+            gets parsed on its own.
+        @param skip_private If True, a class that is private (by its `@private` tag or a leading underscore) or has an
+            `@ignore` tag only gets its `name` and `docstring` parsed. Every other value is `None`. The same goes for
+            private or ignored methods and subclasses of the classes that do get parsed.
+        @param sources Source indexes keyed on file name, shared by everything parsed from the same module so each file
+            only gets read and parsed once for line numbers. Without it, the class's file gets indexed on its own.
+        @param signatures Signatures keyed on the function they are for, shared by everything parsed from the same
+            module so each one only gets built once, even when subclasses inherit the same `__init__`
+        @param parsed_classes Classes already parsed in this run, keyed on their `id`. A class that shows up more than
+            once (such as an inner class shared by assigning it to other classes) gets parsed once, and the same
+            `ParsedClass` gets used everywhere it shows up. A class that refers back to one still being parsed (such as
+            `Node.Self = Node`) gets a reference with only its `name` and `docstring` instead of recursing forever.
+        @param inherited If True, the parsed class also gets an `inherited` list of the methods and properties it
+            inherits, and which class each one comes from. Every base class gets parsed once and shared through
+            `parsed_classes`. @see _inherited_members
+        @param normalize If True, argument types, return types, and annotations become strings and defaults become
+            plain data, so the result holds no references to live objects. @see parse_function
+        @param type_hints Resolved type hints keyed on the function or class they are for, shared by everything parsed
+            from the same module so each one only gets worked out once. Only used with `normalize`.
+
+        @returns a `ParsedClass` (a `dict`) of documentation values:
         {
             annotations: List of tuples as (name: `str`, type: `object`) (or `None`),
             arguments: Excluding `self`, list of dictionaries as [default: `any`, name: `str`, required: bool, type: any] (or `None`),
@@ -153,89 +903,57 @@ def parse_class(class_ref) -> dict:
             parent: Name of the parent class this class inherited from (or `None`)
             properties: List of dictionaries for all class properties as [docstring: `dict`, name: `str`, readable: `bool`, writeable: `bool`]
         }
+        With `inherited`, it also has:
+        {
+            inherited: List of the methods and properties inherited from each base class (or `None`)
+        }
     """
     if not inspect.isclass(class_ref) or issubclass(class_ref, Enum):
         return
 
+    if parsed_classes is None:
+        parsed_classes = {}
+    # Each entry is (class, ParsedClass), or (class, None) while it is still being parsed. Keeping the class in it makes
+    #   sure its `id` cannot get reused by another class during the run.
+    already_parsed = parsed_classes.get(id(class_ref), (None, None))[1]
+    if already_parsed is not None:
+        return already_parsed
+
     # DOCSTRING
-    class_docstring = parse_docstring(class_ref.__doc__)
-    if class_ref.__name__[0] == "_":
-        # Starting the class name with an underscore indicates it is private.
-        if class_docstring is not None:
-            class_docstring["private"] = True
-        else:
-            # If there was no docstring provided, we need to make our own docstring
-            class_docstring = parse_docstring("@private")
+    class_docstring = _mark_private(class_ref.__name__, _get_docstring(class_ref.__doc__, docstrings), docstrings)
+
+    if id(class_ref) in parsed_classes or (skip_private and _is_hidden(class_docstring)):
+        # Templates leave hidden classes out anyway, so skip the arguments, members, and source lookups. A class still
+        #   being parsed further up only gets referenced like this as well, since parsing it again would never end.
+        return ParsedClass(annotations=None, arguments=None, docstring=class_docstring, lineno=None, methods=None,
+            name=class_ref.__name__, parent=None, properties=None, sourcefile=None, subclasses=None)
+
+    parsed_classes[id(class_ref)] = (class_ref, None)
+    if sources is None:
+        sources = {}    # Shared with the methods and subclasses
+    if signatures is None:
+        signatures = {}
+    if not normalize:
+        type_hints = None
+    elif type_hints is None:
+        type_hints = {}
 
     # CLASS ARGUMENTS
-    class_arguments = inspect.getfullargspec(class_ref).args # This will always return an array from args in __init__
-    args_list = []  # A working list to hold the formatted dictionary objects from each argument
-    
-    if len(class_arguments) > 0:
-        for i in range(1, len(class_arguments)):
-            # Start at 1 instead of 0. First argument is ALWAYS a reference to "self", even if named something else.
-            #   As far as generated documentation purposes go, this has little value to the end user. Discard it.
-            arg_name = class_arguments[i]
-            class_parameters = inspect.signature(class_ref.__init__).parameters[arg_name]
-
-            arg_type = class_parameters.annotation
-            if arg_type == inspect._empty:
-                arg_type = any
-
-            arg_required = False
-            arg_default = class_parameters.default
-            if arg_default == inspect._empty:   # If no default was found, then this is one of the required params
-                arg_required = True
-                arg_default = None
-
-            args_list.append({"name": arg_name, "type": arg_type, "required": arg_required, "default": arg_default})
+    args_list = _class_arguments(class_ref, signatures, type_hints)
     if len(args_list) == 0:
         args_list = None
 
     # CLASS PROPERTIES AND METHODS
-    class_properties = {}
-    class_methods = {}
-    class_subclasses = {}
-
-    for item in class_ref.__dict__.keys():
-
-        if item[0:2] == "__":
-            # Eliminate built in Python properties and functions (double __) and go on to the next one
-            continue
-
-        attribute = getattr(class_ref, item)
-
-        if inspect.isdatadescriptor(attribute): # i.e. Properties
-            class_properties[item] = {
-                "docstring": parse_docstring(attribute.__doc__), 
-                "readable": inspect.isfunction(attribute.fget), 
-                "writable": inspect.isfunction(attribute.fset)
-            }
-
-        if inspect.isfunction(attribute):
-            parsed_function = parse_function(attribute)
-            # if parsed_function["arguments"] is not None:
-            if parsed_function["arguments"] == None:
-                # There was no self argument provided. This is likely a static method.
-                class_methods[parsed_function["name"]] = parsed_function
-                continue
-
-            # Remove the existing first argument, which is always a reference to self in class functions
-            del parsed_function["arguments"][0]    
+    methods, subclasses, properties = _class_members(class_ref)
+    class_properties, class_methods = _parse_members(methods, properties, docstrings, skip_private, sources, signatures,
+        type_hints)
 
-            if len(parsed_function["arguments"]) == 0:
-                parsed_function["arguments"] = None
-
-            class_methods[parsed_function["name"]] = parsed_function
-        
-        if inspect.isclass(attribute):
-            subclass = parse_class(attribute)
-            class_subclasses[subclass["name"]] = subclass # Recursively parse this subclass using this parsing func
+    class_subclasses = {}
+    for item, attribute in subclasses:
+        subclass = parse_class(attribute, docstrings, skip_private, sources, signatures, parsed_classes, inherited,
+            normalize, type_hints)
+        class_subclasses[subclass["name"]] = subclass # Recursively parse this subclass using this parsing func
 
-    if len(class_properties) == 0:
-        class_properties = None
-    if len(class_methods) == 0:
-        class_methods = None
     if len(class_subclasses) == 0:
         class_subclasses = None
 
@@ -243,6 +961,11 @@ def parse_class(class_ref) -> dict:
     class_annotations = {}
     for key in class_ref.__annotations__.keys():
         class_annotations[key] = class_ref.__annotations__[key]
+    if type_hints is not None:
+        # Type hints of a class include what it inherits, so only its own annotations get looked up in them
+        hints = _type_hints(class_ref, type_hints)
+        for key, annotation in class_annotations.items():
+            class_annotations[key] = _type_name(hints.get(key, annotation), class_ref.__module__)
 
     if len(class_annotations) == 0:
         class_annotations = None
@@ -258,91 +981,143 @@ def parse_class(class_ref) -> dict:
 
     # LINE NUMBERS
     try:
-        linestart = inspect.findsource(class_ref)[1] + 1, # This is zero indexed, but we read line numbers starting at 1
-        num_code_lines = inspect.getsource(class_ref).count("\n")  # total number of code as separated by a new line
+        lineno = _line_numbers(class_ref, sources)
     except:
-        linestart = [1]
-        num_code_lines = 1
+        lineno = (1, 1)
     
     try:
         # In some obscure cases this was causing errors I could not track down why. Make sure it doesn't interrupt.
-        source_file = inspect.getsourcefile(class_ref)
+        source_file = _source_index(class_ref, sources)["sourcefile"]
     except:
         source_file = None
 
-    return {
-        "annotations": class_annotations,
-        "arguments": args_list,
-        "docstring": class_docstring,
-        "lineno": (linestart[0], linestart[0] + num_code_lines - 1), # Tuple of (linestart: int, lineend: int)
-        "methods": class_methods,
-        "name": class_ref.__name__,
-        "parent": parent_class,
-        "properties": class_properties,
-        "sourcefile": source_file,
-        "subclasses": class_subclasses
-        }
+    parsed_class = ParsedClass(
+        annotations=class_annotations,
+        arguments=args_list,
+        docstring=class_docstring,
+        lineno=lineno, # Tuple of (linestart: int, lineend: int)
+        methods=class_methods,
+        name=class_ref.__name__,
+        parent=parent_class,
+        properties=class_properties,
+        sourcefile=source_file,
+        subclasses=class_subclasses
+        )
+    if inherited:
+        parsed_class["inherited"] = _inherited_members(class_ref, docstrings, skip_private, sources, signatures,
+            parsed_classes, type_hints)
+    parsed_classes[id(class_ref)] = (class_ref, parsed_class)
+    return parsed_class
+
+def _module_members(module_ref, exports_only: bool = False) -> list[tuple[str, object]]:
+    """ Lists the `(name, value)` pairs of a module in alphabetical order, read straight from the module `__dict__`.
+        Unlike `inspect.getmembers`, nothing gets looked up with `getattr`, so a module `__getattr__` or `__dir__`
+        (PEP 562) never runs and names that a module loads lazily do not get imported just to be documented.
+
+        @param exports_only If True and the module has an `__all__` list of names, only those names get read. Names in
+            `__all__` that are not in the module `__dict__` (including ones only a module `__getattr__` provides) get
+            skipped. Without a usable `__all__`, every member gets listed.
+    """
+    namespace = dict(vars(module_ref))  # A copy, in case reading anything adds to the module
+    exported = namespace.get("__all__") if exports_only else None
+    if not isinstance(exported, (list, tuple)) or not all(isinstance(name, str) for name in exported):
+        return sorted(namespace.items(), key=lambda member: member[0])
+    return [(name, namespace[name]) for name in sorted(set(exported)) if name in namespace]
 
-def parse_module(module_ref) -> dict:
+def parse_module(module_ref, skip_private: bool = False, exports_only: bool = False, inherited: bool = False,
+        normalize: bool = False) -> dict:
     """
         This function parses Python module files (i.e. `*.py`).
 
         Functions and classes will always show up in alphabetical order, NOT the order they appear in the file.
+
+        @param module_ref The module to inspect
+        @param skip_private If True, private and ignored functions and classes only get their `name` and `docstring`
+            parsed. @see parse_class
+        @param exports_only If True and the module defines `__all__`, only the names listed in it get parsed (including
+            the imported names). Nothing else in the module gets inspected. Modules without `__all__` parse in full.
+        @param inherited If True, classes also list the methods and properties they inherit. @see parse_class
+        @param normalize If True, every type and annotation becomes a string and every default becomes plain data, so the
+            result holds no references to the module or anything in it. @see parse_function
+
+        @returns A `ParsedModule` (a `dict`) of documentation values
     """
 
     if not inspect.ismodule(module_ref):
         return
-    
-    # CLASSES
-    class_list = {}
-    imported_classes = []
-    for class_ref in inspect.getmembers(module_ref, inspect.isclass):
-        # Check if the class module is the same as the module name we're parsing. Without this check, the parser would
-        #   get all of the imported functions as well, which is unexpected behavior.
-        if class_ref[1].__module__ == module_ref.__name__:
-            class_list[class_ref[1].__name__] = (parse_class(class_ref[1]))
-        else:
-            imported_classes.append((class_ref[1].__module__, class_ref[1].__name__))
-    if len(class_list) == 0:
-        class_list = None
-    if len(imported_classes) == 0:
-        imported_classes = None
 
-    # FUNCTIONS
-    functions_list = {}
+    # CLASSES, FUNCTIONS, AND MODULES
+    module_classes = []
+    imported_classes = []
+    module_functions = []
     imported_functions = []
-    for function_name in inspect.getmembers(module_ref, inspect.isfunction):
-        if function_name[1].__module__ == module_ref.__name__:
-            # Check if the function module (from the second index of the tuple returned by inspect.getmembers) is the
-            #   same as the module name we're parsing. Without this check, the parser would get all of the imported
-            #   functions as well, which is unexpected behavior.
-            functions_list[function_name[1].__name__] = parse_function(function_name[1])
-        else:
-            # Return a tuple of the function's module and the function's name
-            imported_functions.append((function_name[1].__module__, function_name[1].__name__))
-    if len(functions_list) == 0:
-        functions_list = None
-    if len(imported_functions) == 0:
-        imported_functions = None
-    
-    # MODULES
     imported_modules = []
+    for name, member in _module_members(module_ref, exports_only):
+        # Sorted by their actual type. Unlike `inspect.isclass`, this never asks a member for its `__class__`, which
+        #   would load a lazily imported module (like one from `importlib.util.LazyLoader`).
+        member_type = type(member)
+
+        if issubclass(member_type, type):
+            # Check if the class module is the same as the module name we're parsing. Without this check, the parser
+            #   would get all of the imported classes as well, which is unexpected behavior.
+            if member.__module__ == module_ref.__name__:
+                module_classes.append(member)
+            else:
+                imported_classes.append((member.__module__, member.__name__))
+
+        elif member_type is FunctionType:
+            if member.__module__ == module_ref.__name__:
+                module_functions.append(member)
+            else:
+                # Return a tuple of the function's module and the function's name
+                imported_functions.append((member.__module__, member.__name__))
 
-    for module in inspect.getmembers(module_ref, inspect.ismodule):
-        imported_modules.append(module[0])
+        elif issubclass(member_type, ModuleType):
+            imported_modules.append(name)
             # NOTE: Only does the highest level. For example, if imported "tests.input_files.testmodule_only_docstring",
             #   then it will return "tests".
+
+    if len(imported_classes) == 0:
+        imported_classes = None
+    if len(imported_functions) == 0:
+        imported_functions = None
     if len(imported_modules) == 0:
         imported_modules = None
 
-    return {
-        "classes": class_list,
-        "functions": functions_list,
-        "imported": {
+    # Parse every docstring in the module in one batch before building the classes and functions from them
+    docstrings = _parse_docstring_batch(_collect_docstrings(module_classes, module_functions, skip_private))
+
+    # Every class, function, and method in the module shares one source index per file for their line numbers, and
+    #   one signature per function (inherited `__init__` functions included) for their arguments. Classes that show up
+    #   more than once (as module classes and as inner classes) get parsed once. With `normalize`, type hints only get
+    #   resolved once for each function and class.
+    sources = {}
+    signatures = {}
+    parsed_classes = {}
+    type_hints = {}
+
+    class_list = {}
+    for class_ref in module_classes:
+        class_list[class_ref.__name__] = parse_class(class_ref, docstrings, skip_private, sources, signatures, parsed_classes,
+            inherited, normalize, type_hints)
+    if len(class_list) == 0:
+        class_list = None
+
+    functions_list = {}
+    for function_ref in module_functions:
+        functions_list[function_ref.__name__] = parse_function(function_ref, docstrings, skip_private, sources, signatures,
+            normalize, type_hints)
+    if len(functions_list) == 0:
+        functions_list = None
+
+    return ParsedModule(
+        classes=class_list,
+        functions=functions_list,
+        imported={
             "classes": imported_classes,
             "functions": imported_functions,
             "modules": imported_modules
         },
-        "name": module_ref.__name__,
-        "sourcefile": os.path.abspath(module_ref.__file__)
-    }
+        name=module_ref.__name__,
+        sourcefile=os.path.abspath(module_ref.__file__)
+    )
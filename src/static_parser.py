@@ -0,0 +1,423 @@
+"""
+Parses Python source files with the `ast` module instead of importing them, so none of their code runs and none of
+their dependencies need to be installed.
+
+The results have the same shape as `parse_module`, `parse_class`, and `parse_function`, with a few differences that
+come from never running the code:
+
+- Annotations (argument types, return types, and class annotations) are their source code as strings.
+- Defaults are their values if they are literals (e.g. `2.5`, `"text"`, `None`, `[1, 2]`), or their source code as
+  strings otherwise.
+- The module name is the file name, which is also what `Core` names modules it imports from a file path.
+- Without importing, the parser cannot tell what an imported name is. Names imported with `from x import y` count as
+  classes if they are CapWords and functions if they are lowercase. ALL CAPS names are assumed to be constants and
+  left out. The module in each entry is the one the import statement names.
+- Class arguments come from an `__init__` in the class or in a parent class defined in the same file, or from the
+  fields of a `@dataclass`. Anything generated some other way is not seen.
+- Methods decorated with `classmethod`, `cached_property`, `cache`, `lru_cache`, or `singledispatchmethod` are left
+  out, the same as `parse_class` leaves out what those decorators return. Any other decorator is assumed to return a
+  function (like `functools.wraps` wrappers do), so the method gets documented even if that decorator really returns
+  some other kind of object, which `parse_class` would leave out.
+"""
+
+import ast
+import os
+import tokenize
+
+from src.parser import _get_docstring, _is_hidden, _mark_private, _parse_docstring_batch
+from src.parsed_results import ParsedArgument, ParsedClass, ParsedFunction, ParsedModule, ParsedProperty
+
+# Base classes that make a class an `Enum`, which gets left out the same as `parse_class` leaves them out
+_enum_bases = {"Enum", "Flag", "IntEnum", "IntFlag", "ReprEnum", "StrEnum"}
+
+# Decorators that turn a method into something other than a function, which `parse_class` leaves out of the methods
+_non_method_decorators = {
+    "classmethod", "cached_property", "functools.cached_property", "cache", "functools.cache", "lru_cache",
+    "functools.lru_cache", "singledispatchmethod", "functools.singledispatchmethod"
+}
+
+# `try` blocks, including `try`/`except*` on versions that have it
+_try_nodes = (ast.Try, getattr(ast, "TryStar", ast.Try))
+
+def parse_module_file(path: str, skip_private: bool = False, exports_only: bool = False) -> ParsedModule:
+    """
+        Parses a Python source file (i.e. `*.py`) without importing it.
+
+        Functions and classes will always show up in alphabetical order, NOT the order they appear in the file.
+
+        @param path An absolute or relative path to the source file
+        @param skip_private If True, private and ignored functions and classes only get their `name` and `docstring`
+            parsed. @see parser.parse_class
+        @param exports_only If True and the file assigns `__all__` a list of names, only those names get parsed
+        @returns A `ParsedModule` (a `dict`) of documentation values, the same as `parse_module`
+        @throws [OSError] If the file cannot be read
+        @throws [SyntaxError] If the file is not valid Python
+    """
+    with tokenize.open(path) as source_file:   # Reads with the encoding the file declares, the same as importing
+        source = source_file.read()
+    return parse_module_source(source, path, skip_private, exports_only)
+
+def parse_module_source(source: str, path: str, skip_private: bool = False, exports_only: bool = False) -> ParsedModule:
+    """
+        Parses Python source code without running it. @see parse_module_file
+
+        @param source The source code of the module
+        @param path The path the source came from, used for the module name and `sourcefile`
+        @throws [SyntaxError] If the source is not valid Python
+    """
+    tree = ast.parse(source, filename=path)
+    sourcefile = os.path.abspath(path)
+
+    # Work out what each top level name ends up as. Later statements replace earlier ones, the same as running them.
+    bindings = {}
+    exported = None
+    for node in _top_level_statements(tree.body):
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            bindings[node.name] = node
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    bindings[alias.asname] = ("module", alias.asname)
+                else:
+                    bindings[alias.name.split(".")[0]] = ("module", alias.name.split(".")[0])
+        elif isinstance(node, ast.ImportFrom):
+            module = "." * node.level + (node.module or "")
+            for alias in node.names:
+                if alias.name != "*":
+                    bindings[alias.asname or alias.name] = ("imported", (module, alias.name))
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    if target.id == "__all__" and node.value is not None:
+                        exported = _exported_names(node, exported)
+                    bindings[target.id] = None
+        elif isinstance(node, ast.Delete):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    bindings.pop(target.id, None)
+
+    names = sorted(bindings)
+    if exports_only and exported is not None:
+        names = sorted(set(exported) & set(bindings))
+
+    class_nodes = {name: node for name, node in bindings.items() if isinstance(node, ast.ClassDef)}
+    docstrings = _parse_docstring_batch(_collect_node_docstrings(
+        [bindings[name] for name in names if isinstance(bindings[name], ast.AST)], skip_private))
+
+    class_list = {}
+    functions_list = {}
+    imported_classes = []
+    imported_functions = []
+    imported_modules = []
+    for name in names:
+        node = bindings[name]
+        if isinstance(node, ast.ClassDef):
+            class_list[node.name] = _parse_class_node(node, sourcefile, docstrings, skip_private, class_nodes)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions_list[node.name] = _parse_function_node(node, sourcefile, docstrings, skip_private)
+        elif isinstance(node, tuple) and node[0] == "module":
+            imported_modules.append(name)
+        elif isinstance(node, tuple):
+            imported_name = node[1][1]
+            if imported_name.isupper():
+                continue    # Most likely a constant
+            elif imported_name[0].isupper():
+                imported_classes.append(node[1])
+            else:
+                imported_functions.append(node[1])
+
+    return ParsedModule(
+        classes=class_list or None,
+        functions=functions_list or None,
+        imported={
+            "classes": imported_classes or None,
+            "functions": imported_functions or None,
+            "modules": imported_modules or None
+        },
+        name=os.path.basename(path),
+        sourcefile=sourcefile
+    )
+
+def _top_level_statements(body: list[ast.stmt]):
+    """Yields the statements of a body, including the ones inside `if`, `try`, and `with` blocks, which run there too."""
+    for node in body:
+        if isinstance(node, ast.If):
+            yield from _top_level_statements(node.body)
+            yield from _top_level_statements(node.orelse)
+        elif isinstance(node, _try_nodes):
+            yield from _top_level_statements(node.body)
+            for handler in node.handlers:
+                yield from _top_level_statements(handler.body)
+            yield from _top_level_statements(node.orelse)
+            yield from _top_level_statements(node.finalbody)
+        elif isinstance(node, (ast.With, ast.AsyncWith)):
+            yield from _top_level_statements(node.body)
+        else:
+            yield node
+
+def _exported_names(node: ast.stmt, exported: list[str] | None) -> list[str] | None:
+    """ Reads the names from an assignment to `__all__`.
+
+        @param node The assignment (`=`, `: list =`, or `+=`)
+        @param exported The names `__all__` held before this assignment
+        @returns The names `__all__` holds after it, or `None` if they are not a literal list of strings
+    """
+    try:
+        names = ast.literal_eval(node.value)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    if not isinstance(names, (list, tuple)) or not all(isinstance(name, str) for name in names):
+        return None
+    if isinstance(node, ast.AugAssign):
+        return None if exported is None else list(exported) + list(names)
+    return list(names)
+
+def _collect_node_docstrings(nodes: list[ast.AST], skip_private: bool = False) -> dict[str, None]:
+    """ Gathers the docstrings of function and class nodes, and of everything defined in those classes, so they can all
+        get parsed in one batch. @see parser._collect_docstrings
+
+        @returns The docstrings as the keys of a dictionary, in the order found and without duplicates
+    """
+    collected = {"@private": None}  # The docstring made for underscored names without one of their own
+    while nodes:
+        node = nodes.pop()
+        if not isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        collected[ast.get_docstring(node, clean=False)] = None
+        if isinstance(node, ast.ClassDef) and not (skip_private and node.name[0] == "_"):
+            nodes.extend(node.body)
+
+    collected.pop(None, None)
+    return collected
+
+def _source(node: ast.expr | None) -> str | None:
+    """The source code of an expression node, or `None` if there is no node."""
+    if node is None:
+        return None
+    return ast.unparse(node)
+
+def _annotation(node: ast.expr | None) -> str | None:
+    """The source code of an annotation. Annotations written as strings (i.e. forward references) give that string."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return _source(node)
+
+def _value(node: ast.expr | None) -> any:
+    """The value of a default, if it is a literal. Otherwise, its source code."""
+    if node is None:
+        return None
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return ast.unparse(node)
+
+def _base_name(node: ast.expr) -> str:
+    """The class name at the end of a base class expression (e.g. `Base` for `module.Base` or `Base[T]`)."""
+    if isinstance(node, ast.Subscript):
+        return _base_name(node.value)
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return ast.unparse(node)
+
+def _decorator_names(node: ast.FunctionDef | ast.ClassDef) -> list[str]:
+    """The names of a node's decorators, as `name` or `object.attribute`, without any call arguments."""
+    names = []
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Call):
+            decorator = decorator.func
+        names.append(ast.unparse(decorator))
+    return names
+
+def _node_lines(node: ast.AST) -> tuple[int, int]:
+    """The first and last lines of a definition, counting its decorators the same as `inspect.getsource` does."""
+    decorators = getattr(node, "decorator_list", None)
+    start = decorators[0].lineno if decorators else node.lineno
+    return (start, node.end_lineno)
+
+def _node_arguments(arguments: ast.arguments, missing_type: any = None) -> list[ParsedArgument]:
+    """ Lists every argument of a signature in the same order as `inspect.signature`.
+
+        @param arguments The signature node
+        @param missing_type What to use as the type of arguments without an annotation
+    """
+    positional = arguments.posonlyargs + arguments.args
+    defaults = [None] * (len(positional) - len(arguments.defaults)) + arguments.defaults
+    parameters = list(zip(positional, defaults))
+    if arguments.vararg:
+        parameters.append((arguments.vararg, None))
+    parameters.extend(zip(arguments.kwonlyargs, arguments.kw_defaults))
+    if arguments.kwarg:
+        parameters.append((arguments.kwarg, None))
+
+    parsed_arguments = []
+    for argument, default in parameters:
+        arg_type = _annotation(argument.annotation) if argument.annotation is not None else missing_type
+        parsed_arguments.append(ParsedArgument(name=argument.arg, type=arg_type, required=default is None,
+            default=_value(default)))
+    return parsed_arguments
+
+def _parse_function_node(node: ast.FunctionDef | ast.AsyncFunctionDef, sourcefile: str,
+        docstrings: dict[str, dict] | None = None, skip_private: bool = False) -> ParsedFunction:
+    """Builds a `ParsedFunction` from a function node. @see parser.parse_function"""
+
+    parsed_docstring = _mark_private(node.name, _get_docstring(ast.get_docstring(node, clean=False), docstrings),
+        docstrings)
+
+    if skip_private and _is_hidden(parsed_docstring):
+        return ParsedFunction(arguments=None, docstring=parsed_docstring, lineno=None, name=node.name, returns=None,
+            sourcefile=None)
+
+    return ParsedFunction(
+        arguments=_node_arguments(node.args) or None,
+        docstring=parsed_docstring,
+        lineno=_node_lines(node),
+        name=node.name,
+        returns=_annotation(node.returns),
+        sourcefile=sourcefile,
+    )
+
+def _is_enum(node: ast.ClassDef, class_nodes: dict[str, ast.ClassDef], seen: set[str] | None = None) -> bool:
+    """True if a class inherits from an `Enum`, directly or through classes defined in the same file."""
+    seen = seen if seen is not None else set()
+    for base in node.bases:
+        name = _base_name(base)
+        if name in _enum_bases:
+            return True
+        if isinstance(base, ast.Name) and name in class_nodes and name not in seen:
+            seen.add(name)
+            if _is_enum(class_nodes[name], class_nodes, seen):
+                return True
+    return False
+
+def _class_arguments(node: ast.ClassDef, class_nodes: dict[str, ast.ClassDef],
+        seen: set[str] | None = None) -> list[ParsedArgument] | None:
+    """ Finds the arguments a class takes, from its own `__init__`, the first parent class defined in the same file that
+        has one, or its `@dataclass` fields. Like `parse_class`, only positional arguments count and `self` is left out.
+
+        @returns The arguments, or `None` if the class does not define where they come from
+    """
+    for statement in node.body:
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)) and statement.name == "__init__":
+            positional = len(statement.args.posonlyargs) + len(statement.args.args)
+            return _node_arguments(statement.args, any)[1:positional]
+
+    if any(name.split(".")[-1] == "dataclass" for name in _decorator_names(node)):
+        arguments = []
+        for statement in node.body:
+            if (isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name)
+                    and "ClassVar" not in _annotation(statement.annotation)):
+                arguments.append(ParsedArgument(name=statement.target.id, type=_annotation(statement.annotation),
+                    required=statement.value is None, default=_value(statement.value)))
+        return arguments
+
+    seen = seen if seen is not None else {node.name}
+    for base in node.bases:
+        if isinstance(base, ast.Name) and base.id in class_nodes and base.id not in seen:
+            seen.add(base.id)
+            arguments = _class_arguments(class_nodes[base.id], class_nodes, seen)
+            if arguments is not None:
+                return arguments
+    return None
+
+def _parse_class_node(node: ast.ClassDef, sourcefile: str, docstrings: dict[str, dict] | None = None,
+        skip_private: bool = False, class_nodes: dict[str, ast.ClassDef] | None = None) -> ParsedClass | None:
+    """ Builds a `ParsedClass` from a class node. @see parser.parse_class
+
+        @param class_nodes The classes defined at the top of the same file, keyed on their names. Used to find
+            inherited `__init__` methods and `Enum` classes.
+        @returns The parsed class, or `None` for an `Enum`
+    """
+    class_nodes = class_nodes if class_nodes is not None else {}
+    if _is_enum(node, class_nodes):
+        return
+
+    class_docstring = _mark_private(node.name, _get_docstring(ast.get_docstring(node, clean=False), docstrings),
+        docstrings)
+
+    if skip_private and _is_hidden(class_docstring):
+        return ParsedClass(annotations=None, arguments=None, docstring=class_docstring, lineno=None, methods=None,
+            name=node.name, parent=None, properties=None, sourcefile=None, subclasses=None)
+
+    # CLASS PROPERTIES AND METHODS
+    class_annotations = {}
+    class_properties = {}
+    class_methods = {}
+    class_subclasses = {}
+    class_slots = []
+    class_values = {}   # Literal values assigned in the class body, in case `__slots__` gets set to one of them
+
+    for statement in node.body:
+        if isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name):
+            class_annotations[statement.target.id] = _annotation(statement.annotation)
+
+        elif isinstance(statement, ast.Assign):
+            targets = [target.id for target in statement.targets if isinstance(target, ast.Name)]
+            if isinstance(statement.value, ast.Name) and statement.value.id in class_values:
+                value = class_values[statement.value.id]
+            else:
+                value = _value(statement.value)
+            for target in targets:
+                class_values[target] = value
+            if "__slots__" not in targets:
+                continue
+
+            slots = value
+            if isinstance(slots, str):
+                slots = [slots]
+            if isinstance(slots, (list, tuple)):
+                class_slots = [slot for slot in slots if isinstance(slot, str) and slot[0:2] != "__"]
+
+        elif isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if statement.name[0:2] == "__":
+                continue    # Eliminate built in Python properties and functions (double __)
+
+            decorators = _decorator_names(statement)
+            if "property" in decorators:
+                class_properties[statement.name] = ParsedProperty(
+                    docstring=_get_docstring(ast.get_docstring(statement, clean=False), docstrings),
+                    readable=True,
+                    writable=False
+                )
+            elif f"{statement.name}.setter" in decorators or f"{statement.name}.deleter" in decorators:
+                if statement.name in class_properties and f"{statement.name}.setter" in decorators:
+                    class_properties[statement.name]["writable"] = True
+            elif _non_method_decorators.intersection(decorators):
+                continue    # Such as a class method, which gives a bound method once read from its class
+            else:
+                parsed_function = _parse_function_node(statement, sourcefile, docstrings, skip_private)
+                if parsed_function["arguments"] is not None:
+                    # Remove the existing first argument, which is always a reference to self in class functions
+                    del parsed_function["arguments"][0]
+                    if len(parsed_function["arguments"]) == 0:
+                        parsed_function["arguments"] = None
+                class_methods[parsed_function["name"]] = parsed_function
+
+        elif isinstance(statement, ast.ClassDef) and statement.name[0:2] != "__":
+            class_subclasses[statement.name] = _parse_class_node(statement, sourcefile, docstrings, skip_private,
+                class_nodes)
+
+    # Slots get added to the class after everything defined in its body
+    for slot in class_slots:
+        if slot not in class_properties:
+            class_properties[slot] = ParsedProperty(docstring=None, readable=False, writable=False)
+
+    # PARENT CLASS
+    parent_class = None
+    if node.bases and _base_name(node.bases[0]) != "object":
+        parent_class = _base_name(node.bases[0])
+
+    return ParsedClass(
+        annotations=class_annotations or None,
+        arguments=_class_arguments(node, class_nodes) or None,
+        docstring=class_docstring,
+        lineno=_node_lines(node),
+        methods=class_methods or None,
+        name=node.name,
+        parent=parent_class,
+        properties=class_properties or None,
+        sourcefile=sourcefile,
+        subclasses=class_subclasses or None
+    )
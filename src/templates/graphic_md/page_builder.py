@@ -1,6 +1,9 @@
 import os
+import threading
 
-tableofcontents:list = []
+# The table of contents and destination of the page being built. Each thread has its own, so pages can get built from
+#   several threads at once.
+_page = threading.local()
 
 def md_header(header_level: int = 1) -> str:
     """ Heler function to format a specified number of Markdown headers (i.e. H1 - H6) using the `#` character.
@@ -35,7 +38,7 @@ def md_source(sourcefile: str, lineno: tuple) -> str:
     if not sourcefile:
         return ""
 
-    link = os.path.relpath(sourcefile, os.path.dirname(destination_filepath)).replace('\\', '/')
+    link = os.path.relpath(sourcefile, os.path.dirname(_page.destination_filepath)).replace('\\', '/')
 
     sourcefile = sourcefile.split('\\')[-1]
     sourcefile = sourcefile.split('/')[-1] # Makes sure to grab the final part of whichever the filename is
@@ -118,7 +121,7 @@ def create_imports_block(import_data: dict) -> str:
             result += f"- {function[1]} (from `{function[0]}`)\n"
 
     if result:
-        tableofcontents.append("- [Imports](#imports)")
+        _page.tableofcontents.append("- [Imports](#imports)")
         return "## Imports\n" + result + "\n"
     else:
         return  ""
@@ -167,7 +170,7 @@ def argument_table(args_list: list, params_list: list) -> str:
 
         if not arg['required']:
             name += " _(Optional)_"
-            if arg['type'] == str:
+            if arg['type'] == str or arg['type'] == "str":  # Static parsing gives annotations as source strings
                 default = f"`'{arg['default']}'`"
             else:
                 default = f"`{arg['default']}`"
@@ -281,7 +284,18 @@ def create_class_block(class_data: dict, header_level: int = 1) -> str:
             if info:    # Prevent printing out private or ignored items
                 info = info.replace('\n', '\n    ')
                 result += f"- {info}\n"
-                tableofcontents.append(f"        - [{method}](#class-{class_data['name'].lower() + method})")
+                _page.tableofcontents.append(f"        - [{method}](#class-{class_data['name'].lower() + method})")
+
+    # Only there when the parser was asked for inherited members. Like the class's own, only methods get listed.
+    for parent in class_data.get("inherited") or []:
+        inherited = ""
+        for method, method_data in (parent["methods"] or {}).items():
+            method_docstring = method_data["docstring"]
+            if not method_docstring or not (method_docstring["private"] or method_docstring["ignore"]):
+                inherited += f"- {formatted_definition(method, method_data['arguments'])}\n"
+
+        if inherited:
+            result += f"**Inherited from `{parent['name']}`:**\n\n{inherited}\n"
 
     return result + "\n"
 
@@ -293,9 +307,9 @@ def build_page(module_info: dict, core, destination: str) -> str:
         @returns A consolidated string ready to insert into a file
     """
     # pp.pprint(module_info)
-    global destination_filepath
-    destination_filepath = destination  # Used when determining relative path links
-    tableofcontents.clear()
+    _page.destination_filepath = destination  # Used when determining relative path links
+    _page.tableofcontents = []
+    tableofcontents = _page.tableofcontents
 
     toc_replace_phrase = "<!-- REPLACE THIS COMMENT WITH TABLE OF CONTENTS -->"
 
@@ -0,0 +1,15 @@
+""" A plugin that registers a custom docstring tag, and also serves as the source target that uses it."""
+
+def load(core=None):
+    """ Registers the `@threadsafe` tag with the core that is loading this plugin."""
+
+    def get_threadsafe(blocks: list) -> bool:
+        return len(blocks) > 0
+
+    core.register_tag("@threadsafe", get_threadsafe)
+
+def threadsafe_function():
+    """ Safe to call from any thread.
+        @threadsafe
+    """
+    pass
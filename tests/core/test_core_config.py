@@ -559,6 +559,288 @@ class TestCoreConfig(unittest.TestCase):
 
             self.assertEqual(expected, received)
 
+    def test_config_file_changes_default_value_docstring_cache(self):
+        """Test the config file accepts valid input for the 'docstring_cache' and 'docstring_cache_size' variables."""
+        self.maxDiff = None
+
+        inputs = [
+            # Tuple of: [0] = Variable to JSON stringify, [1] = Expected 'docstring_cache', [2] = Expected size
+            ('', False, initial_default_settings["docstring_cache_size"]),
+            (2, True, 2),
+            ("3", True, 3),
+            (3.999, True, 3),
+            ("abc", True, initial_default_settings["docstring_cache_size"]),
+            (None, False, initial_default_settings["docstring_cache_size"]),
+            (0, False, 0),
+        ]
+
+        for input in inputs:
+            tempfile = open(self.config_file_path, "w+")
+            tempfile.write(json.dumps({"docstring_cache": input[0], "docstring_cache_size": input[0]}))
+            tempfile.close()
+
+            core = Core(self.config_file_path)
+
+            self.assertEqual(input[1], core.config["docstring_cache"])
+            self.assertEqual(input[2], core.config["docstring_cache_size"])
+
+    def test_config_file_changes_default_value_skip_private(self):
+        """Test the config file converts the 'skip_private' variable to a boolean."""
+        self.maxDiff = None
+
+        inputs = [
+            # Tuple of: [0] = Variable to JSON stringify, [1] = Expected 'skip_private'
+            (True, True),
+            (False, False),
+            (1, True),
+            (0, False),
+            ("abc", True),
+            ('', False),
+            (None, False),
+        ]
+
+        for input in inputs:
+            tempfile = open(self.config_file_path, "w+")
+            tempfile.write(json.dumps({"skip_private": input[0]}))
+            tempfile.close()
+
+            core = Core(self.config_file_path)
+
+            self.assertEqual(input[1], core.config["skip_private"])
+
+    def test_config_file_changes_default_value_exports_only(self):
+        """Test the config file converts the 'exports_only' variable to a boolean."""
+        self.maxDiff = None
+
+        inputs = [
+            # Tuple of: [0] = Variable to JSON stringify, [1] = Expected 'exports_only'
+            (True, True),
+            (False, False),
+            (1, True),
+            ("abc", True),
+            ('', False),
+            (None, False),
+        ]
+
+        for input in inputs:
+            tempfile = open(self.config_file_path, "w+")
+            tempfile.write(json.dumps({"exports_only": input[0]}))
+            tempfile.close()
+
+            core = Core(self.config_file_path)
+
+            self.assertEqual(input[1], core.config["exports_only"])
+
+    def test_config_file_changes_default_value_inherited_members(self):
+        """Test the config file converts the 'inherited_members' variable to a boolean."""
+        self.maxDiff = None
+
+        inputs = [
+            # Tuple of: [0] = Variable to JSON stringify, [1] = Expected 'inherited_members'
+            (True, True),
+            (False, False),
+            (1, True),
+            ("abc", True),
+            ('', False),
+            (None, False),
+        ]
+
+        for input in inputs:
+            tempfile = open(self.config_file_path, "w+")
+            tempfile.write(json.dumps({"inherited_members": input[0]}))
+            tempfile.close()
+
+            core = Core(self.config_file_path)
+
+            self.assertEqual(input[1], core.config["inherited_members"])
+
+    def test_config_file_changes_default_value_isolate_modules(self):
+        """Test the config file converts the 'isolate_modules' variable to a boolean."""
+        self.maxDiff = None
+
+        inputs = [
+            # Tuple of: [0] = Variable to JSON stringify, [1] = Expected 'isolate_modules'
+            (True, True),
+            (False, False),
+            (1, True),
+            ("abc", True),
+            ('', False),
+            (None, False),
+        ]
+
+        for input in inputs:
+            tempfile = open(self.config_file_path, "w+")
+            tempfile.write(json.dumps({"isolate_modules": input[0]}))
+            tempfile.close()
+
+            core = Core(self.config_file_path)
+
+            self.assertEqual(input[1], core.config["isolate_modules"])
+
+    def test_config_file_changes_default_value_jobs(self):
+        """Test the config file converts the 'jobs' variable to an integer."""
+        self.maxDiff = None
+
+        inputs = [
+            # Tuple of: [0] = Variable to JSON stringify, [1] = Expected 'jobs'
+            (4, 4),
+            ("8", 8),
+            (2.5, 2),
+            (0, 0),
+            ("abc", initial_default_settings["jobs"]),
+            (None, initial_default_settings["jobs"]),
+            ([], initial_default_settings["jobs"]),
+        ]
+
+        for input in inputs:
+            tempfile = open(self.config_file_path, "w+")
+            tempfile.write(json.dumps({"jobs": input[0]}))
+            tempfile.close()
+
+            core = Core(self.config_file_path)
+
+            self.assertEqual(input[1], core.config["jobs"])
+
+    def test_config_file_changes_default_value_module_memory_limit(self):
+        """Test the config file converts the 'module_memory_limit' variable to an integer."""
+        self.maxDiff = None
+
+        inputs = [
+            # Tuple of: [0] = Variable to JSON stringify, [1] = Expected 'module_memory_limit'
+            (512, 512),
+            ("256", 256),
+            (100.7, 100),
+            (0, 0),
+            ("abc", initial_default_settings["module_memory_limit"]),
+            (None, initial_default_settings["module_memory_limit"]),
+            ([], initial_default_settings["module_memory_limit"]),
+        ]
+
+        for input in inputs:
+            tempfile = open(self.config_file_path, "w+")
+            tempfile.write(json.dumps({"module_memory_limit": input[0]}))
+            tempfile.close()
+
+            core = Core(self.config_file_path)
+
+            self.assertEqual(input[1], core.config["module_memory_limit"])
+
+    def test_config_file_changes_default_value_module_timeout(self):
+        """Test the config file converts the 'module_timeout' variable to a number."""
+        self.maxDiff = None
+
+        inputs = [
+            # Tuple of: [0] = Variable to JSON stringify, [1] = Expected 'module_timeout'
+            (30, 30),
+            ("2.5", 2.5),
+            (0.25, 0.25),
+            (0, 0),
+            ("abc", initial_default_settings["module_timeout"]),
+            (None, initial_default_settings["module_timeout"]),
+            ([], initial_default_settings["module_timeout"]),
+        ]
+
+        for input in inputs:
+            tempfile = open(self.config_file_path, "w+")
+            tempfile.write(json.dumps({"module_timeout": input[0]}))
+            tempfile.close()
+
+            core = Core(self.config_file_path)
+
+            self.assertEqual(input[1], core.config["module_timeout"])
+
+    def test_config_file_changes_default_value_normalize_values(self):
+        """Test the config file converts the 'normalize_values' variable to a boolean."""
+        self.maxDiff = None
+
+        inputs = [
+            # Tuple of: [0] = Variable to JSON stringify, [1] = Expected 'normalize_values'
+            (True, True),
+            (False, False),
+            (1, True),
+            ("abc", True),
+            ('', False),
+            (None, False),
+        ]
+
+        for input in inputs:
+            tempfile = open(self.config_file_path, "w+")
+            tempfile.write(json.dumps({"normalize_values": input[0]}))
+            tempfile.close()
+
+            core = Core(self.config_file_path)
+
+            self.assertEqual(input[1], core.config["normalize_values"])
+
+    def test_config_file_changes_default_value_parse_mode(self):
+        """Test the config file only accepts 'import' or 'static' for the 'parse_mode' variable."""
+        self.maxDiff = None
+
+        inputs = [
+            # Tuple of: [0] = Variable to JSON stringify, [1] = Expected 'parse_mode'
+            ("static", "static"),
+            ("STATIC", "static"),
+            ("import", "import"),
+            ("something else", initial_default_settings["parse_mode"]),
+            (None, initial_default_settings["parse_mode"]),
+            (1, initial_default_settings["parse_mode"]),
+        ]
+
+        for input in inputs:
+            tempfile = open(self.config_file_path, "w+")
+            tempfile.write(json.dumps({"parse_mode": input[0]}))
+            tempfile.close()
+
+            core = Core(self.config_file_path)
+
+            self.assertEqual(input[1], core.config["parse_mode"])
+
+    def test_config_file_changes_default_value_precompile(self):
+        """Test the config file converts the 'precompile' variable to a boolean."""
+        self.maxDiff = None
+
+        inputs = [
+            # Tuple of: [0] = Variable to JSON stringify, [1] = Expected 'precompile'
+            (True, True),
+            (False, False),
+            (1, True),
+            ("abc", True),
+            ('', False),
+            (None, False),
+        ]
+
+        for input in inputs:
+            tempfile = open(self.config_file_path, "w+")
+            tempfile.write(json.dumps({"precompile": input[0]}))
+            tempfile.close()
+
+            core = Core(self.config_file_path)
+
+            self.assertEqual(input[1], core.config["precompile"])
+
+    def test_config_file_changes_default_value_worker_type(self):
+        """Test the config file only accepts 'process' or 'thread' for the 'worker_type' variable."""
+        self.maxDiff = None
+
+        inputs = [
+            # Tuple of: [0] = Variable to JSON stringify, [1] = Expected 'worker_type'
+            ("thread", "thread"),
+            ("THREAD", "thread"),
+            ("process", "process"),
+            ("something else", initial_default_settings["worker_type"]),
+            (None, initial_default_settings["worker_type"]),
+            (1, initial_default_settings["worker_type"]),
+        ]
+
+        for input in inputs:
+            tempfile = open(self.config_file_path, "w+")
+            tempfile.write(json.dumps({"worker_type": input[0]}))
+            tempfile.close()
+
+            core = Core(self.config_file_path)
+
+            self.assertEqual(input[1], core.config["worker_type"])
+
 
     ###############################################################
     # Unrecognized Settings
@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 import pprint
@@ -547,3 +548,75 @@ class TestCoreHooks(unittest.TestCase):
 
         # Verify filters apply sequentially and in proper order
         self.assertEqual("QXXQXA", core.apply_filter("priority_test", "A"))
+
+    ###############################################################
+    # Threads
+    ###############################################################
+
+    def test_hooks_callbacks_in_order(self):
+        hooks = Hooks()
+        first, second, third = (lambda: 1), (lambda: 2), (lambda: 3)
+        hooks.add("the_test_hook", third, 22)
+        hooks.add("the_test_hook", first, 5)
+        hooks.add("the_test_hook", second, 5)
+
+        self.assertListEqual([(5, first), (5, second), (22, third)], hooks.callbacks("the_test_hook"))
+        self.assertListEqual([], hooks.callbacks("missing_hook"))
+
+    def test_hooks_add_from_several_threads(self):
+        hooks = Hooks()
+        callbacks = [lambda: None for i in range(400)]
+
+        def add(start):
+            for callback in callbacks[start::8]:
+                hooks.add("the_test_hook", callback, len(callback.__qualname__) % 3)
+
+        threads = [threading.Thread(target=add, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(400, len(hooks.callbacks("the_test_hook")))
+
+    def test_core_hooks_doing_is_for_each_thread(self):
+        core = Core({"verbose": False})
+        seen = {}
+        started = threading.Barrier(2)
+
+        def test_callback(args: dict):
+            started.wait()  # Both threads are inside their own hook at the same time
+            seen[args["thread"]] = dict(core.actions.doing)
+            started.wait()
+
+        core.actions.add("first_hook", test_callback)
+        core.actions.add("second_hook", test_callback, 7)
+
+        threads = [
+            threading.Thread(target=core.do_action, args=("first_hook", {"thread": "first"})),
+            threading.Thread(target=core.do_action, args=("second_hook", {"thread": "second"}))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual({"hook_name": "first_hook", "callback": test_callback, "priority": 10}, seen["first"])
+        self.assertEqual({"hook_name": "second_hook", "callback": test_callback, "priority": 7}, seen["second"])
+        self.assertEqual({"hook_name": None, "callback": None, "priority": None}, core.actions.doing)
+
+    def test_core_hooks_added_while_firing(self):
+        """Callbacks added by a callback while its hook fires only run the next time it fires."""
+        core = Core({"verbose": False})
+        calls = []
+
+        def test_callback():
+            calls.append("first")
+            core.actions.add("the_test_hook", lambda: calls.append("added"))
+
+        core.actions.add("the_test_hook", test_callback)
+        core.do_action("the_test_hook")
+        self.assertListEqual(["first"], calls)
+
+        core.do_action("the_test_hook")
+        self.assertListEqual(["first", "first", "added"], calls)
@@ -1,9 +1,21 @@
+import builtins
+import gc
+import importlib.util
+import linecache
 import os
 import re
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
 import unittest
+from unittest import mock
 import uuid
 
-from src.core import Core
+from src.core import Core, _bytecode_is_current
+from src.parser import parse_class, parse_function, parse_module
+from tests.parser.input_files import testmodule, testmodule_with_all
 
 class TestCoreParser(unittest.TestCase):
 
@@ -62,6 +74,34 @@ class TestCoreParser(unittest.TestCase):
         # self.assertTrue('parsing_complete' not in core.actions.done)
         # self.assertTrue('core_loaded' in core.actions.done)
 
+    def test_build_static_cannot_load_module(self):
+        """Should fail to parse statically when the file doesn't exist"""
+
+        config = {"source": [os.path.join(".", str(uuid.uuid1()) + ".py")], "parse_mode": "static"}
+
+        core = Core(config)
+
+        self.assertTrue('parsed_module' not in core.actions.done)
+        self.assertTrue('unable_to_load_module' in core.actions.done)
+        self.assertTrue('parsing_complete' not in core.actions.done)
+
+    def test_build_static_file_that_cannot_be_imported(self):
+        """Static parsing never runs the file, so it works even if importing the file would fail"""
+
+        source_path = os.path.join(os.path.dirname(__file__), "static_" + str(uuid.uuid1()).replace("-", "_") + ".py")
+        with open(source_path, "w") as source_file:
+            source_file.write("import not_an_installed_module\n\ndef test_func():\n    pass\n")
+
+        try:
+            core = Core({"source": [source_path], "parse_mode": "static"})
+        finally:
+            os.remove(source_path)
+
+        self.assertTrue('parsed_module' in core.actions.done)
+        self.assertTrue('unable_to_load_module' not in core.actions.done)
+        self.assertTrue('parsing_complete' in core.actions.done)
+        self.assertListEqual(["test_func"], list(core.parsed_results[0]["functions"]))
+
     def test_build_individual_files_no_exclude(self):
         """Should parse four out of four from the provided source list"""
 
@@ -176,3 +216,589 @@ class TestCoreParser(unittest.TestCase):
 
         self.assertTrue(reachable_filename_was_reached)
         self.assertFalse(unreachable_file_was_reached)
+
+    ###############################################################
+    # Parse Build - Imported Objects
+    ###############################################################
+
+    def test_build_imported_module(self):
+        """Modules that are already imported get parsed as they are, without loading anything again."""
+
+        with mock.patch("importlib.util.spec_from_file_location", wraps=importlib.util.spec_from_file_location) as \
+                spec_from_file_location:
+            core = Core({"source": [testmodule]})
+
+        # Only the template gets loaded
+        self.assertNotIn(testmodule.__file__, [call.args[1] for call in spec_from_file_location.call_args_list])
+        self.assertTrue('parsed_module' in core.actions.done)
+        self.assertTrue('parsing_complete' in core.actions.done)
+
+        expected = parse_module(testmodule)
+        expected["name"] = "testmodule.py"  # Named after its file, the same as modules loaded from a path
+        self.assertEqual([expected], core.parsed_results)
+
+    def test_build_imported_classes_and_functions(self):
+        """Classes and functions get grouped into a parsed module for the module they come from."""
+
+        core = Core({"source": [testmodule.TestClass1, testmodule_with_all.exported_func, testmodule.test_func1]})
+
+        self.assertTrue('unable_to_parse' not in core.actions.done)
+        self.assertEqual(3, core.actions.done.count('parsed_module'))
+        self.assertListEqual(["testmodule.py", "testmodule_with_all.py"],
+            [module["name"] for module in core.parsed_results])
+
+        parsed_module = core.parsed_results[0]
+        self.assertEqual(os.path.abspath(testmodule.__file__), parsed_module["sourcefile"])
+        self.assertEqual(parse_class(testmodule.TestClass1), parsed_module["classes"]["TestClass1"])
+        self.assertEqual(parse_function(testmodule.test_func1), parsed_module["functions"]["test_func1"])
+        self.assertIsNone(core.parsed_results[1]["classes"])
+
+    def test_build_imported_objects_and_paths_in_order(self):
+        config = {
+            "source": [
+                os.path.join(".", "tests", "core", "test_core_hooks.py"),
+                testmodule,
+                os.path.join(".", "tests", "core", "test_core_template.py")
+            ]
+        }
+
+        core = Core(config)
+
+        self.assertListEqual(["test_core_hooks.py", "testmodule.py", "test_core_template.py"],
+            [module["name"] for module in core.parsed_results])
+
+    def test_build_imported_module_without_a_file(self):
+        core = Core({"source": [sys]})
+
+        self.assertTrue('unable_to_parse' in core.actions.done)
+        self.assertTrue('parsing_complete' not in core.actions.done)
+
+    def test_config_keeps_imported_objects(self):
+        core = Core({"source": [testmodule, testmodule.TestClass1, testmodule.test_func1, 2]})
+
+        self.assertListEqual([testmodule, testmodule.TestClass1, testmodule.test_func1, "2"], core.config["source"])
+
+    ###############################################################
+    # Parse Build - Unloading Modules
+    ###############################################################
+
+    def write_corpus(self, directory: str, count: int) -> list[str]:
+        """ Writes `count` modules that each hold about 300 KB of data and import a helper module of their own that holds
+            as much again. Their functions and classes use both in their defaults and annotations."""
+        paths = []
+        for i in range(count):
+            with open(os.path.join(directory, f"corpus_helper_{i}.py"), "w") as helper_file:
+                helper_file.write(f"class Helper():\n    DATA = [str(index) * 4 for index in range(5000)]\n")
+
+            path = os.path.join(directory, f"corpus_module_{i}.py")
+            with open(path, "w") as module_file:
+                module_file.write(
+                    f'"""Module {i}."""\n'
+                    f"import corpus_helper_{i}\n\n"
+                    f"DATA = [str(index) * 4 for index in range(5000)]\n\n"
+                    f"class Record():\n"
+                    f'    """A record."""\n'
+                    f"    def __init__(self, values: list = DATA, helper: corpus_helper_{i}.Helper = None):\n"
+                    f"        pass\n\n"
+                    f"def function(values=DATA) -> corpus_helper_{i}.Helper:\n"
+                    f'    """A function."""\n'
+                    f"    return values\n"
+                )
+            paths.append(path)
+        return paths
+
+    def memory_per_module(self, paths: list[str], unload_modules: bool) -> list[int]:
+        """Parses the paths, returning the bytes allocated after each module gets parsed."""
+        core = Core({"source": [], "unload_modules": unload_modules, "verbose": False})
+        samples = []
+
+        def sample():
+            gc.collect()
+            samples.append(tracemalloc.get_traced_memory()[0])
+        core.actions.add("parsed_module", sample)
+
+        loaded_before = set(sys.modules)
+        tracemalloc.start()
+        try:
+            parsed_results = core.parse_source_targets(paths)
+        finally:
+            tracemalloc.stop()
+            for name in set(sys.modules) - loaded_before:
+                if name.startswith("corpus_"):
+                    del sys.modules[name]
+
+        self.assertEqual(len(paths), len(parsed_results))
+        return samples
+
+    def test_unload_modules_keeps_memory_flat(self):
+        with tempfile.TemporaryDirectory() as directory, mock.patch.object(sys, "path", [directory] + sys.path):
+            paths = self.write_corpus(directory, 30)
+
+            unloaded_samples = self.memory_per_module(paths, True)
+            loaded_samples = self.memory_per_module(paths, False)
+
+        # Each module and its helper hold about 600 KB, so keeping them would grow by about 12 MB over the last 20
+        module_size = 500 * 1024
+        self.assertLess(unloaded_samples[-1] - unloaded_samples[9], module_size)
+        self.assertGreater(loaded_samples[-1] - loaded_samples[9], 10 * module_size)
+
+    def test_unload_modules_drops_new_modules(self):
+        with tempfile.TemporaryDirectory() as directory, mock.patch.object(sys, "path", [directory] + sys.path):
+            paths = self.write_corpus(directory, 2)
+
+            core = Core({"source": paths, "unload_modules": True})
+
+        self.assertNotIn("corpus_helper_0", sys.modules)
+        self.assertNotIn("corpus_helper_1", sys.modules)
+        self.assertNotIn(paths[0], linecache.cache)
+        self.assertEqual("corpus_module_0.py", core.parsed_results[0]["name"])
+        self.assertEqual("corpus_helper_0.Helper", core.parsed_results[0]["functions"]["function"]["returns"])
+        self.assertEqual("list", core.parsed_results[0]["classes"]["Record"]["arguments"][0]["type"])
+        self.assertIsInstance(core.parsed_results[0]["classes"]["Record"]["arguments"][0]["default"], str)
+
+    def test_unload_modules_collects_once_per_batch_of_files(self):
+        # Each collection takes longer the more the build holds, so collecting per file grows with the square of them
+        with tempfile.TemporaryDirectory() as directory, mock.patch("src.core._files_per_collection", 3), \
+                mock.patch("src.core.gc.collect") as collect:
+            paths = self.write_modules(directory, 8)
+
+            core = Core({"source": [], "unload_modules": True, "verbose": False})
+            batches = []
+            core.actions.add("parsed_module", lambda: batches.append(collect.call_count))
+            core.parse_source_targets(paths)
+
+        self.assertListEqual([0, 0, 1, 1, 1, 2, 2, 2, 3], batches)
+        self.assertEqual(4, collect.call_count)   # Along with once the build is done
+
+    def test_unload_modules_keeps_packages_until_the_build_is_done(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 3)
+            with open(paths[0], "w") as init_file:
+                init_file.write("import builtins\nbuiltins.graphicdocs_package_runs += 1\n")
+
+            core = Core({"source": [], "unload_modules": True, "verbose": False})
+            loaded = []
+            core.filters.add("next_parsing_target", lambda src_path:
+                loaded.append(sorted(name for name in sys.modules if name.startswith("graphicdocs_package"))) or src_path)
+            with mock.patch("builtins.graphicdocs_package_runs", 0, create=True):
+                parsed_results = core.parse_source_targets(paths)
+                runs = builtins.graphicdocs_package_runs
+
+        self.assertEqual(1, runs)
+        self.assertListEqual([[], ["graphicdocs_package"], ["graphicdocs_package"], ["graphicdocs_package"]], loaded)
+        self.assertEqual(4, len(parsed_results))
+        self.assertNotIn("graphicdocs_package", sys.modules)
+
+    ###############################################################
+    # Parse Build - Packages
+    ###############################################################
+
+    def write_package(self, directory: str, package: str, files: dict[str, str]) -> list[str]:
+        """Writes a package of source files into the directory, returning their paths."""
+        os.mkdir(os.path.join(directory, package))
+        paths = []
+        for filename, source in {"__init__.py": "", **files}.items():
+            path = os.path.join(directory, package, filename)
+            with open(path, "w") as source_file:
+                source_file.write(source)
+            paths.append(path)
+        return paths
+
+    def tearDown(self):
+        for name in list(sys.modules):
+            if name.split(".")[0] in ("graphicdocs_package", "graphicdocs_other_package"):
+                del sys.modules[name]
+
+    def parse_recording_modules(self, core: Core, source: list) -> tuple[list[dict], dict]:
+        """Parses the source with the core, returning the results and the modules that were loaded as it finished."""
+        loaded = {}
+        core.actions.add("parsing_complete", lambda: loaded.update(sys.modules))
+        return core.parse_source_targets(source), loaded
+
+    def test_build_package_runs_each_file_once(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_package(directory, "graphicdocs_package", {
+                "runs.py": "RUNS = []\n",
+                "first.py": "from graphicdocs_package.second import SecondClass\n\nclass FirstClass(SecondClass):\n    pass\n",
+                "second.py": "from . import runs\nruns.RUNS.append(__name__)\n\nclass SecondClass():\n    pass\n",
+            })
+
+            core = Core({"source": [], "verbose": False})
+            parsed_results, loaded = self.parse_recording_modules(core, paths)
+
+        self.assertTrue('parsing_complete' in core.actions.done)
+        self.assertListEqual(["graphicdocs_package.second"], loaded["graphicdocs_package.runs"].RUNS)
+        self.assertListEqual(["__init__.py", "runs.py", "first.py", "second.py"],
+            [module["name"] for module in parsed_results])
+
+        parsed_first, parsed_second = parsed_results[2], parsed_results[3]
+        self.assertListEqual([("graphicdocs_package.second", "SecondClass")], parsed_first["imported"]["classes"])
+        self.assertListEqual(["SecondClass"], list(parsed_second["classes"]))
+        self.assertIs(loaded["graphicdocs_package.first"].FirstClass.__mro__[1],
+            loaded["graphicdocs_package.second"].SecondClass)
+
+    def test_build_same_file_names_in_different_packages(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_package(directory, "graphicdocs_package", {"utils.py": "def first_function():\n    pass\n"})
+            paths += self.write_package(directory, "graphicdocs_other_package",
+                {"utils.py": "def second_function():\n    pass\n"})
+
+            core = Core({"source": [], "verbose": False})
+            parsed_results, loaded = self.parse_recording_modules(core, [paths[1], paths[3]])
+
+        self.assertListEqual([["first_function"], ["second_function"]],
+            [list(module["functions"]) for module in parsed_results])
+        self.assertListEqual([os.path.abspath(paths[1]), os.path.abspath(paths[3])],
+            [module["sourcefile"] for module in parsed_results])
+        self.assertIn("graphicdocs_package.utils", loaded)
+        self.assertIn("graphicdocs_other_package.utils", loaded)
+
+    def test_build_file_shadowed_by_another_module(self):
+        """A file named the same as a module imported from somewhere else still gets loaded from the file."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "json.py")
+            with open(path, "w") as source_file:
+                source_file.write("def shadowing_function():\n    pass\n")
+
+            core = Core({"source": [path]})
+
+        self.assertListEqual(["shadowing_function"], list(core.parsed_results[0]["functions"]))
+        self.assertEqual("json.py", core.parsed_results[0]["name"])
+
+    def test_build_again_after_editing_files(self):
+        """Each build runs the source files again, so edits made since the last build show up."""
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_package(directory, "graphicdocs_package", {"module.py": "def first_function():\n    pass\n"})
+            flat_path = os.path.join(directory, "graphicdocs_flat_module.py")
+            with open(flat_path, "w") as source_file:
+                source_file.write("def first_function():\n    pass\n")
+            core = Core({"source": [paths[1], flat_path]})
+
+            for path in (paths[1], flat_path):
+                with open(path, "w") as source_file:
+                    source_file.write("def second_function():\n    pass\n\ndef third_function():\n    pass\n")
+            parsed_again = core.parse_source_targets([paths[1], flat_path])
+            parsed_by_new_core = Core({"source": [paths[1], flat_path]}).parsed_results
+
+        self.assertListEqual([["first_function"]] * 2, [list(module["functions"]) for module in core.parsed_results])
+        for parsed_results in (parsed_again, parsed_by_new_core):
+            self.assertListEqual([["second_function", "third_function"]] * 2,
+                [list(module["functions"]) for module in parsed_results])
+        self.assertNotIn("graphicdocs_package.module", sys.modules)
+        self.assertNotIn("graphicdocs_flat_module", sys.modules)
+
+    ###############################################################
+    # Parse Build - Worker Processes
+    ###############################################################
+
+    def write_modules(self, directory: str, count: int) -> list[str]:
+        """Writes a package of `count` modules that each hold a class and a function, returning their paths."""
+        return self.write_package(directory, "graphicdocs_package", {
+            f"module_{i}.py": (
+                f'"""Module {i}."""\n'
+                f"from graphicdocs_package.module_0 import SHARED\n\n" if i else f'"""Module {i}."""\nSHARED = [1, 2]\n\n'
+            ) + (
+                f"class Class{i}():\n"
+                f'    """Class {i}."""\n'
+                f"    def method(self, values: list = SHARED) -> int:\n"
+                f'        """Does something."""\n'
+                f"        return {i}\n\n"
+                f"def function_{i}(key: str, value: int | None = None) -> str:\n"
+                f'    """@param key The key\\n@returns The key"""\n'
+                f"    return key\n"
+            ) for i in range(count)
+        })
+
+    def test_build_with_jobs_matches_one_at_a_time(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 12)
+
+            parallel_core = Core({"source": paths, "jobs": 3})
+            self.assertNotIn("graphicdocs_package", sys.modules)    # Only the workers imported anything
+            serial_core = Core({"source": paths, "normalize_values": True})
+
+        self.assertTrue('parsing_complete' in parallel_core.actions.done)
+        self.assertEqual(13, parallel_core.actions.done.count('parsed_module'))
+        self.assertListEqual(["__init__.py"] + [f"module_{i}.py" for i in range(12)],
+            [module["name"] for module in parallel_core.parsed_results])
+        self.assertEqual(serial_core.parsed_results, parallel_core.parsed_results)
+
+    def test_build_with_jobs_fires_hooks_here_in_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 6)
+            core = Core({"source": [], "jobs": 2, "verbose": False})
+
+            filtered = []
+            def next_parsing_target(src_path):
+                filtered.append((os.getpid(), src_path))
+                return src_path
+            core.filters.add("next_parsing_target", next_parsing_target)
+
+            parsed = []
+            core.actions.add("parsed_module", lambda: parsed.append(os.getpid()))
+
+            parsed_results = core.parse_source_targets([paths[1], testmodule, *paths[2:]])
+
+        self.assertListEqual([(os.getpid(), path) for path in [paths[1], *paths[2:]]], filtered)
+        self.assertListEqual([os.getpid()] * 7, parsed)
+        self.assertListEqual(["module_0.py", "testmodule.py"] + [f"module_{i}.py" for i in range(1, 6)],
+            [module["name"] for module in parsed_results])
+
+    def test_build_with_jobs_stops_at_a_module_that_cannot_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 4)
+            with open(paths[2], "w") as source_file:
+                source_file.write("raise RuntimeError('Cannot import this')\n")
+
+            core = Core({"source": [], "jobs": 2, "verbose": False})
+            bad_targets = []
+            core.actions.add("unable_to_load_module", lambda args: bad_targets.append(args["bad_source_target"]))
+
+            parsed_results = core.parse_source_targets(paths)
+
+        self.assertIsNone(parsed_results)
+        self.assertListEqual([paths[2]], bad_targets)
+        self.assertEqual(2, core.actions.done.count('parsed_module'))
+        self.assertTrue('parsing_complete' not in core.actions.done)
+
+    def test_build_with_jobs_looks_for_modules_like_one_at_a_time(self):
+        reports = []
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 1)
+            for config in [{}, {"jobs": 2}, {"jobs": 2, "worker_type": "thread"}]:
+                core = Core({"source": [], "verbose": False, **config})
+                bad_targets = []
+                core.actions.add("unable_to_load_module", lambda args: bad_targets.append(args["bad_source_target"]))
+                with mock.patch.object(core, "console") as console:
+                    core.parse_source_targets([*paths, "not_a_source_file.py"])
+                reports.append(([call.args[0] for call in console.call_args_list
+                    if "Attempting to load" in call.args[0]], bad_targets))
+
+        messages, bad_targets = reports[0]
+        self.assertEqual(len(paths) + 4, len(messages))
+        self.assertIn("from the system path", messages[-1])
+        self.assertListEqual(["not_a_source_file.py"], bad_targets)
+        self.assertListEqual([reports[0]] * 3, reports)
+
+    def test_build_static_with_jobs(self):
+        source = [
+            os.path.join(".", "tests", "core", "test_core_hooks.py"),
+            os.path.join(".", "tests", "core", "test_core_template.py")
+        ]
+
+        parallel_core = Core({"source": source, "parse_mode": "static", "jobs": 2})
+        serial_core = Core({"source": source, "parse_mode": "static"})
+
+        self.assertTrue('parsing_complete' in parallel_core.actions.done)
+        self.assertEqual(serial_core.parsed_results, parallel_core.parsed_results)
+
+    def test_build_with_threads_matches_one_at_a_time(self):
+        with tempfile.TemporaryDirectory() as directory, mock.patch("src.core._gil_enabled", return_value=False):
+            paths = self.write_modules(directory, 12)
+
+            thread_core = Core({"source": [], "jobs": 4, "worker_type": "thread", "verbose": False})
+            parsed_threads = []
+            thread_core.actions.add("parsed_module", lambda: parsed_threads.append(threading.get_ident()))
+            thread_results, loaded = self.parse_recording_modules(thread_core, paths)
+
+            self.assertIn("graphicdocs_package.module_11", loaded)  # Threads import into this process
+            serial_core = Core({"source": paths})
+
+        self.assertListEqual([threading.get_ident()] * 13, parsed_threads)
+        self.assertTrue('parsing_complete' in thread_core.actions.done)
+        self.assertListEqual(["__init__.py"] + [f"module_{i}.py" for i in range(12)],
+            [module["name"] for module in thread_results])
+        # The package lists whichever of its modules other threads imported already, so only the modules match exactly
+        self.assertEqual(serial_core.parsed_results[1:], thread_results[1:])
+        self.assertIs(loaded["graphicdocs_package.module_0"].SHARED,
+            thread_results[1]["classes"]["Class0"]["methods"]["method"]["arguments"][0]["default"])
+
+    def test_build_with_threads_while_gil_enabled_uses_processes(self):
+        with tempfile.TemporaryDirectory() as directory, mock.patch("src.core._gil_enabled", return_value=True):
+            paths = self.write_modules(directory, 4)
+
+            core = Core({"source": paths, "jobs": 2, "worker_type": "thread"})
+
+        self.assertTrue('parsing_complete' in core.actions.done)
+        self.assertNotIn("graphicdocs_package", sys.modules)    # Worker processes did the importing instead
+        self.assertEqual(5, len(core.parsed_results))
+
+    def test_build_with_threads_and_unload_modules(self):
+        with tempfile.TemporaryDirectory() as directory, mock.patch("src.core._gil_enabled", return_value=False):
+            paths = self.write_modules(directory, 4)
+
+            core = Core({"source": paths, "jobs": 2, "worker_type": "thread", "unload_modules": True})
+
+        self.assertTrue('parsing_complete' in core.actions.done)
+        self.assertNotIn("graphicdocs_package", sys.modules)
+        self.assertEqual("list", core.parsed_results[1]["classes"]["Class0"]["methods"]["method"]["arguments"][0]["type"])
+
+    ###############################################################
+    # Parse Build - Isolated Source Files
+    ###############################################################
+
+    def isolated_core(self, config: dict) -> tuple[Core, list[tuple[str, str, str]]]:
+        """A core that isolates source files, along with every failure it reports as (hook, path, reason)."""
+        core = Core({"source": [], "isolate_modules": True, "verbose": False, **config})
+        failures = []
+        def record(hook: str):
+            return lambda args: failures.append((hook, os.path.basename(args["bad_source_target"]), args.get("reason")))
+        core.actions.add("unable_to_load_module", record("unable_to_load_module"))
+        core.actions.add("unable_to_parse", record("unable_to_parse"))
+        return core, failures
+
+    def test_build_isolated_matches_one_at_a_time(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 6)
+            core, failures = self.isolated_core({"jobs": 2, "normalize_values": True})
+
+            parsed = []
+            core.actions.add("parsed_module", lambda: parsed.append(os.getpid()))
+            parsed_results = core.parse_source_targets([paths[1], testmodule, *paths[2:]])
+
+            self.assertNotIn("graphicdocs_package", sys.modules)    # Only the worker processes imported anything
+            serial_core = Core({"source": [], "verbose": False, "normalize_values": True})
+            expected = serial_core.parse_source_targets([paths[1], testmodule, *paths[2:]])
+
+        self.assertListEqual([], failures)
+        self.assertListEqual([os.getpid()] * 7, parsed)
+        self.assertTrue('parsing_complete' in core.actions.done)
+        self.assertListEqual(["module_0.py", "testmodule.py"] + [f"module_{i}.py" for i in range(1, 6)],
+            [module["name"] for module in parsed_results])
+        self.assertEqual(expected, parsed_results)
+
+    def test_build_isolated_skips_a_module_that_takes_too_long(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 4)
+            with open(paths[2], "w") as source_file:
+                source_file.write("import time\ntime.sleep(30)\n")
+
+            core, failures = self.isolated_core({"jobs": 2, "module_timeout": 1})
+            start = time.monotonic()
+            parsed_results = core.parse_source_targets(paths)
+            elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 15)
+        self.assertListEqual([("unable_to_load_module", "module_1.py", "Took longer than 1 seconds.")], failures)
+        self.assertListEqual(["__init__.py", "module_0.py", "module_2.py", "module_3.py"],
+            [module["name"] for module in parsed_results])
+        self.assertTrue('parsing_complete' in core.actions.done)
+
+    @unittest.skipUnless(os.path.exists("/proc/self/statm"), "Needs /proc to measure this process")
+    def test_build_isolated_skips_a_module_that_uses_too_much_memory(self):
+        with open("/proc/self/statm") as statm:
+            address_space = int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 3)
+            with open(paths[2], "w") as source_file:
+                source_file.write("DATA = bytearray(8 * 1024 ** 3)\n")
+
+            # Worker processes start with everything this process has, so the limit leaves room on top of that
+            core, failures = self.isolated_core({"module_memory_limit": address_space + 256})
+            parsed_results = core.parse_source_targets(paths)
+
+        self.assertListEqual([("unable_to_load_module", "module_1.py",
+            f"Went over the memory limit of {address_space + 256} MB.")], failures)
+        self.assertListEqual(["__init__.py", "module_0.py", "module_2.py"],
+            [module["name"] for module in parsed_results])
+
+    def test_build_isolated_skips_a_module_that_crashes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 3)
+            with open(paths[2], "w") as source_file:
+                source_file.write("import os\nos._exit(3)\n")
+
+            core, failures = self.isolated_core({})
+            parsed_results = core.parse_source_targets(paths)
+
+        self.assertListEqual([("unable_to_load_module", "module_1.py", "The worker process stopped with exit code 3.")],
+            failures)
+        self.assertListEqual(["__init__.py", "module_0.py", "module_2.py"], [module["name"] for module in parsed_results])
+        self.assertEqual(3, core.actions.done.count('parsed_module'))
+
+    ###############################################################
+    # Parse Build - Precompiling
+    ###############################################################
+
+    def precompiling_core(self, config: dict) -> tuple[Core, list[dict]]:
+        """A core that compiles source files ahead of time, along with the arguments of each `precompiled_source_files`."""
+        core = Core({"source": [], "precompile": True, "verbose": False, **config})
+        phases = []
+        core.actions.add("precompiled_source_files", lambda args: phases.append(args))
+        return core, phases
+
+    def test_build_precompiled_before_importing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 6)
+            core, phases = self.precompiling_core({"jobs": 2})
+
+            compiled_before_import = []
+            core.filters.add("next_parsing_target", lambda src_path:
+                compiled_before_import.append(_bytecode_is_current(src_path)) or src_path)
+            parsed_results = core.parse_source_targets(paths)
+
+            self.assertListEqual(paths, sorted(phases[0]["compiled"]))
+            self.assertListEqual([True] * 7, compiled_before_import)
+            self.assertTrue(all(os.path.isfile(importlib.util.cache_from_source(path)) for path in paths))
+            self.tearDown()
+            expected = Core({"source": paths, "normalize_values": True}).parsed_results
+
+        self.assertEqual(1, len(phases))
+        self.assertListEqual([], phases[0]["current"])
+        self.assertDictEqual({}, phases[0]["failed"])
+        self.assertGreaterEqual(phases[0]["seconds"], 0)
+        self.assertEqual(expected, parsed_results)
+
+    def test_build_precompiled_skips_current_bytecode(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 3)
+            Core({"source": paths, "precompile": True, "verbose": False})
+            self.tearDown()
+
+            with open(paths[2], "a") as source_file:
+                source_file.write("\nCHANGED = True\n")    # Changes its size, so its bytecode is out of date
+            core, phases = self.precompiling_core({})
+            core.parse_source_targets(paths)
+
+        self.assertListEqual([paths[2]], phases[0]["compiled"])
+        self.assertListEqual([paths[0], paths[1], paths[3]], phases[0]["current"])
+
+    def test_build_precompiled_skips_current_bytecode_with_source_date_epoch(self):
+        # Reproducible builds set this, which makes `py_compile` check bytecode by hash unless told otherwise
+        with tempfile.TemporaryDirectory() as directory, mock.patch.dict(os.environ, {"SOURCE_DATE_EPOCH": "0"}):
+            paths = self.write_modules(directory, 3)
+            Core({"source": paths, "precompile": True, "verbose": False})
+            self.tearDown()
+
+            core, phases = self.precompiling_core({})
+            core.parse_source_targets(paths)
+
+        self.assertListEqual([], phases[0]["compiled"])
+        self.assertListEqual(paths, phases[0]["current"])
+
+    def test_build_precompiled_leaves_errors_for_importing(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 3)
+            with open(paths[2], "w") as source_file:
+                source_file.write("def broken(:\n")
+
+            core, phases = self.precompiling_core({"jobs": 2})
+            bad_targets = []
+            core.actions.add("unable_to_load_module", lambda args: bad_targets.append(args["bad_source_target"]))
+            parsed_results = core.parse_source_targets(paths)
+
+        self.assertListEqual([paths[2]], list(phases[0]["failed"]))
+        self.assertIn("SyntaxError", phases[0]["failed"][paths[2]])
+        self.assertListEqual([paths[2]], bad_targets)
+        self.assertIsNone(parsed_results)
+
+    def test_build_static_does_not_precompile(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.write_modules(directory, 2)
+            core, phases = self.precompiling_core({"parse_mode": "static"})
+            core.parse_source_targets(paths)
+
+            self.assertFalse(os.path.exists(os.path.join(directory, "graphicdocs_package", "__pycache__")))
+        self.assertListEqual([], phases)
+        self.assertTrue('parsing_complete' in core.actions.done)
@@ -6,6 +6,7 @@ import unittest
 import uuid
 
 from src.core import Core
+from src.parser import unregister_docstring_tag
 
 class TestCorePlugins(unittest.TestCase):
 
@@ -222,6 +223,21 @@ class TestCorePlugins(unittest.TestCase):
         self.assertTrue(core.config["SomeTestKey"]) # Verify the plugin added the test key to the core config
 
 
+    def test_plugins_register_custom_tags(self):
+        """A plugin can register a custom docstring tag that the parser extracts from its source targets"""
+
+        plugin_path = os.path.join(os.path.dirname(__file__), "input_files", "test_plugin_custom_tag.py")
+        self.writeConfig(json.dumps({"plugins": [plugin_path], "source": [plugin_path]}))
+
+        try:
+            core = Core(self.config_file_path)
+        finally:
+            unregister_docstring_tag("@threadsafe")
+
+        functions = core.parsed_results[0]["functions"]
+        self.assertTrue(functions["threadsafe_function"]["docstring"]["threadsafe"])
+        self.assertFalse(functions["load"]["docstring"]["threadsafe"])
+
     ###############################################################
     # Invalid Plugins Do Not Cause Errors
     ###############################################################
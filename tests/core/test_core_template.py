@@ -2,6 +2,7 @@ import json
 import os
 import shutil
 import sys
+import threading
 import unittest
 import uuid
 
@@ -410,3 +411,46 @@ class TestCoreTemplate(unittest.TestCase):
         self.assertTrue('build_with_template' in core.actions.done)
         self.assertTrue('error_building_documentation' in core.actions.done)
         self.assertTrue('all_doc_generation_complete' not in core.actions.done)
+
+    ###############################################################
+    # Graphic MD Pages From Several Threads
+    ###############################################################
+
+    def test_graphic_md_pages_built_from_several_threads(self):
+        """Each thread keeps its own table of contents and destination while building a page."""
+        import src.templates.graphic_md.page_builder as page_builder
+
+        core = Core({"verbose": False, "source": [
+            os.path.join(".", "src", "core.py"),
+            os.path.join(".", "src", "hooks.py"),
+            os.path.join(".", "src", "parsed_results.py"),
+            os.path.join(".", "src", "parser.py"),
+            os.path.join(".", "tests", "parser", "input_files", "testmodule_annotations.py"),
+            os.path.join(".", "tests", "parser", "input_files", "testmodule_with_imports.py")
+        ]})
+        pages = [(module, os.path.join(".", "docs", f"folder_{i}", "page.md"))
+            for i, module in enumerate(core.parsed_results)]
+        expected = [page_builder.build_page(module, core, destination) for module, destination in pages]
+
+        results = [None] * len(pages)
+        def build(index):
+            for repeat in range(20):
+                page = page_builder.build_page(pages[index][0], core, pages[index][1])
+                if page != expected[index]:
+                    results[index] = page
+                    return
+            results[index] = page
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)     # Switch threads as often as possible
+        try:
+            threads = [threading.Thread(target=build, args=(index,)) for index in range(len(pages))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        self.assertEqual(6, len(pages))
+        self.assertListEqual(expected, results)
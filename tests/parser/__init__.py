@@ -18,9 +18,19 @@ from tests.parser.test_parse_docstring_todo import TestParseDocstring_Todo
 from tests.parser.test_parse_docstring_version import TestParseDocstring_Version
 
 from tests.parser.test_parse_docstring import TestParseDocstring
+from tests.parser.test_parse_docstring_tokenizer import TestParseDocstring_Tokenizer
+from tests.parser.test_parse_docstring_cache import TestParseDocstring_Cache
+from tests.parser.test_parse_docstring_custom_tags import TestParseDocstring_CustomTags
+from tests.parser.test_parse_docstring_lazy import TestParseDocstring_Lazy
+from tests.parser.test_parse_docstring_scaling import TestParseDocstring_Scaling
+from tests.parser.test_parse_docstrings_batch import TestParseDocstrings_Batch
 
 from tests.parser.test_parse_function import TestParseFunction
 
 from tests.parser.test_parse_class import TestParseClass
 
 from tests.parser.test_parse_module import TestParseModule
+from tests.parser.test_parse_records import TestParseRecords
+from tests.parser.test_parse_line_numbers import TestParseLineNumbers
+from tests.parser.test_parse_normalize import TestParseNormalize
+from tests.parser.test_parse_static import TestParseStatic
@@ -0,0 +1,32 @@
+"""This module writes its annotations the way newer code does, so they are all strings until something resolves them."""
+from __future__ import annotations
+
+import collections
+from typing import List, Optional
+
+LARGE_DEFAULT = list(range(10000))
+
+class Record():
+    """A record that refers to its own class in its annotations."""
+    name: str
+    tags: list[str] | None
+    parent: Optional[Record]
+
+    def __init__(self, name: str, size: int = 3, tags: list[str] | None = None):
+        pass
+
+    def copy(self, into: collections.OrderedDict | None = None) -> Record:
+        """Copies the record."""
+        pass
+
+class SubRecord(Record):
+    """Gets its arguments from the `__init__` of `Record`."""
+    pass
+
+def function(record: Record, values: List[int] = LARGE_DEFAULT, label: str = "short", callback = print) -> Optional[dict[str, int]]:
+    """A function with defaults that are not literals."""
+    pass
+
+def unresolved_function(value: NotDefined, count: int = 1) -> int:
+    """One of its annotations names something that does not exist."""
+    pass
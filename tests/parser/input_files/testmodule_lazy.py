@@ -0,0 +1,37 @@
+"""This module loads names lazily, the way packages that import whole subsystems on first use do. Parsing it should
+    never load any of them."""
+
+import importlib.util
+import os
+
+__all__ = ["LazyClass", "eager_function", "lazy_submodule"]
+
+# Every name the module `__getattr__` gets asked for is recorded here
+lazy_attribute_lookups = []
+
+def _lazy_module(name):
+    """Makes a module that only runs once something reads an attribute from it."""
+    path = os.path.join(os.path.dirname(__file__), "testmodule_only_docstring.py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+lazy_submodule = _lazy_module(__name__ + "_submodule")
+
+def eager_function():
+    """This function is always here."""
+    pass
+
+def __getattr__(name):
+    lazy_attribute_lookups.append(name)
+    if name == "LazyClass":
+        class LazyClass():
+            """This class only gets made when something asks for it."""
+            pass
+        return LazyClass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + ["LazyClass"])
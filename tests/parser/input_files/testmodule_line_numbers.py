@@ -0,0 +1,52 @@
+"""The definitions in here cover the edge cases for working out where classes and functions start and end. Changing
+    anything in here changes the line numbers the tests expect. The file ends without a newline on purpose."""
+
+import functools
+
+def decorator(function_ref):
+    @functools.wraps(function_ref)
+    def wrapper(*args, **kwargs):
+        return function_ref(*args, **kwargs)
+    return wrapper
+
+def one_line_function(): pass
+
+@decorator
+def wrapped_function(first,
+        second):
+    return first
+    # Comments indented as far as the body are part of it
+        # So are comments indented further
+# But not comments less indented than the body
+
+    # Even after ones that are not
+
+trailing_lambda = lambda value: value
+
+class OuterClass():
+    """A class with things nested in it."""
+
+    @staticmethod
+    def static_method():
+        pass
+
+    class InnerClass():
+        def method(self):
+            pass
+        # Part of method
+
+    # Part of OuterClass
+
+if trailing_lambda:
+    class RedefinedClass():
+        """The first one gets used, the same as inspect."""
+else:
+    class RedefinedClass():
+        pass
+
+@functools.total_ordering
+class DecoratedClass():
+    def __eq__(self, other):
+        return True
+    def __lt__(self, other):
+        return False
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""This module covers the kinds of definitions the static parser reads. Changing anything in here changes the line
+    numbers the static parser tests expect."""
+
+from dataclasses import dataclass
+from enum import Enum
+import os.path as path
+import sys
+
+from tests.parser.input_files.testmodule import TestClass1, test_func1, TestClass1 as RenamedClass
+
+MAX_SIZE = 10
+
+def decorator(function_ref):
+    return function_ref
+
+class BaseClass():
+    """A base class."""
+    def __init__(self, first: int, second: str = "two", *args, third=None, **kwargs):
+        pass
+
+class ChildClass(BaseClass):
+    """Inherits its arguments from the base class."""
+    __slots__ = ("slot_value",)
+
+    count: int
+    label: "str | None" = None
+
+    @property
+    def value(self) -> int:
+        """The value."""
+        return 1
+
+    @value.setter
+    def value(self, new_value):
+        pass
+
+    @property
+    def read_only(self):
+        return 2
+
+    @staticmethod
+    def static_method(first, second):
+        pass
+
+    @classmethod
+    def class_method(cls):
+        pass
+
+    @decorator
+    def decorated_method(self, key: str = "key") -> bool:
+        """A decorated method.
+
+        @param key The key
+        """
+        return True
+
+    async def async_method(self):
+        pass
+
+    def _private_method(self):
+        pass
+
+    class NestedClass():
+        def __init__(self, nested_arg):
+            pass
+
+@dataclass
+class DataClass():
+    name: str
+    size: int = 3
+
+class Color(Enum):
+    RED = 1
+
+def function_with_everything(positional, /, regular: list[int] = [1, 2], *args: int, keyword_only: float = 2.5,
+        computed=path.sep, **kwargs) -> dict:
+    """Uses every kind of argument."""
+    pass
+
+async def async_function():
+    pass
+
+def _private_function():
+    pass
+
+if sys.platform:
+    def conditional_function():
+        pass
+
+deleted_name = 1
+del deleted_name
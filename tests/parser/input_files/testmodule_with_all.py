@@ -0,0 +1,32 @@
+"""This module limits its public names with `__all__`. The names left out of it should never get inspected when only
+    parsing exports. Do not change `__all__` without updating the tests that use this module."""
+
+from copy import deepcopy
+import os
+
+__all__ = ["ExportedClass", "exported_func", "deepcopy", "os", "missing_name"]
+
+# Every attribute read from UnexportedClass gets recorded here
+unexported_attribute_reads = []
+
+class RecordingMeta(type):
+    def __getattribute__(cls, name):
+        unexported_attribute_reads.append(name)
+        return super().__getattribute__(name)
+
+class ExportedClass():
+    """This class is exported."""
+    pass
+
+class UnexportedClass(metaclass=RecordingMeta):
+    """This class is not exported."""
+    pass
+
+del RecordingMeta   # The parser does not support metaclasses themselves, so keep it out of the module
+
+def exported_func():
+    """This function is exported."""
+    pass
+
+def unexported_func():
+    pass
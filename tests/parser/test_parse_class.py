@@ -1,10 +1,15 @@
+import collections.abc
 from copy import deepcopy
+import functools
+import inspect
 import os
+import random
 import unittest
+from unittest import mock
 
 from tests.parser.input_files.blank_defaults import blank_parse_docstring_return, blank_parse_class_return
 from tests.parser.input_files.testmodule import TestClass1
-from src.parser import parse_class
+from src.parser import _class_arguments, parse_class, parse_docstring, parse_function
 
 class TestParseClass(unittest.TestCase):
 
@@ -403,3 +408,417 @@ class TestParseClass(unittest.TestCase):
         parsed_return_dict = parse_class(TestClass1)
 
         self.assertDictEqual(expected_parsed_class_return, parsed_return_dict)
+
+    ###############################################################
+    # Nested Classes
+    ###############################################################
+
+    def test_self_referencing_class(self):
+        class TestClass():
+            """This class refers to itself."""
+            def method(self):
+                pass
+        TestClass.Self = TestClass
+
+        parsed_return_dict = parse_class(TestClass)
+
+        self.assertIn("method", parsed_return_dict["methods"])
+        self.assertDictEqual({
+            "annotations": None,
+            "arguments": None,
+            "docstring": parse_docstring("This class refers to itself."),
+            "lineno": None,
+            "methods": None,
+            "name": "TestClass",
+            "parent": None,
+            "properties": None,
+            "sourcefile": None,
+            "subclasses": None
+        }, parsed_return_dict["subclasses"]["TestClass"])
+
+    def test_classes_referencing_each_other(self):
+        class TestClassA():
+            pass
+
+        class TestClassB():
+            Back = TestClassA
+        TestClassA.Forward = TestClassB
+
+        parsed_return_dict = parse_class(TestClassA)
+
+        parsed_subclass = parsed_return_dict["subclasses"]["TestClassB"]
+        self.assertIsNotNone(parsed_subclass["lineno"])
+        self.assertIsNone(parsed_subclass["subclasses"]["TestClassA"]["lineno"])   # Only a reference back
+
+    def test_shared_class_parsed_once(self):
+        class SharedMeta():
+            """Shared by assigning it to other classes."""
+            def method(self, arg1):
+                pass
+
+        class TestClass1():
+            Meta = SharedMeta
+
+        class TestClass2():
+            Meta = SharedMeta
+            AlsoMeta = SharedMeta
+
+        parsed_classes = {}
+        with mock.patch("src.parser._class_arguments", wraps=_class_arguments) as class_arguments:
+            parsed_class1 = parse_class(TestClass1, parsed_classes=parsed_classes)
+            parsed_class2 = parse_class(TestClass2, parsed_classes=parsed_classes)
+
+        self.assertEqual(3, class_arguments.call_count)     # One for each class
+        self.assertIs(parsed_class1["subclasses"]["SharedMeta"], parsed_class2["subclasses"]["SharedMeta"])
+        self.assertListEqual([{"name": "arg1", "type": None, "required": True, "default": None}],
+            parsed_class2["subclasses"]["SharedMeta"]["methods"]["method"]["arguments"])
+
+    def test_deeply_aliased_classes(self):
+        """Every class holds the two before it, so parsing each one from scratch every time would take about 2^40
+        class parses."""
+        classes = [type("TestClass0", (), {})]
+        for i in range(1, 40):
+            classes.append(type(f"TestClass{i}", (), {"First": classes[-1], "Second": classes[max(i - 2, 0)]}))
+
+        parsed_return_dict = parse_class(classes[-1])
+
+        parsed_subclass = parsed_return_dict["subclasses"]["TestClass38"]
+        self.assertIs(parsed_subclass["subclasses"]["TestClass37"], parsed_return_dict["subclasses"]["TestClass37"])
+
+    ###############################################################
+    # Inherited Members
+    ###############################################################
+
+    def test_inherited_members_off_by_default(self):
+        class TestBaseClass():
+            def method(self):
+                pass
+
+        class TestClass(TestBaseClass):
+            pass
+
+        self.assertNotIn("inherited", parse_class(TestClass))
+        self.assertIn("method", parse_class(TestClass, inherited=True)["inherited"][0]["methods"])
+
+    def test_inherited_members_in_method_resolution_order(self):
+        self.maxDiff = None
+
+        class TestBaseClass():
+            def method_a(self):
+                pass
+
+            def method_b(self, arg1):
+                """Documented in the base class."""
+                pass
+
+            @property
+            def prop(self):
+                pass
+
+        class TestMixin():
+            def method_b(self):
+                pass
+
+            def method_c(self):
+                pass
+
+        class TestClass(TestBaseClass, TestMixin):
+            def method_a(self):
+                pass
+
+        parsed_return_dict = parse_class(TestClass, inherited=True)
+        parsed_base = parse_class(TestBaseClass)
+        parsed_mixin = parse_class(TestMixin)
+
+        self.assertListEqual([
+            {
+                "methods": {"method_b": parsed_base["methods"]["method_b"]},
+                "name": "TestBaseClass",
+                "properties": {"prop": parsed_base["properties"]["prop"]}
+            },
+            {
+                "methods": {"method_c": parsed_mixin["methods"]["method_c"]},
+                "name": "TestMixin",
+                "properties": None
+            }
+        ], parsed_return_dict["inherited"])
+        self.assertListEqual(["method_a"], list(parsed_return_dict["methods"]))
+
+    def test_inherited_members_with_diamond_inheritance(self):
+        class TestRoot():
+            def method_a(self):
+                pass
+
+            def method_b(self):
+                pass
+
+        class TestLeft(TestRoot):
+            pass
+
+        class TestRight(TestRoot):
+            def method_b(self):
+                pass
+
+        class TestClass(TestLeft, TestRight):
+            pass
+
+        parsed_return_dict = parse_class(TestClass, inherited=True)
+
+        # The MRO is TestClass, TestLeft, TestRight, TestRoot, so method_b comes from TestRight and not from TestRoot
+        self.assertListEqual([("TestRight", ["method_b"]), ("TestRoot", ["method_a"])],
+            [(parent["name"], list(parent["methods"])) for parent in parsed_return_dict["inherited"]])
+
+    def test_inherited_members_nothing_inherited(self):
+        class TestClass():
+            def method(self):
+                pass
+
+        self.assertIsNone(parse_class(TestClass, inherited=True)["inherited"])
+
+    def test_base_classes_parsed_once(self):
+        class TestBaseClass():
+            def method(self, arg1):
+                pass
+
+        class TestClass1(TestBaseClass):
+            pass
+
+        class TestClass2(TestClass1):
+            pass
+
+        class TestClass3(TestClass1):
+            pass
+
+        parsed_classes = {}
+        with mock.patch("src.parser.parse_function", wraps=parse_function) as parse_function_mock:
+            parsed_results = [parse_class(class_ref, parsed_classes=parsed_classes, inherited=True)
+                for class_ref in (TestClass3, TestClass2, TestClass1)]
+
+        self.assertEqual(1, parse_function_mock.call_count)     # Only TestBaseClass defines a method
+        base_method = parsed_classes[id(TestBaseClass)][1]["methods"]["method"]
+        for parsed_class in parsed_results:
+            self.assertIs(base_method, parsed_class["inherited"][0]["methods"]["method"])
+
+    def test_base_class_referring_to_its_subclass(self):
+        class TestNode():
+            def method(self):
+                pass
+
+        class TestLeaf(TestNode):
+            pass
+        TestNode.Leaf = TestLeaf
+
+        parsed_return_dict = parse_class(TestNode, inherited=True)
+
+        parsed_subclass = parsed_return_dict["subclasses"]["TestLeaf"]
+        self.assertListEqual(["method"], list(parsed_subclass["inherited"][0]["methods"]))
+        self.assertIsNone(parsed_return_dict["inherited"])
+
+    def test_inherited_members_skip_frozen_base_classes(self):
+        # `collections.abc` is frozen into the interpreter, so its classes have no source to read
+        class TestMapping(collections.abc.Mapping):
+            def __getitem__(self, key):
+                pass
+
+            def __iter__(self):
+                pass
+
+            def __len__(self):
+                return 0
+
+            def own_method(self):
+                pass
+
+        class TestClass(TestMapping):
+            pass
+
+        parsed_classes = {}
+        parsed_return_dict = parse_class(TestClass, parsed_classes=parsed_classes, inherited=True)
+
+        self.assertListEqual(["TestMapping"], [base["name"] for base in parsed_return_dict["inherited"]])
+        self.assertListEqual(["own_method"], list(parsed_return_dict["inherited"][0]["methods"]))
+        # Nothing gets left looking like it is still being parsed
+        self.assertTrue(all(parsed_class is not None for _, parsed_class in parsed_classes.values()))
+
+    def test_inherited_members_skip_c_extension_base_classes(self):
+        # `random.Random` is written in Python, but builds on `_random.Random`, which is written in C
+        class TestRandom(random.Random):
+            pass
+
+        parsed_return_dict = parse_class(TestRandom, inherited=True)
+
+        self.assertListEqual(["Random"], [base["name"] for base in parsed_return_dict["inherited"]])
+        self.assertIn("randrange", parsed_return_dict["inherited"][0]["methods"])
+
+    ###############################################################
+    # Descriptors
+    ###############################################################
+
+    def test_descriptors_never_run(self):
+        """Members get sorted by their type straight from the class `__dict__`, so documenting a class never runs its
+        descriptors or asks its metaclass for them."""
+        side_effects = []
+
+        class SideEffectDescriptor():
+            """A descriptor that records every time it gets read."""
+            def __get__(self, instance, owner=None):
+                side_effects.append("get")
+                return lambda: None     # Would look like a method if it were ever read from the class
+
+            def __set__(self, instance, value):
+                side_effects.append("set")
+
+        class SideEffectNonDataDescriptor():
+            def __get__(self, instance, owner=None):
+                side_effects.append("non-data get")
+                return self
+
+        class RecordingMeta(type):
+            def __getattribute__(cls, name):
+                if name[0:2] != "__" and name in super().__getattribute__("__dict__"):
+                    side_effects.append(name)   # Reading a member through the class
+                return super().__getattribute__(name)
+
+        class TestClass(metaclass=RecordingMeta):
+            described = SideEffectDescriptor()
+            non_data_described = SideEffectNonDataDescriptor()
+
+            @functools.cached_property
+            def cached_value(self):
+                side_effects.append("cached")
+
+            def method(self, arg1):
+                pass
+
+            @staticmethod
+            def static_method(arg1, arg2):
+                pass
+
+            @classmethod
+            def class_method(cls):
+                pass
+
+        parsed_return_dict = parse_class(TestClass)
+
+        self.assertListEqual([], side_effects)
+        self.assertDictEqual({
+            "described": {
+                "docstring": parse_docstring("A descriptor that records every time it gets read."),
+                "readable": False,
+                "writable": False
+            }
+        }, parsed_return_dict["properties"])
+        self.assertListEqual(["method", "static_method"], list(parsed_return_dict["methods"]))
+        self.assertListEqual([{"name": "arg2", "type": None, "required": True, "default": None}],
+            parsed_return_dict["methods"]["static_method"]["arguments"])
+
+    ###############################################################
+    # Signatures
+    ###############################################################
+
+    def test_inherited_init_signature_built_once(self):
+        class TestParentClass():
+            def __init__(self, arg1, arg2: int = 2, *args, arg3=3):
+                pass
+
+        class TestChildClass(TestParentClass):
+            pass
+
+        class TestGrandchildClass(TestChildClass):
+            def method(self, arg1):
+                pass
+
+        signatures = {}
+        with mock.patch("inspect.signature", wraps=inspect.signature) as signature:
+            parsed_classes = [parse_class(class_ref, signatures=signatures)
+                for class_ref in (TestParentClass, TestChildClass, TestGrandchildClass)]
+
+        # Once for the shared __init__, and once for the method
+        self.assertEqual(2, signature.call_count)
+        for parsed_return_dict in parsed_classes:
+            self.assertListEqual([
+                {"name": "arg1", "type": any, "required": True, "default": None},
+                {"name": "arg2", "type": int, "required": False, "default": 2}
+            ], parsed_return_dict["arguments"])
+        self.assertIsNot(parsed_classes[0]["arguments"][0], parsed_classes[1]["arguments"][0])
+
+    def test_arguments_from_how_the_class_gets_called(self):
+        """Classes that are not called straight through a plain `__init__` get their arguments the same way as ever."""
+        def decorator(function_ref):
+            @functools.wraps(function_ref)
+            def wrapper(*args, **kwargs):
+                return function_ref(*args, **kwargs)
+            return wrapper
+
+        class TestClassWithNew():
+            def __new__(cls, arg1, arg2=2):
+                return super().__new__(cls)
+
+            def __init__(self, arg1, arg2=2):
+                pass
+
+        class TestClassWithWrappedInit():
+            @decorator
+            def __init__(self, arg1):
+                pass
+
+        class TestClassWithoutInit():
+            pass
+
+        self.assertListEqual([
+            {"name": "arg1", "type": any, "required": True, "default": None},
+            {"name": "arg2", "type": any, "required": False, "default": 2}
+        ], parse_class(TestClassWithNew)["arguments"])
+        self.assertIsNone(parse_class(TestClassWithWrappedInit)["arguments"])
+        self.assertIsNone(parse_class(TestClassWithoutInit)["arguments"])
+
+    ###############################################################
+    # Skipping Private Classes
+    ###############################################################
+
+    def test_skip_private_only_parses_name_and_docstring(self):
+        self.maxDiff = None
+
+        class _TestClass():
+            def __init__(self, arg1):
+                pass
+
+            def method(self):
+                pass
+
+        class TestClassIgnored():
+            """@ignore"""
+            def method(self):
+                pass
+
+        for class_ref in (_TestClass, TestClassIgnored):
+            expected_parsed_class_return = {key: None for key in blank_parse_class_return}
+            expected_parsed_class_return["name"] = class_ref.__name__
+            expected_parsed_class_return["docstring"] = parse_class(class_ref)["docstring"]
+
+            self.assertDictEqual(expected_parsed_class_return, parse_class(class_ref, skip_private=True))
+
+    def test_skip_private_skips_private_methods_and_subclasses(self):
+        self.maxDiff = None
+
+        class TestClass():
+            def public_method(self, arg1):
+                pass
+
+            def _private_method(self, arg1):
+                pass
+
+            class _PrivateSubclass():
+                def method(self, arg1):
+                    pass
+
+        parsed_return_dict = parse_class(TestClass, skip_private=True)
+        full_parsed_return_dict = parse_class(TestClass)
+
+        self.assertDictEqual(full_parsed_return_dict["methods"]["public_method"],
+            parsed_return_dict["methods"]["public_method"])
+        self.assertIsNone(parsed_return_dict["methods"]["_private_method"]["arguments"])
+        self.assertIsNone(parsed_return_dict["methods"]["_private_method"]["lineno"])
+        self.assertTrue(parsed_return_dict["methods"]["_private_method"]["docstring"]["private"])
+        self.assertIsNone(parsed_return_dict["subclasses"]["_PrivateSubclass"]["methods"])
+        self.assertTrue(parsed_return_dict["subclasses"]["_PrivateSubclass"]["docstring"]["private"])
@@ -0,0 +1,166 @@
+from copy import deepcopy
+import sys
+import threading
+import unittest
+
+from tests.parser.input_files.blank_defaults import blank_parse_docstring_return
+from src.parser import clear_docstring_cache, configure_docstring_cache, docstring_cache_info, parse_docstring
+
+class TestParseDocstring_Cache(unittest.TestCase):
+
+    def setUp(self):
+        configure_docstring_cache(True, 1024)
+        clear_docstring_cache()
+
+    def tearDown(self):
+        configure_docstring_cache(True, 1024)
+        clear_docstring_cache()
+
+    ###############################################################
+    # Hits and Misses
+    ###############################################################
+
+    def test_identical_docstrings_hit_the_cache(self):
+        parse_docstring("@private")
+        parse_docstring("@private")
+        parse_docstring("@private")
+        parse_docstring("Some other description")
+
+        info = docstring_cache_info()
+        self.assertEqual(2, info["hits"])
+        self.assertEqual(2, info["misses"])
+        self.assertEqual(2, info["currsize"])
+
+    def test_cached_result_matches_uncached_result(self):
+        docstring = """
+            A description.
+            @param ab A parameter
+            @returns Something
+        """
+        first = parse_docstring(docstring)
+        second = parse_docstring(docstring)
+
+        configure_docstring_cache(False)
+        self.assertDictEqual(parse_docstring(docstring), first)
+        self.assertDictEqual(parse_docstring(docstring), second)
+
+    def test_non_strings_are_not_cached(self):
+        self.assertIsNone(parse_docstring(None))
+        self.assertIsNone(parse_docstring(None))
+
+        info = docstring_cache_info()
+        self.assertEqual(0, info["hits"])
+        self.assertEqual(0, info["misses"])
+
+    ###############################################################
+    # Defensive Copies
+    ###############################################################
+
+    def test_changing_a_result_does_not_change_later_results(self):
+        docstring = """
+            @param ab A parameter
+            @license MIT
+        """
+        first = parse_docstring(docstring)
+        first["private"] = True
+        first["parameters"][0]["ab"] = "Changed"
+        first["parameters"].append({"cd": "Added"})
+        first["license"]["name"] = "Changed"
+
+        expected_docstring_return = deepcopy(blank_parse_docstring_return)
+        expected_docstring_return["parameters"] = [{"ab": "A parameter"}]
+        expected_docstring_return["license"] = {"name": "MIT", "text": None}
+
+        self.assertDictEqual(expected_docstring_return, parse_docstring(docstring))
+        self.assertEqual(1, docstring_cache_info()["hits"])
+
+    ###############################################################
+    # Eviction and Settings
+    ###############################################################
+
+    def test_least_recently_used_entry_is_evicted(self):
+        configure_docstring_cache(True, 2)
+
+        parse_docstring("First")
+        parse_docstring("Second")
+        parse_docstring("First")    # Second is now the least recently used
+        parse_docstring("Third")    # Evicts Second
+        parse_docstring("First")
+
+        info = docstring_cache_info()
+        self.assertEqual(2, info["currsize"])
+        self.assertEqual(2, info["hits"])
+
+        parse_docstring("Second")
+        self.assertEqual(4, docstring_cache_info()["misses"])
+
+    def test_shrinking_the_cache_evicts_entries(self):
+        for i in range(10):
+            parse_docstring(f"Docstring {i}")
+
+        configure_docstring_cache(True, 3)
+        self.assertEqual(3, docstring_cache_info()["currsize"])
+
+        parse_docstring("Docstring 9")
+        self.assertEqual(1, docstring_cache_info()["hits"])
+
+    def test_disabled_cache_stores_nothing(self):
+        configure_docstring_cache(False)
+
+        parse_docstring("@private")
+        parse_docstring("@private")
+
+        info = docstring_cache_info()
+        self.assertFalse(info["enabled"])
+        self.assertEqual(0, info["hits"])
+        self.assertEqual(0, info["currsize"])
+
+    def test_zero_size_cache_stores_nothing(self):
+        configure_docstring_cache(True, 0)
+
+        parse_docstring("@private")
+        parse_docstring("@private")
+
+        info = docstring_cache_info()
+        self.assertEqual(0, info["hits"])
+        self.assertEqual(2, info["misses"])
+        self.assertEqual(0, info["currsize"])
+
+    ###############################################################
+    # Threads
+    ###############################################################
+
+    def test_parsing_from_several_threads(self):
+        """Threads sharing cached docstrings, and the lazy tags in them, all get the same results as parsing alone."""
+        docstrings = [f"Description {i % 12}.\n@param value_{i % 12} A value\n@returns Something\n@since {i % 5}"
+            for i in range(60)]
+        configure_docstring_cache(False)
+        expected = [parse_docstring(docstring) for docstring in docstrings]
+        configure_docstring_cache(True, 8)  # Small enough that threads keep evicting each other's entries
+
+        results = [[] for i in range(8)]
+        def parse(thread_results):
+            for docstring in docstrings * 5:
+                parsed_docstring = parse_docstring(docstring)
+                thread_results.append((parsed_docstring["parameters"], dict(parsed_docstring)))
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)     # Switch threads as often as possible
+        try:
+            threads = [threading.Thread(target=parse, args=(thread_results,)) for thread_results in results]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        for thread_results in results:
+            self.assertEqual(300, len(thread_results))
+            for i, (params, parsed_docstring) in enumerate(thread_results):
+                self.assertEqual(expected[i % 60]["parameters"], params)
+                self.assertEqual(expected[i % 60], parsed_docstring)
+
+        info = docstring_cache_info()
+        self.assertEqual(8 * 300, info["hits"] + info["misses"])
+        self.assertLessEqual(info["currsize"], 8)
@@ -0,0 +1,114 @@
+from copy import deepcopy
+import unittest
+
+from tests.parser.input_files.blank_defaults import blank_parse_docstring_return
+from src.parser import parse_docstring, register_docstring_tag, registered_docstring_tags, unregister_docstring_tag
+from src.parse_docstring_functions import get_since
+
+def get_threadsafe(blocks):
+    return len(blocks) > 0
+
+def get_perf(blocks):
+    if not blocks:
+        return None
+    return [" ".join([block.header[6:]] + block.lines).strip() for block in blocks]
+
+class TestParseDocstring_CustomTags(unittest.TestCase):
+
+    def tearDown(self):
+        for tag in ["@threadsafe", "@perf", "@since-internal", "@returns"]:
+            unregister_docstring_tag(tag)
+
+    ###############################################################
+    # Registering Tags
+    ###############################################################
+
+    def test_custom_tag_extracted_with_built_in_tags(self):
+        register_docstring_tag("@threadsafe", get_threadsafe)
+        register_docstring_tag("@perf", get_perf)
+
+        parsed = parse_docstring("""
+            Does a thing.
+            @perf O(n) in the
+                number of lines
+            @threadsafe
+            @returns Something
+        """)
+
+        expected_docstring_return = deepcopy(blank_parse_docstring_return)
+        expected_docstring_return["description"] = "Does a thing."
+        expected_docstring_return["returns"] = "Something"
+        expected_docstring_return["threadsafe"] = True
+        expected_docstring_return["perf"] = ["O(n) in the number of lines"]
+
+        self.assertDictEqual(expected_docstring_return, parsed)
+
+    def test_custom_tag_handler_called_when_tag_unused(self):
+        register_docstring_tag("@threadsafe", get_threadsafe)
+
+        expected_docstring_return = deepcopy(blank_parse_docstring_return)
+        expected_docstring_return["threadsafe"] = False
+
+        self.assertDictEqual(expected_docstring_return, parse_docstring(""))
+
+    def test_custom_tag_with_own_key(self):
+        register_docstring_tag("@since-internal", lambda blocks: [block.header for block in blocks] or None, "internal")
+
+        parsed = parse_docstring("@since v1.0\n@since-internal build 42")
+
+        self.assertEqual("v1.0", parsed["since"])
+        self.assertEqual(["@since-internal build 42"], parsed["internal"])
+
+    def test_unregistered_tag_falls_back_to_prefix_tag(self):
+        """Without registering it, `@since-internal` is still read as a `@since` tag like it always has been."""
+        self.assertEqual("-internal build 42", parse_docstring("@since-internal build 42")["since"])
+        self.assertEqual("-internal build 42", get_since("@since-internal build 42"))
+
+    def test_replacing_a_built_in_tag_keeps_its_key(self):
+        register_docstring_tag("@returns", lambda blocks: "Replaced", "something_else")
+
+        parsed = parse_docstring("@returns Original")
+        self.assertEqual("Replaced", parsed["returns"])
+        self.assertNotIn("something_else", parsed)
+
+        self.assertTrue(unregister_docstring_tag("@returns"))
+        self.assertEqual("Original", parse_docstring("@returns Original")["returns"])
+
+    def test_registering_clears_cached_results(self):
+        docstring = "@threadsafe"
+        self.assertNotIn("threadsafe", parse_docstring(docstring))
+
+        register_docstring_tag("@threadsafe", get_threadsafe)
+        self.assertTrue(parse_docstring(docstring)["threadsafe"])
+
+        unregister_docstring_tag("@threadsafe")
+        self.assertNotIn("threadsafe", parse_docstring(docstring))
+
+    def test_registered_tags_listed(self):
+        register_docstring_tag("@perf", get_perf)
+
+        tags = registered_docstring_tags()
+        self.assertEqual("parameters", tags["@param"])
+        self.assertEqual("perf", tags["@perf"])
+
+    ###############################################################
+    # Invalid Registrations
+    ###############################################################
+
+    def test_invalid_tag_names_raise(self):
+        for tag in ["threadsafe", "@", "@thread safe", ""]:
+            with self.assertRaises(ValueError):
+                register_docstring_tag(tag, get_threadsafe)
+
+    def test_uncallable_handler_raises(self):
+        with self.assertRaises(TypeError):
+            register_docstring_tag("@threadsafe", "Not a function")
+
+    def test_duplicate_key_raises(self):
+        with self.assertRaises(ValueError):
+            register_docstring_tag("@params", get_threadsafe, "parameters")
+        with self.assertRaises(ValueError):
+            register_docstring_tag("@summary", get_threadsafe, "description")
+
+    def test_unregistering_unknown_tag_returns_false(self):
+        self.assertFalse(unregister_docstring_tag("@not-a-tag"))
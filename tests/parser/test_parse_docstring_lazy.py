@@ -0,0 +1,186 @@
+from copy import deepcopy
+import json
+import pickle
+import unittest
+
+from tests.parser.input_files.blank_defaults import blank_parse_docstring_return
+from src.parsed_results import ParsedDocstring
+from src.parser import clear_docstring_cache, configure_docstring_cache, parse_docstring, register_docstring_tag
+from src.parser import unregister_docstring_tag
+
+class TestParseDocstring_Lazy(unittest.TestCase):
+
+    def setUp(self):
+        configure_docstring_cache(True, 1024)
+        clear_docstring_cache()
+
+        self.calls = []
+        def handle_counted(blocks):
+            if len(blocks) > 0:
+                self.calls.append(blocks[0].header)
+                return blocks[0].header[9:]
+        register_docstring_tag("@counted", handle_counted)
+
+    def tearDown(self):
+        unregister_docstring_tag("@counted")
+        configure_docstring_cache(True, 1024)
+        clear_docstring_cache()
+
+    ###############################################################
+    # Laziness
+    ###############################################################
+
+    def test_tags_are_worked_out_on_first_read(self):
+        docstring = parse_docstring("A description\n@counted first")
+        self.assertEqual([], self.calls)
+
+        self.assertEqual("A description", docstring["description"])
+        self.assertEqual([], self.calls)
+
+        self.assertEqual("first", docstring["counted"])
+        self.assertEqual("first", docstring["counted"])
+        self.assertEqual(["@counted first"], self.calls)
+
+    def test_tags_are_worked_out_once_across_copies(self):
+        for enabled in (True, False):
+            configure_docstring_cache(enabled)
+            self.calls.clear()
+
+            original = parse_docstring("@counted shared")
+            copies = [original.copy() for _ in range(3)]
+            if enabled:
+                copies.append(parse_docstring("@counted shared"))
+
+            for copied in copies + [original]:
+                self.assertEqual("shared", copied["counted"])
+            self.assertEqual(["@counted shared"], self.calls)
+
+    def test_membership_length_and_get_do_not_work_out_tags(self):
+        docstring = parse_docstring("@counted value")
+
+        self.assertIn("counted", docstring)
+        self.assertNotIn("not a key", docstring)
+        self.assertEqual(len(blank_parse_docstring_return) + 1, len(docstring))
+        self.assertTrue(docstring)
+        self.assertEqual([], self.calls)
+
+        self.assertEqual("value", docstring.get("counted"))
+        self.assertEqual("default", docstring.get("not a key", "default"))
+        self.assertEqual(["@counted value"], self.calls)
+
+    def test_malformed_throws_still_raises_while_parsing(self):
+        with self.assertRaises(AttributeError):
+            parse_docstring("A description\n@counted value\n@throws [CustomErrorType")
+
+    def test_malformed_parameters_still_raise_while_parsing(self):
+        for tag_line in ("@param a", "@param {x}", "@param ["):
+            with self.subTest(tag_line), self.assertRaises(AttributeError):
+                parse_docstring(f"A description\n@counted value\n{tag_line}")
+        self.assertEqual([], self.calls)
+
+    def test_built_in_tags_never_raise_once_parsed(self):
+        """A malformed built-in tag raises from `parse_docstring` or not at all, never later when something reads it."""
+        endings = ["", " ", " {x}", " [", " ]", " a", " a b", " [a", " [a] b", " -", " {", "  x"]
+        for tag in ["@author", "@copyright", "@deprecated", "@example", "@global", "@ignore", "@license", "@memberof",
+                "@namespace", "@param", "@private", "@returns", "@since", "@throws", "@todo", "@version"]:
+            for ending in endings:
+                try:
+                    docstring = parse_docstring(f"A description\n{tag}{ending}\n")
+                except AttributeError:
+                    continue
+                with self.subTest(tag + ending):
+                    dict(docstring.items())
+
+    ###############################################################
+    # Dictionary Compatibility
+    ###############################################################
+
+    def test_is_a_dict(self):
+        docstring = parse_docstring("A description")
+
+        self.assertIsInstance(docstring, ParsedDocstring)
+        self.assertIsInstance(docstring, dict)
+
+    def test_equals_plain_dict(self):
+        expected_docstring = deepcopy(blank_parse_docstring_return)
+        expected_docstring["description"] = "A description"
+        expected_docstring["returns"] = "Something"
+        expected_docstring["counted"] = None
+
+        docstring = parse_docstring("A description\n@returns Something")
+        self.assertTrue(docstring == expected_docstring)
+        self.assertTrue(expected_docstring == docstring)
+        self.assertFalse(docstring != expected_docstring)
+        self.assertFalse(expected_docstring != docstring)
+        self.assertDictEqual(expected_docstring, docstring)
+        self.assertEqual({"docstring": expected_docstring}, {"docstring": docstring})
+
+        expected_docstring["returns"] = "Something else"
+        self.assertNotEqual(expected_docstring, docstring)
+
+    def test_keys_keep_their_order_after_partial_reads(self):
+        docstring = parse_docstring("A description\n@returns Something\n@counted value\n@author Someone")
+        docstring["counted"]
+        docstring["returns"]
+
+        self.assertListEqual(["description"] + list(blank_parse_docstring_return)[1:] + ["counted"], list(docstring))
+        self.assertListEqual(list(docstring), list(docstring.keys()))
+        self.assertListEqual(list(docstring), [key for key, _ in docstring.items()])
+        self.assertListEqual([docstring[key] for key in docstring], list(docstring.values()))
+
+    def test_converts_and_serializes_like_a_dict(self):
+        docstring = parse_docstring("A description\n@param ab A parameter\n@counted value")
+        expected = dict(parse_docstring("A description\n@param ab A parameter\n@counted value").items())
+
+        self.assertDictEqual(expected, dict(docstring))
+        self.assertDictEqual(expected, {**docstring})
+        self.assertEqual(json.dumps(expected), json.dumps(docstring))
+        self.assertEqual(repr(expected), repr(docstring))
+
+    def test_serializes_without_any_tags_worked_out(self):
+        for docstring in ("", "@since 1.0", "@counted value"):
+            with self.subTest(docstring):
+                expected = dict(parse_docstring(docstring).items())
+                self.assertDictEqual(expected, json.loads(json.dumps(parse_docstring(docstring))))
+
+    def test_pickles_and_deep_copies(self):
+        docstring = parse_docstring("A description\n@param ab A parameter")
+
+        for copied in (pickle.loads(pickle.dumps(docstring)), deepcopy(docstring)):
+            self.assertIsInstance(copied, ParsedDocstring)
+            self.assertDictEqual(docstring, copied)
+
+    ###############################################################
+    # Changes
+    ###############################################################
+
+    def test_setting_a_pending_key_replaces_it(self):
+        docstring = parse_docstring("@counted value")
+        docstring["counted"] = "replaced"
+
+        self.assertEqual("replaced", docstring["counted"])
+        self.assertEqual([], self.calls)
+
+    def test_deleting_a_pending_key_removes_it(self):
+        docstring = parse_docstring("@counted value")
+        del docstring["counted"]
+
+        self.assertNotIn("counted", docstring)
+        self.assertEqual(len(blank_parse_docstring_return), len(docstring))
+        with self.assertRaises(KeyError):
+            docstring["counted"]
+
+    def test_changing_a_copy_does_not_change_the_original(self):
+        original = parse_docstring("@param ab A parameter\n@counted value")
+        copied = original.copy()
+
+        copied["parameters"][0]["ab"] = "Changed"
+        copied["counted"] = "Changed"
+        original["private"] = True
+
+        self.assertEqual("A parameter", original["parameters"][0]["ab"])
+        self.assertEqual("value", original["counted"])
+        self.assertFalse(copied["private"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -152,6 +152,13 @@ class TestParseDocstring_Param(unittest.TestCase):
 
         self.assertDictEqual(expected_docstring_return, returned_dict)
 
+    def test_only_parameter_missing_description(self):
+        """Should raise an exception because there is nothing after the parameter name"""
+        description_entry = """@param my_test_parameter"""
+
+        with self.assertRaises(AttributeError):
+            parse_docstring(description_entry)
+
     def test_only_single_parameter_no_desc_extra_space_before_parameter_name(self):
         """The extra spaces between the @param tag and the parameter name and the name/description should not cause a problem"""
         description_entry = """
@@ -0,0 +1,78 @@
+import gc
+import time
+import unittest
+
+import src.parse_docstring_functions as parse_docstring_functions
+from src.parser import clear_docstring_cache, configure_docstring_cache, parse_docstring
+
+# Each shape builds a docstring with roughly `lines` lines that pushes one tag parser as hard as possible
+SHAPES = {
+    "description lists": (parse_docstring_functions.get_description, lambda lines: "\n".join(
+        ("- item", "<ul>item", "<ol>1. item", "text", "")[i % 5] for i in range(lines))),
+    "whitespace only lines": (parse_docstring_functions.get_description, lambda lines: "text\n" + "    \n" * lines),
+    "authors": (parse_docstring_functions.get_authors, lambda lines: "@author Name [name@example.com]\n" * lines),
+    "copyright continuation": (parse_docstring_functions.get_copyright, lambda lines: "@copyright Someone\n" + "more\n" * lines),
+    "deprecated continuation": (parse_docstring_functions.get_deprecated, lambda lines: "@deprecated Old\n" + "more\n" * lines),
+    "huge example": (parse_docstring_functions.get_examples, lambda lines: "@example Caption\n" + "    code()\n" * lines),
+    "empty examples absorbing tags": (parse_docstring_functions.get_examples, lambda lines: "@example\n" + "@since\n\n" * (lines // 2)),
+    "license continuation": (parse_docstring_functions.get_license, lambda lines: "@license MIT\n" + "more\n" * lines),
+    "memberofs": (parse_docstring_functions.get_memberof, lambda lines: "".join(f"@memberof Member{i}\n" for i in range(lines))),
+    "namespace continuation": (parse_docstring_functions.get_namespaces, lambda lines: "@namespace Name\n" + "more\n" * lines),
+    "unique params": (parse_docstring_functions.get_parameters, lambda lines: "".join(f"@param p{i} Parameter {i}\n" for i in range(lines))),
+    "repeated param absorbing tags": (parse_docstring_functions.get_parameters, lambda lines: "@param ab first\n" + "@param ab again\n@since 1\nmore\n" * (lines // 3)),
+    "returns continuation": (parse_docstring_functions.get_returns, lambda lines: "@returns Something\n" + "more\n" * lines),
+    "since continuation": (parse_docstring_functions.get_since, lambda lines: "@since 1.0\n" + "more\n" * lines),
+    "throws": (parse_docstring_functions.get_throws, lambda lines: "@throws [ValueError] When it is wrong\n" * lines),
+    "throws continuation": (parse_docstring_functions.get_throws, lambda lines: "@throws [ValueError] When\n" + "more\n" * lines),
+    "todo continuation": (parse_docstring_functions.get_todo, lambda lines: "@todo Something\n" + "more\n" * lines),
+    "version continuation": (parse_docstring_functions.get_version, lambda lines: "@version 1.0\n" + "more\n" * lines),
+    "every tag": (lambda docstring: dict(parse_docstring(docstring)), lambda lines: "Description\n" + "".join(
+        f"@param p{i} Parameter\n@throws [Error{i}] Thrown\n@memberof Member{i}\n@example\n    code\n" for i in range(lines // 5))),
+}
+
+SIZES = (1000, 10000, 100000)
+
+# Ten times the lines should take about ten times as long. Anything quadratic takes about a hundred times as long, so this
+#   leaves plenty of room for timing noise while still catching it.
+MAX_GROWTH = 35
+
+class TestParseDocstring_Scaling(unittest.TestCase):
+
+    def setUp(self):
+        configure_docstring_cache(False)
+
+    def tearDown(self):
+        configure_docstring_cache(True, 1024)
+        clear_docstring_cache()
+
+    def time_parse(self, parse, docstring: str) -> float:
+        """The best of a few runs, so a single slow run from something else on the machine does not fail the test."""
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            parse(docstring)
+            elapsed = time.perf_counter() - start
+            if best is None or elapsed < best:
+                best = elapsed
+        return best
+
+    ###############################################################
+    # Linear Growth
+    ###############################################################
+
+    def test_every_tag_parser_scales_linearly(self):
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for name, (parse, make_docstring) in SHAPES.items():
+                with self.subTest(shape=name):
+                    times = [self.time_parse(parse, make_docstring(lines)) for lines in SIZES]
+                    for smaller, larger in zip(times, times[1:]):
+                        # Guard against a timer too coarse to see the smaller run at all
+                        self.assertLess(larger / max(smaller, 1e-5), MAX_GROWTH, f"{name}: {times}")
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+from copy import deepcopy
+import unittest
+
+from tests.parser.input_files.blank_defaults import blank_parse_docstring_return
+from src.parser import parse_docstring
+from src.parse_docstring_functions import tokenize_docstring
+import src.parse_docstring_functions as parse_docstring_functions
+
+class TestParseDocstring_Tokenizer(unittest.TestCase):
+
+    ###############################################################
+    # Tokenizer
+    ###############################################################
+
+    def test_description_and_blocks_split(self):
+        description, blocks = tokenize_docstring("""
+            This is the description.
+
+            @param abc The parameter
+                continues here.
+            @returns Nothing
+        """)
+
+        self.assertListEqual(["", "This is the description.", ""], description)
+        self.assertListEqual(["@param", "@returns"], list(blocks.keys()))
+        self.assertEqual("@param abc The parameter", blocks["@param"][0].header)
+        self.assertListEqual(["continues here."], blocks["@param"][0].lines)
+        self.assertIs(blocks["@returns"][0], blocks["@param"][0].next)
+        self.assertIsNone(blocks["@returns"][0].next)
+
+    def test_blocks_grouped_by_owning_tag(self):
+        description, blocks = tokenize_docstring("@param ab One\n@returns Value\n@param cd Two\n@unknown Thing")
+
+        self.assertListEqual([], description)
+        self.assertListEqual(["@param ab One", "@param cd Two"], [block.header for block in blocks["@param"]])
+        self.assertListEqual(["@unknown Thing"], [block.header for block in blocks["@unknown"]])
+
+    def test_prefix_tags_claim_unrecognized_tags(self):
+        """Tags that have always matched on the start of the line still claim lines like `@sincev1`."""
+        description, blocks = tokenize_docstring("@sincev1\n@version\tv2\n@params ab Not a param")
+
+        self.assertEqual("@sincev1", blocks["@since"][0].header)
+        self.assertEqual("@version\tv2", blocks["@version"][0].header)
+        self.assertEqual("@params ab Not a param", blocks["@params"][0].header)
+
+    ###############################################################
+    # Single Pass Matches Individual Tag Functions
+    ###############################################################
+
+    def test_single_pass_matches_each_tag_function(self):
+        docstring = """
+            Description line one
+            continues here.
+
+            - bullet
+            @param ab First param
+                spills over
+            @param cd Second
+            @returns Something
+            @throws [ValueError] bad value
+            @since v1.0
+            @version 2.0
+            @deprecated
+            @license MIT
+                License text
+            @copyright 2022 Someone
+            @todo first
+            @author John Doe [john@doe.com]
+            @memberof Tools
+            @namespace Tools
+            @global
+            @ignore
+            @private
+            @example Caption here
+            x = 1
+        """
+
+        parsed = parse_docstring(docstring)
+
+        self.assertEqual(parse_docstring_functions.get_description(docstring), parsed["description"])
+        self.assertEqual(parse_docstring_functions.get_authors(docstring), parsed["author"])
+        self.assertEqual(parse_docstring_functions.get_copyright(docstring), parsed["copyright"])
+        self.assertEqual(parse_docstring_functions.get_deprecated(docstring), parsed["deprecated"])
+        self.assertEqual(parse_docstring_functions.get_examples(docstring), parsed["examples"])
+        self.assertEqual(parse_docstring_functions.get_global(docstring), parsed["global"])
+        self.assertEqual(parse_docstring_functions.get_ignore(docstring), parsed["ignore"])
+        self.assertEqual(parse_docstring_functions.get_license(docstring), parsed["license"])
+        self.assertEqual(parse_docstring_functions.get_memberof(docstring), parsed["memberof"])
+        self.assertEqual(parse_docstring_functions.get_namespaces(docstring), parsed["namespaces"])
+        self.assertEqual(parse_docstring_functions.get_parameters(docstring), parsed["parameters"])
+        self.assertEqual(parse_docstring_functions.get_private(docstring), parsed["private"])
+        self.assertEqual(parse_docstring_functions.get_returns(docstring), parsed["returns"])
+        self.assertEqual(parse_docstring_functions.get_since(docstring), parsed["since"])
+        self.assertEqual(parse_docstring_functions.get_throws(docstring), parsed["throws"])
+        self.assertEqual(parse_docstring_functions.get_todo(docstring), parsed["todo"])
+        self.assertEqual(parse_docstring_functions.get_version(docstring), parsed["version"])
+
+    ###############################################################
+    # Blocks That Carry Over Into Following Tags
+    ###############################################################
+
+    def test_repeated_param_records_following_tag_lines(self):
+        """A repeated `@param` overwrites the original and keeps recording lines up until the next `@param`."""
+        docstring = """@param ab one
+        @param ab two
+        @returns r
+            swallowed by repeated param
+        @example
+        @returns after
+        """
+        expected_docstring_return = deepcopy(blank_parse_docstring_return)
+        expected_docstring_return["parameters"] = [{"ab": "two swallowed by repeated param"}]
+        expected_docstring_return["returns"] = "after"
+
+        self.assertDictEqual(expected_docstring_return, parse_docstring(docstring))
+
+    def test_empty_example_records_following_tag_lines(self):
+        """An `@example` without code keeps recording lines up until it has some or the next `@example` starts."""
+        docstring = """
+            @example
+            @param ef swallowed
+                cont lines
+            @todo
+        """
+        expected_docstring_return = deepcopy(blank_parse_docstring_return)
+        expected_docstring_return["parameters"] = [{"ef": "swallowed cont lines"}]
+        expected_docstring_return["examples"] = [{"caption": None, "code": "    cont lines"}]
+
+        self.assertDictEqual(expected_docstring_return, parse_docstring(docstring))
+
+    def test_copyright_and_todo_keep_leading_spaces_unless_ended_by_another_tag(self):
+        docstring = """
+            @copyright   2022 Someone
+            @copyright 2023 Other
+            @todo   spaced todo
+            @param xy desc
+            @todo   last todo
+        """
+        expected_docstring_return = deepcopy(blank_parse_docstring_return)
+        expected_docstring_return["copyright"] = ["  2022 Someone", "2023 Other"]
+        expected_docstring_return["todo"] = ["spaced todo", "  last todo"]
+        expected_docstring_return["parameters"] = [{"xy": "desc"}]
+
+        self.assertDictEqual(expected_docstring_return, parse_docstring(docstring))
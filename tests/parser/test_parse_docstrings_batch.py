@@ -0,0 +1,111 @@
+from copy import deepcopy
+import unittest
+
+from tests.parser.input_files.blank_defaults import blank_parse_docstring_return
+from tests.parser.input_files import testmodule
+from src.parser import clear_docstring_cache, configure_docstring_cache, docstring_cache_info, parse_docstring, parse_docstrings
+from src.parser import parse_module
+
+class TestParseDocstrings_Batch(unittest.TestCase):
+
+    def setUp(self):
+        configure_docstring_cache(True, 1024)
+        clear_docstring_cache()
+
+    def tearDown(self):
+        configure_docstring_cache(True, 1024)
+        clear_docstring_cache()
+
+    ###############################################################
+    # Results
+    ###############################################################
+
+    def test_results_are_in_input_order(self):
+        docstrings = [
+            "First description",
+            "@private",
+            "Second description\n@returns Something",
+        ]
+        results = parse_docstrings(docstrings)
+
+        self.assertEqual(len(docstrings), len(results))
+        for docstring, result in zip(docstrings, results):
+            self.assertDictEqual(parse_docstring(docstring), result)
+
+    def test_accepts_any_iterable(self):
+        results = parse_docstrings(docstring for docstring in ("One", "Two"))
+
+        self.assertEqual("One", results[0]["description"])
+        self.assertEqual("Two", results[1]["description"])
+
+    def test_non_strings_return_none(self):
+        expected_docstring = deepcopy(blank_parse_docstring_return)
+        expected_docstring["description"] = "A description"
+
+        results = parse_docstrings([None, "A description", 12, None])
+        self.assertListEqual([None, expected_docstring, None, None], results)
+
+    def test_empty_batch_returns_empty_list(self):
+        self.assertListEqual([], parse_docstrings([]))
+
+    def test_matches_uncached_results(self):
+        docstrings = ["@param ab A parameter\n@license MIT", "@todo Something", "@param ab A parameter\n@license MIT"]
+        cached = parse_docstrings(docstrings)
+
+        configure_docstring_cache(False)
+        self.assertListEqual(cached, parse_docstrings(docstrings))
+        self.assertListEqual(cached, [parse_docstring(docstring) for docstring in docstrings])
+
+    ###############################################################
+    # Deduplication
+    ###############################################################
+
+    def test_identical_docstrings_are_parsed_once(self):
+        parse_docstrings(["@private", "@private", "A description", "@private", "A description"])
+
+        info = docstring_cache_info()
+        self.assertEqual(0, info["hits"])
+        self.assertEqual(2, info["misses"])
+
+    def test_identical_docstrings_get_their_own_copies(self):
+        for enabled in (True, False):
+            configure_docstring_cache(enabled)
+            first, second = parse_docstrings(["@param ab A parameter", "@param ab A parameter"])
+            self.assertIsNot(first, second)
+            self.assertIsNot(first["parameters"], second["parameters"])
+
+            first["parameters"][0]["ab"] = "Changed"
+            first["private"] = True
+            self.assertEqual("A parameter", second["parameters"][0]["ab"])
+            self.assertFalse(second["private"])
+
+    def test_changing_a_result_does_not_change_the_cache(self):
+        docstring = "@param ab A parameter"
+        parse_docstrings([docstring])[0]["parameters"].clear()
+
+        self.assertEqual(1, len(parse_docstring(docstring)["parameters"]))
+
+    ###############################################################
+    # Modules
+    ###############################################################
+
+    def test_module_results_do_not_depend_on_the_cache(self):
+        self.maxDiff = None
+
+        cached = parse_module(testmodule)
+        configure_docstring_cache(False)
+        self.assertDictEqual(cached, parse_module(testmodule))
+
+    def test_module_docstrings_are_parsed_once(self):
+        parse_module(testmodule)
+        first = docstring_cache_info()
+
+        parse_module(testmodule)
+        second = docstring_cache_info()
+
+        self.assertGreater(first["misses"], 0)
+        self.assertEqual(first["misses"], second["misses"])
+        self.assertEqual(first["misses"], second["hits"] - first["hits"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 from copy import deepcopy
+import inspect
 import os
 import unittest
+from unittest import mock
 
 from tests.parser.input_files.blank_defaults import blank_parse_docstring_return
 from tests.parser.input_files.testmodule import test_func1
@@ -262,3 +264,73 @@ class TestParseFunction(unittest.TestCase):
         parsed_return_dict = parse_function(test_func1)
 
         self.assertDictEqual(expected_parsed_function_return, parsed_return_dict)
+
+    ###############################################################
+    # Signatures
+    ###############################################################
+
+    def test_signature_built_once(self):
+        def test_func(arg1, arg2: int, arg3=3, *args, arg4: str = "four", **kwargs):
+            pass
+
+        with mock.patch("inspect.signature", wraps=inspect.signature) as signature:
+            parsed_return_dict = parse_function(test_func)
+
+        self.assertEqual(1, signature.call_count)
+        self.assertListEqual([
+            {"name": "arg1", "type": None, "required": True, "default": None},
+            {"name": "arg2", "type": int, "required": True, "default": None},
+            {"name": "arg3", "type": None, "required": False, "default": 3},
+            {"name": "args", "type": None, "required": True, "default": None},
+            {"name": "arg4", "type": str, "required": False, "default": "four"},
+            {"name": "kwargs", "type": None, "required": True, "default": None}
+        ], parsed_return_dict["arguments"])
+
+    def test_signatures_are_shared(self):
+        def test_func(arg1):
+            pass
+
+        signatures = {}
+        parse_function(test_func, signatures=signatures)
+
+        with mock.patch("inspect.signature", wraps=inspect.signature) as signature:
+            self.assertDictEqual(parse_function(test_func), parse_function(test_func, signatures=signatures))
+
+        self.assertEqual(1, signature.call_count)   # Only for the call without the shared signatures
+        self.assertListEqual([test_func], list(signatures))
+
+    ###############################################################
+    # Skipping Private Functions
+    ###############################################################
+
+    def test_skip_private_only_parses_name_and_docstring(self):
+        """With `skip_private`, private and ignored functions keep their docstring so templates still know to leave
+        them out, but nothing else about them gets looked up."""
+        self.maxDiff = None
+
+        def _test_func(arg1):
+            """This function does some things."""
+            pass
+
+        def test_func_private(arg1):
+            """@private"""
+            pass
+
+        def test_func_ignored(arg1):
+            """@ignore"""
+            pass
+
+        for function_ref in (_test_func, test_func_private, test_func_ignored):
+            parsed_return_dict = parse_function(function_ref, skip_private=True)
+
+            self.assertDictEqual({
+                "arguments": None,
+                "docstring": parse_function(function_ref)["docstring"],
+                "lineno": None,
+                "name": function_ref.__name__,
+                "returns": None,
+                "sourcefile": None
+            }, parsed_return_dict)
+
+    def test_skip_private_parses_public_functions_in_full(self):
+        self.assertDictEqual(parse_function(test_func1), parse_function(test_func1, skip_private=True))
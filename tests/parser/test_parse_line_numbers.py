@@ -0,0 +1,112 @@
+import ast
+import importlib.util
+import inspect
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from src.parser import parse_class, parse_function, parse_module
+from tests.parser.input_files import testmodule, testmodule_line_numbers
+
+def inspect_lineno(object_ref) -> tuple[int, int]:
+    """The line numbers the parser used to get by calling `inspect.findsource` and `inspect.getsource` on each object."""
+    linestart = inspect.findsource(object_ref)[1] + 1
+    return (linestart, linestart + inspect.getsource(object_ref).count("\n") - 1)
+
+class TestParseLineNumbers(unittest.TestCase):
+
+    ###############################################################
+    # Matching inspect
+    ###############################################################
+
+    def test_line_numbers(self):
+        parsed_return_dict = parse_module(testmodule_line_numbers)
+
+        self.assertEqual((6, 10), parsed_return_dict["functions"]["decorator"]["lineno"])
+        self.assertEqual((12, 12), parsed_return_dict["functions"]["one_line_function"]["lineno"])
+        self.assertEqual((24, 24), parsed_return_dict["functions"]["<lambda>"]["lineno"])
+        self.assertEqual((26, 38), parsed_return_dict["classes"]["OuterClass"]["lineno"])
+        self.assertEqual((29, 31), parsed_return_dict["classes"]["OuterClass"]["methods"]["static_method"]["lineno"])
+        self.assertEqual((33, 36), parsed_return_dict["classes"]["OuterClass"]["subclasses"]["InnerClass"]["lineno"])
+        self.assertEqual((41, 42), parsed_return_dict["classes"]["RedefinedClass"]["lineno"])
+        self.assertEqual((47, 52), parsed_return_dict["classes"]["DecoratedClass"]["lineno"])
+
+    def test_wrapped_function_line_numbers(self):
+        """Like inspect, a wrapped function starts where its wrapper does but is as long as the function it wraps."""
+        parsed_return_dict = parse_module(testmodule_line_numbers)
+
+        self.assertEqual((7, 15), parsed_return_dict["functions"]["wrapped_function"]["lineno"])
+
+    def test_line_numbers_match_inspect(self):
+        for module in (testmodule, testmodule_line_numbers):
+            parsed_return_dict = parse_module(module)
+
+            for name, parsed_function in parsed_return_dict["functions"].items():
+                function_ref = getattr(module, name, None) or module.trailing_lambda
+                self.assertEqual(inspect_lineno(function_ref), parsed_function["lineno"], name)
+
+            for name, parsed_class in parsed_return_dict["classes"].items():
+                class_ref = getattr(module, name)
+                self.assertEqual(inspect_lineno(class_ref), parsed_class["lineno"], name)
+                self.assertEqual(inspect.getsourcefile(class_ref), parsed_class["sourcefile"], name)
+                for method_name, parsed_method in (parsed_class["methods"] or {}).items():
+                    method_ref = inspect.unwrap(getattr(class_ref, method_name))
+                    self.assertEqual(inspect_lineno(method_ref), parsed_method["lineno"], method_name)
+
+    def test_line_numbers_without_shared_sources(self):
+        self.assertEqual((6, 10), parse_function(testmodule_line_numbers.decorator)["lineno"])
+        self.assertEqual((26, 38), parse_class(testmodule_line_numbers.OuterClass)["lineno"])
+
+    def test_class_without_source(self):
+        class_ref = type("ClassWithoutSource", (), {"__module__": testmodule_line_numbers.__name__})
+
+        parsed_return_dict = parse_class(class_ref)
+
+        self.assertEqual((1, 1), parsed_return_dict["lineno"])
+        self.assertEqual(testmodule_line_numbers.__file__, parsed_return_dict["sourcefile"])
+
+    ###############################################################
+    # Source Index
+    ###############################################################
+
+    def test_sources_are_shared(self):
+        sources = {}
+
+        parse_class(testmodule_line_numbers.OuterClass, sources=sources)
+        parse_function(testmodule_line_numbers.decorator, sources=sources)
+
+        self.assertListEqual([testmodule_line_numbers.__file__], list(sources))
+        self.assertEqual(testmodule_line_numbers.__file__, sources[testmodule_line_numbers.__file__]["sourcefile"])
+
+    def test_large_module_is_parsed_once(self):
+        """Every member of a module shares one parse of its source, instead of each one searching and tokenizing it."""
+        source = []
+        for i in range(500):
+            source.append(f"def function_{i}(value):\n    \"\"\"Function {i}.\"\"\"\n    return value\n")
+            source.append(f"class Class_{i}():\n    def method(self):\n        pass\n    # Comment {i}\n")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "line_numbers_generated_module.py")
+            with open(path, "w") as file:
+                file.write("\n".join(source))
+
+            spec = importlib.util.spec_from_file_location("line_numbers_generated_module", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            # Classes find their source file through the module they were defined in
+            with mock.patch.dict(sys.modules, {spec.name: module}), mock.patch("ast.parse", wraps=ast.parse) as parse, \
+                    mock.patch("inspect.getblock") as getblock:
+                parsed_return_dict = parse_module(module)
+
+        # inspect.signature also uses ast.parse on the text signatures of built in functions, so only count the module
+        self.assertEqual(1, len([call for call in parse.call_args_list if "def function_0(" in call.args[0]]))
+        self.assertEqual(0, getblock.call_count)
+        self.assertEqual((4496, 4499), parsed_return_dict["classes"]["Class_499"]["lineno"])
+        self.assertEqual((4497, 4498), parsed_return_dict["classes"]["Class_499"]["methods"]["method"]["lineno"])
+        self.assertEqual((4492, 4494), parsed_return_dict["functions"]["function_499"]["lineno"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,14 @@
 from copy import deepcopy
 import os
+import types
 import unittest
 
-from src.parser import parse_module
+from src.parser import parse_docstring, parse_module
 from tests.parser.input_files.blank_defaults import blank_parse_docstring_return, blank_parse_class_return, blank_parse_module_return, blank_parsed_function_return
 from tests.parser.input_files import testmodule
+from tests.parser.input_files import testmodule_lazy
 from tests.parser.input_files import testmodule_only_docstring
+from tests.parser.input_files import testmodule_with_all
 from tests.parser.input_files import testmodule_with_imports
 
 class TestParseModule(unittest.TestCase):
@@ -86,7 +89,24 @@ class TestParseModule(unittest.TestCase):
         expected_parsed_module_return["functions"]["test_func3"]["sourcefile"] = parsed_return_dict["functions"]["test_func3"]["sourcefile"]
 
         self.assertDictEqual(expected_parsed_module_return, parsed_return_dict)
-    
+
+    def test_module_with_docstrings_that_are_not_strings(self):
+        """Anything can get assigned to `__doc__`, even something that cannot be hashed. It gets no parsed docstring, and
+        the rest of the module still parses the same."""
+        expected_parsed_module_return = parse_module(testmodule)
+        expected_parsed_module_return["functions"]["test_func1"]["docstring"] = None
+        expected_parsed_module_return["classes"]["TestClass1"]["docstring"] = None
+
+        original_docstrings = testmodule.test_func1.__doc__, testmodule.TestClass1.__doc__
+        testmodule.test_func1.__doc__ = ["Not a string"]
+        testmodule.TestClass1.__doc__ = {"description": "Not a string"}
+        try:
+            parsed_return_dict = parse_module(testmodule)
+        finally:
+            testmodule.test_func1.__doc__, testmodule.TestClass1.__doc__ = original_docstrings
+
+        self.assertDictEqual(expected_parsed_module_return, parsed_return_dict)
+
     def test_module_only_docstring(self):
         """This test only covers the module with a docstring. It verifies the proper `None` return result for the
         other properties when they do not have any object in that category."""
@@ -117,3 +137,76 @@ class TestParseModule(unittest.TestCase):
         parsed_return_dict = parse_module(testmodule_with_imports)
 
         self.assertDictEqual(expected_parsed_module_return, parsed_return_dict)
+
+    ###############################################################
+    # Lazy Loading
+    ###############################################################
+
+    def test_module_does_not_load_lazy_names(self):
+        """Members get read from the module `__dict__`, so neither a module `__getattr__` nor a lazily loaded module
+        imported into it runs just to be documented."""
+        testmodule_lazy.lazy_attribute_lookups.clear()
+
+        for exports_only in (False, True):
+            parsed_return_dict = parse_module(testmodule_lazy, exports_only=exports_only)
+
+            self.assertEqual([], testmodule_lazy.lazy_attribute_lookups)
+            self.assertIsNot(types.ModuleType, type(testmodule_lazy.lazy_submodule))  # Still waiting to be loaded
+            self.assertIsNone(parsed_return_dict["classes"])
+            self.assertIn("eager_function", parsed_return_dict["functions"])
+            self.assertIn("lazy_submodule", parsed_return_dict["imported"]["modules"])
+
+        self.assertListEqual(["__dir__", "__getattr__", "_lazy_module", "eager_function"],
+            list(parse_module(testmodule_lazy)["functions"]))
+
+    ###############################################################
+    # Skipping Private Objects
+    ###############################################################
+
+    def test_module_skip_private(self):
+        """Only the private class in the test module gets skipped. Everything else matches a full parse."""
+        self.maxDiff = None
+
+        expected_parsed_module_return = parse_module(testmodule)
+        expected_parsed_module_return["classes"]["_TestClass2"] = {
+            key: None for key in expected_parsed_module_return["classes"]["_TestClass2"]
+        }
+        expected_parsed_module_return["classes"]["_TestClass2"]["name"] = "_TestClass2"
+        expected_parsed_module_return["classes"]["_TestClass2"]["docstring"] = parse_docstring("@private")
+
+        self.assertDictEqual(expected_parsed_module_return, parse_module(testmodule, skip_private=True))
+
+    ###############################################################
+    # Exports Only
+    ###############################################################
+
+    def test_module_exports_only(self):
+        """Only the names in `__all__` get parsed, and names `__all__` lists that do not exist get skipped."""
+        self.maxDiff = None
+
+        full_parsed_return_dict = parse_module(testmodule_with_all)
+        testmodule_with_all.unexported_attribute_reads.clear()
+
+        parsed_return_dict = parse_module(testmodule_with_all, exports_only=True)
+
+        self.assertEqual([], testmodule_with_all.unexported_attribute_reads)
+        self.assertDictEqual({"ExportedClass": full_parsed_return_dict["classes"]["ExportedClass"]},
+            parsed_return_dict["classes"])
+        self.assertDictEqual({"exported_func": full_parsed_return_dict["functions"]["exported_func"]},
+            parsed_return_dict["functions"])
+        self.assertDictEqual({
+            "classes": None,
+            "functions": [("copy", "deepcopy")],
+            "modules": ["os"]
+        }, parsed_return_dict["imported"])
+
+    def test_module_exports_only_without_all_parses_everything(self):
+        self.maxDiff = None
+
+        self.assertDictEqual(parse_module(testmodule_with_imports), parse_module(testmodule_with_imports, exports_only=True))
+
+    def test_module_without_exports_only_ignores_all(self):
+        parsed_return_dict = parse_module(testmodule_with_all)
+
+        self.assertIn("UnexportedClass", parsed_return_dict["classes"])
+        self.assertIn("unexported_func", parsed_return_dict["functions"])
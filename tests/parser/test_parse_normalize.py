@@ -0,0 +1,133 @@
+import gc
+import pickle
+import typing
+import unittest
+from unittest import mock
+import weakref
+
+from tests.parser.input_files import testmodule_annotations
+from src.parser import parse_class, parse_function, parse_module
+
+def leaf_types(value, found: set | None = None) -> set:
+    """The type of every value in a parse result that is not a dict, list, or tuple."""
+    found = set() if found is None else found
+    if isinstance(value, dict):
+        for item in value.values():
+            leaf_types(item, found)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            leaf_types(item, found)
+    else:
+        found.add(type(value))
+    return found
+
+class TestParseNormalize(unittest.TestCase):
+
+    ###############################################################
+    # Annotations
+    ###############################################################
+
+    def test_annotations_become_strings(self):
+        parsed_return_dict = parse_function(testmodule_annotations.function, normalize=True)
+
+        self.assertListEqual(["Record", "List[int]", "str", None],
+            [argument["type"] for argument in parsed_return_dict["arguments"]])
+        self.assertEqual("Optional[dict[str, int]]", parsed_return_dict["returns"])
+
+    def test_unions_and_imported_types(self):
+        parsed_return_dict = parse_class(testmodule_annotations.Record, normalize=True)
+
+        self.assertListEqual(["str", "int", "list[str] | None"],
+            [argument["type"] for argument in parsed_return_dict["arguments"]])
+        self.assertListEqual(["collections.OrderedDict | None"],
+            [argument["type"] for argument in parsed_return_dict["methods"]["copy"]["arguments"]])
+        self.assertEqual("Record", parsed_return_dict["methods"]["copy"]["returns"])
+
+    def test_class_annotations(self):
+        parsed_return_dict = parse_class(testmodule_annotations.Record, normalize=True)
+
+        self.assertDictEqual({"name": "str", "tags": "list[str] | None", "parent": "Optional[Record]"},
+            parsed_return_dict["annotations"])
+
+    def test_unresolved_annotations_keep_their_source(self):
+        parsed_return_dict = parse_function(testmodule_annotations.unresolved_function, normalize=True)
+
+        self.assertListEqual(["NotDefined", "int"], [argument["type"] for argument in parsed_return_dict["arguments"]])
+        self.assertEqual("int", parsed_return_dict["returns"])
+
+    def test_live_types_without_normalize(self):
+        def function(value: int | None = None) -> list[str]:
+            pass
+
+        parsed_return_dict = parse_function(function)
+
+        self.assertEqual(int | None, parsed_return_dict["arguments"][0]["type"])
+        self.assertEqual(list[str], parsed_return_dict["returns"])
+        self.assertEqual("int | None", parse_function(function, normalize=True)["arguments"][0]["type"])
+
+    def test_type_hints_resolved_once(self):
+        with mock.patch("typing.get_type_hints", wraps=typing.get_type_hints) as get_type_hints:
+            parse_module(testmodule_annotations, normalize=True)
+
+        resolved = [call.args[0] for call in get_type_hints.call_args_list]
+        self.assertEqual(len(resolved), len(set(resolved)))
+        self.assertIn(testmodule_annotations.Record.__init__, resolved)    # Shared with SubRecord
+
+    ###############################################################
+    # Defaults
+    ###############################################################
+
+    def test_default_values(self):
+        parsed_return_dict = parse_function(testmodule_annotations.function, normalize=True)
+        defaults = [argument["default"] for argument in parsed_return_dict["arguments"]]
+
+        self.assertIsNone(defaults[0])
+        self.assertEqual("[0, 1, 2, 3, 4, 5, ...]", defaults[1])
+        self.assertEqual("short", defaults[2])
+        self.assertEqual("<built-in function print>", defaults[3])
+        self.assertEqual(3, parse_class(testmodule_annotations.Record, normalize=True)["arguments"][1]["default"])
+
+    def test_long_default_values_are_bounded(self):
+        def function(text="x" * 10000, items={index: str(index) for index in range(10000)}):
+            pass
+
+        for argument in parse_function(function, normalize=True)["arguments"]:
+            self.assertIsInstance(argument["default"], str)
+            self.assertLessEqual(len(argument["default"]), 100)
+
+    def test_defaults_are_not_kept_alive(self):
+        class LargeDefault():
+            pass
+
+        default = LargeDefault()
+        default_ref = weakref.ref(default)
+
+        def function(value=default):
+            pass
+
+        parsed_return_dict = parse_function(function, normalize=True)
+        del function, default
+        gc.collect()
+
+        self.assertIsNone(default_ref())
+        self.assertIn("LargeDefault", parsed_return_dict["arguments"][0]["default"])
+
+    ###############################################################
+    # Plain Data
+    ###############################################################
+
+    def test_normalized_module_is_plain_data(self):
+        parsed_return_dict = parse_module(testmodule_annotations, normalize=True, inherited=True)
+
+        self.assertLessEqual(leaf_types(parsed_return_dict), {str, int, float, bool, type(None)})
+        self.assertEqual(parsed_return_dict, pickle.loads(pickle.dumps(parsed_return_dict)))
+
+    def test_module_without_normalize_holds_live_objects(self):
+        parsed_return_dict = parse_module(testmodule_annotations)
+
+        arguments = parsed_return_dict["functions"]["function"]["arguments"]
+        self.assertIs(testmodule_annotations.LARGE_DEFAULT, arguments[1]["default"])
+        self.assertIs(print, arguments[3]["default"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+from copy import copy, deepcopy
+import gc
+import json
+import pickle
+import unittest
+
+from tests.parser.input_files.blank_defaults import blank_parse_docstring_return, blank_parse_class_return
+from tests.parser.input_files import testmodule
+from src.parse_docstring_functions import DocstringBlock
+from src.parsed_results import ParsedArgument, ParsedClass, ParsedDocstring, ParsedFunction, ParsedModule, ParsedProperty
+from src.parser import parse_class, parse_docstring, parse_function, parse_module
+from src.parser import register_docstring_tag, unregister_docstring_tag
+
+def plain_dicts(value):
+    """The same parse result, made only of plain dicts, lists for tuples, and values `json` can write."""
+    if isinstance(value, dict):
+        return {key: plain_dicts(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain_dicts(item) for item in value]
+    return value
+
+class TestParseRecords(unittest.TestCase):
+
+    ###############################################################
+    # Record Types
+    ###############################################################
+
+    def test_parsers_return_records(self):
+        class TestClass():
+            def __init__(self, arg1):
+                pass
+
+            @property
+            def value(self):
+                """A value"""
+                return 1
+
+        parsed_class = parse_class(TestClass)
+        self.assertIsInstance(parsed_class, ParsedClass)
+        self.assertIsInstance(parsed_class["arguments"][0], ParsedArgument)
+        self.assertIsInstance(parsed_class["properties"]["value"], ParsedProperty)
+        self.assertIsInstance(parse_function(testmodule.test_func1), ParsedFunction)
+        self.assertIsInstance(parse_module(testmodule), ParsedModule)
+        self.assertIsInstance(parse_module(testmodule), dict)
+
+    def test_record_fields_read_as_attributes(self):
+        parsed_function = parse_function(testmodule.test_func1)
+
+        self.assertFalse(hasattr(parsed_function, "__dict__"))
+        self.assertEqual("test_func1", parsed_function.name)
+        self.assertEqual("test_func1", parsed_function["name"])
+        with self.assertRaises(AttributeError):
+            parsed_function.not_a_field
+        with self.assertRaises(AttributeError):
+            ParsedProperty(readable=True).docstring
+
+    def test_records_round_trip_through_json(self):
+        class TestClass():
+            """A class. @since 1.0"""
+            def __init__(self, arg1: int = 1):
+                pass
+
+            def method(self, key):
+                """@param key The key"""
+                pass
+
+            @property
+            def value(self):
+                return 1
+
+        for parsed in (parse_function(testmodule.test_func1, normalize=True), parse_class(TestClass, normalize=True)):
+            with self.subTest(parsed["name"]):
+                expected = plain_dicts(parsed)
+                self.assertEqual(expected, json.loads(json.dumps(parsed)))
+                self.assertEqual(json.dumps(expected), json.dumps(parsed))
+
+    ###############################################################
+    # Dictionary Compatibility
+    ###############################################################
+
+    def test_record_reads_like_a_dict(self):
+        record = ParsedFunction(arguments=None, docstring=None, lineno=(1, 2), name="func", returns=None, sourcefile="a.py")
+        expected = {"arguments": None, "docstring": None, "lineno": (1, 2), "name": "func", "returns": None, "sourcefile": "a.py"}
+
+        self.assertDictEqual(expected, record)
+        self.assertEqual(list(expected), list(record))
+        self.assertEqual(list(expected.items()), list(record.items()))
+        self.assertEqual(list(expected.values()), list(record.values()))
+        self.assertEqual(len(expected), len(record))
+        self.assertEqual(expected, dict(record))
+        self.assertEqual(expected, {**record})
+        self.assertEqual(repr(expected), repr(record))
+        self.assertIn("name", record)
+        self.assertNotIn("other", record)
+        self.assertEqual("func", record.get("name"))
+        self.assertEqual("default", record.get("other", "default"))
+        with self.assertRaises(KeyError):
+            record["other"]
+
+    def test_record_changes_like_a_dict(self):
+        record = ParsedProperty(docstring=None, readable=True, writable=False)
+
+        record["writable"] = True
+        record["extra"] = "value"
+        self.assertDictEqual({"docstring": None, "readable": True, "writable": True, "extra": "value"}, record)
+
+        del record["docstring"]
+        del record["extra"]
+        self.assertDictEqual({"readable": True, "writable": True}, record)
+        self.assertNotIn("docstring", record)
+        with self.assertRaises(KeyError):
+            del record["docstring"]
+
+        self.assertEqual(True, record.pop("readable"))
+        self.assertEqual("default", record.pop("readable", "default"))
+        self.assertEqual(False, record.setdefault("readable", False))
+        record.update({"docstring": "A docstring"})
+        self.assertDictEqual({"docstring": "A docstring", "readable": False, "writable": True}, record)
+
+        record.clear()
+        self.assertDictEqual({}, record)
+
+    def test_records_copy_and_pickle(self):
+        parsed_module = parse_module(testmodule)
+
+        for copied in (pickle.loads(pickle.dumps(parsed_module)), deepcopy(parsed_module), copy(parsed_module)):
+            self.assertIsInstance(copied, ParsedModule)
+            self.assertDictEqual(parsed_module, copied)
+
+        shallow = parsed_module.copy()
+        shallow["name"] = "changed"
+        self.assertNotEqual("changed", parsed_module["name"])
+
+    def test_fields_that_are_none_are_not_stored(self):
+        record = ParsedFunction(arguments=None, docstring=None, lineno=(1, 2), name="func", returns=None, sourcefile="a.py")
+        other = ParsedFunction(arguments=[], docstring=None, lineno=None, name="other", returns=None, sourcefile="b.py")
+
+        self.assertEqual(3, dict.__len__(record))
+        self.assertEqual(6, len(record))
+        self.assertIsNone(record["returns"])
+        self.assertIsNone(record.returns)
+        for copied in (pickle.loads(pickle.dumps(record)), deepcopy(record), copy(record)):
+            self.assertEqual(3, dict.__len__(copied))
+            self.assertDictEqual(record, copied)
+        self.assertIs(record._defaults, other._defaults)   # Records with the same fields share one template
+
+        empty = ParsedProperty(docstring=None, readable=None, writable=None)
+        self.assertEqual('{"docstring": null, "readable": null, "writable": null}', json.dumps(empty))
+
+    def test_nested_records_equal_plain_dicts(self):
+        class TestClass():
+            pass
+
+        expected = deepcopy(blank_parse_class_return)
+        expected["name"] = "TestClass"
+        parsed_class = parse_class(TestClass)
+        expected["lineno"] = parsed_class["lineno"]
+        expected["sourcefile"] = parsed_class["sourcefile"]
+
+        self.assertEqual({"a": [expected]}, {"a": [parsed_class]})
+        self.assertEqual({"a": [parsed_class]}, {"a": [expected]})
+
+    ###############################################################
+    # Sparse Docstrings
+    ###############################################################
+
+    def test_unused_tags_are_not_stored(self):
+        docstring = parse_docstring("A description\n@returns Something")
+
+        self.assertEqual(len(blank_parse_docstring_return), len(docstring))
+        self.assertLessEqual(dict.__len__(docstring), 2)
+        self.assertIsNone(docstring["author"])
+        self.assertFalse(docstring["deprecated"])
+
+    def test_deleting_an_unused_tag(self):
+        docstring = parse_docstring("A description")
+        del docstring["author"]
+
+        self.assertNotIn("author", docstring)
+        self.assertEqual(len(blank_parse_docstring_return) - 1, len(docstring))
+        self.assertIsNone(parse_docstring("A description")["author"])
+
+    def test_registering_a_tag_does_not_change_earlier_docstrings(self):
+        docstring = parse_docstring("A description")
+        try:
+            register_docstring_tag("@sparse", lambda blocks: None)
+            self.assertNotIn("sparse", docstring)
+            self.assertIn("sparse", parse_docstring("A description"))
+        finally:
+            unregister_docstring_tag("@sparse")
+
+    def test_registering_a_tag_does_not_change_pending_tags(self):
+        # `@sincev2` belongs to `@since` until a tag of its own gets registered
+        docstring = parse_docstring("A description\n@sincev2 1.0")
+        try:
+            register_docstring_tag("@sincev2", lambda blocks: "registered")
+            self.assertEqual("v2 1.0", docstring["since"])
+            self.assertIsNone(parse_docstring("A description\n@sincev2 1.0")["since"])
+        finally:
+            unregister_docstring_tag("@sincev2")
+
+    def test_pending_tags_do_not_keep_their_blocks(self):
+        docstring = parse_docstring("A description\n@param key The key\n    More about it\n@returns Something")
+        gc.collect()
+
+        self.assertFalse(any(isinstance(item, DocstringBlock) for item in gc.get_objects()))
+        self.assertEqual([{"key": "The key More about it"}], docstring["parameters"])
+        self.assertEqual("Something", docstring["returns"])
+
+    def test_empty_docstring_is_not_falsy(self):
+        self.assertTrue(parse_docstring(""))
+        self.assertFalse(ParsedDocstring())
+
+if __name__ == '__main__':
+    unittest.main()
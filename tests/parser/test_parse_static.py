@@ -0,0 +1,201 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+
+from tests.parser.input_files import testmodule, testmodule_with_all
+from src.parser import parse_class, parse_docstring, parse_module
+from src.parsed_results import ParsedClass, ParsedFunction, ParsedModule
+from src.static_parser import parse_module_file, parse_module_source
+
+STATIC_MODULE_PATH = os.path.join(os.path.dirname(__file__), "input_files", "testmodule_static.py")
+
+class TestParseStatic(unittest.TestCase):
+
+    ###############################################################
+    # Modules
+    ###############################################################
+
+    def test_module_is_never_run(self):
+        parsed_return_dict = parse_module_source(
+            "import not_an_installed_module\n\nraise RuntimeError('Ran the module')\n\ndef test_func():\n    pass\n",
+            os.path.join("folder", "never_run.py")
+        )
+
+        self.assertIsInstance(parsed_return_dict, ParsedModule)
+        self.assertEqual("never_run.py", parsed_return_dict["name"])
+        self.assertEqual(os.path.abspath(os.path.join("folder", "never_run.py")), parsed_return_dict["sourcefile"])
+        self.assertListEqual(["test_func"], list(parsed_return_dict["functions"]))
+        self.assertListEqual(["not_an_installed_module"], parsed_return_dict["imported"]["modules"])
+
+    def test_module_file(self):
+        parsed_return_dict = parse_module_file(STATIC_MODULE_PATH)
+
+        self.assertEqual("testmodule_static.py", parsed_return_dict["name"])
+        self.assertEqual(os.path.abspath(STATIC_MODULE_PATH), parsed_return_dict["sourcefile"])
+
+    def test_module_matches_importing(self):
+        """Without annotations, classes and functions come out the same as parsing the imported module."""
+        self.maxDiff = None
+
+        for module in (testmodule, testmodule_with_all):
+            parsed_return_dict = parse_module_file(module.__file__)
+            imported_return_dict = parse_module(module)
+
+            self.assertDictEqual(imported_return_dict["classes"], parsed_return_dict["classes"])
+            self.assertDictEqual(imported_return_dict["functions"], parsed_return_dict["functions"])
+            self.assertEqual(os.path.basename(module.__file__), parsed_return_dict["name"])
+
+    def test_module_lists_top_level_names(self):
+        parsed_return_dict = parse_module_file(STATIC_MODULE_PATH)
+
+        self.assertListEqual(["BaseClass", "ChildClass", "Color", "DataClass"], list(parsed_return_dict["classes"]))
+        self.assertListEqual(["_private_function", "async_function", "conditional_function", "decorator",
+            "function_with_everything"], list(parsed_return_dict["functions"]))
+        self.assertIsNone(parsed_return_dict["classes"]["Color"])  # Enums get left out, the same as parse_class
+
+    def test_module_imports(self):
+        parsed_return_dict = parse_module_file(STATIC_MODULE_PATH)
+
+        self.assertDictEqual({
+            "classes": [
+                ("enum", "Enum"),
+                ("tests.parser.input_files.testmodule", "TestClass1"),
+                ("tests.parser.input_files.testmodule", "TestClass1")
+            ],
+            "functions": [("dataclasses", "dataclass"), ("tests.parser.input_files.testmodule", "test_func1")],
+            "modules": ["path", "sys"]
+        }, parsed_return_dict["imported"])
+
+    def test_module_source_with_syntax_error(self):
+        with self.assertRaises(SyntaxError):
+            parse_module_source("def broken(:\n    pass\n", "broken.py")
+
+    ###############################################################
+    # Functions
+    ###############################################################
+
+    def test_function_signature(self):
+        self.maxDiff = None
+
+        parsed_function = parse_module_file(STATIC_MODULE_PATH)["functions"]["function_with_everything"]
+
+        self.assertIsInstance(parsed_function, ParsedFunction)
+        self.assertDictEqual({
+            "arguments": [
+                {"name": "positional", "type": None, "required": True, "default": None},
+                {"name": "regular", "type": "list[int]", "required": False, "default": [1, 2]},
+                {"name": "args", "type": "int", "required": True, "default": None},
+                {"name": "keyword_only", "type": "float", "required": False, "default": 2.5},
+                {"name": "computed", "type": None, "required": False, "default": "path.sep"},
+                {"name": "kwargs", "type": None, "required": True, "default": None}
+            ],
+            "docstring": parse_docstring("Uses every kind of argument."),
+            "lineno": (75, 78),
+            "name": "function_with_everything",
+            "returns": "dict",
+            "sourcefile": os.path.abspath(STATIC_MODULE_PATH)
+        }, parsed_function)
+
+    def test_function_private(self):
+        parsed_return_dict = parse_module_file(STATIC_MODULE_PATH)
+
+        self.assertTrue(parsed_return_dict["functions"]["_private_function"]["docstring"]["private"])
+        self.assertIsNone(parsed_return_dict["functions"]["async_function"]["docstring"])
+
+    ###############################################################
+    # Classes
+    ###############################################################
+
+    def test_class_members(self):
+        self.maxDiff = None
+
+        parsed_class = parse_module_file(STATIC_MODULE_PATH)["classes"]["ChildClass"]
+
+        self.assertIsInstance(parsed_class, ParsedClass)
+        self.assertEqual("BaseClass", parsed_class["parent"])
+        self.assertEqual((21, 65), parsed_class["lineno"])
+        self.assertDictEqual({"count": "int", "label": "str | None"}, parsed_class["annotations"])
+
+        # Inherited from the base class in the same file. Only positional arguments count, the same as parse_class.
+        self.assertListEqual([
+            {"name": "first", "type": "int", "required": True, "default": None},
+            {"name": "second", "type": "str", "required": False, "default": "two"}
+        ], parsed_class["arguments"])
+
+        self.assertDictEqual({
+            "value": {"docstring": parse_docstring("The value."), "readable": True, "writable": True},
+            "read_only": {"docstring": None, "readable": True, "writable": False},
+            "slot_value": {"docstring": None, "readable": False, "writable": False}
+        }, parsed_class["properties"])
+
+        # Class methods are not functions once read from the class, so parse_class leaves them out too
+        self.assertListEqual(["static_method", "decorated_method", "async_method", "_private_method"],
+            list(parsed_class["methods"]))
+        self.assertListEqual([{"name": "key", "type": "str", "required": False, "default": "key"}],
+            parsed_class["methods"]["decorated_method"]["arguments"])
+        self.assertEqual((49, 55), parsed_class["methods"]["decorated_method"]["lineno"])
+        self.assertIsNone(parsed_class["methods"]["async_method"]["arguments"])
+
+        self.assertListEqual([{"name": "nested_arg", "type": any, "required": True, "default": None}],
+            parsed_class["subclasses"]["NestedClass"]["arguments"])
+
+    def test_class_members_decorated_into_other_objects(self):
+        """Methods that decorators turn into something other than a function get left out, the same as importing."""
+        source = (
+            "import functools\n"
+            "from functools import cached_property, lru_cache\n\n"
+            "def decorator(function):\n    return function\n\n"
+            "class TestClass():\n"
+            "    def method(self):\n        pass\n\n"
+            "    @decorator\n    def decorated_method(self):\n        pass\n\n"
+            "    @cached_property\n    def cached(self):\n        return 1\n\n"
+            "    @functools.cached_property\n    def other_cached(self):\n        return 1\n\n"
+            "    @lru_cache(maxsize=8)\n    def remembered(self, key):\n        return key\n\n"
+            "    @functools.cache\n    def other_remembered(self, key):\n        return key\n\n"
+            "    @functools.singledispatchmethod\n    def dispatched(self, value):\n        return value\n"
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "decorated.py")
+            with open(path, "w") as source_file:
+                source_file.write(source)
+            spec = importlib.util.spec_from_file_location("decorated", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            parsed_class = parse_module_file(path)["classes"]["TestClass"]
+            imported_class = parse_class(module.TestClass)
+
+        self.assertListEqual(["method", "decorated_method"], list(parsed_class["methods"]))
+        self.assertListEqual(list(imported_class["methods"]), list(parsed_class["methods"]))
+        self.assertIsNone(parsed_class["properties"])
+
+    def test_dataclass_arguments(self):
+        parsed_class = parse_module_file(STATIC_MODULE_PATH)["classes"]["DataClass"]
+
+        self.assertListEqual([
+            {"name": "name", "type": "str", "required": True, "default": None},
+            {"name": "size", "type": "int", "required": False, "default": 3}
+        ], parsed_class["arguments"])
+
+    ###############################################################
+    # Options
+    ###############################################################
+
+    def test_skip_private(self):
+        parsed_return_dict = parse_module_file(STATIC_MODULE_PATH, skip_private=True)
+
+        self.assertIsNone(parsed_return_dict["functions"]["_private_function"]["lineno"])
+        self.assertIsNone(parsed_return_dict["classes"]["ChildClass"]["methods"]["_private_method"]["lineno"])
+        self.assertIsNotNone(parsed_return_dict["functions"]["async_function"]["lineno"])
+
+    def test_exports_only(self):
+        parsed_return_dict = parse_module_file(testmodule_with_all.__file__, exports_only=True)
+
+        self.assertListEqual(["ExportedClass"], list(parsed_return_dict["classes"]))
+        self.assertListEqual(["exported_func"], list(parsed_return_dict["functions"]))
+        self.assertDictEqual({"classes": None, "functions": [("copy", "deepcopy")], "modules": ["os"]},
+            parsed_return_dict["imported"])
+
+if __name__ == '__main__':
+    unittest.main()